@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from a_star import a_star
+from bucket_search import bucket_a_star
+from batch_paths import batch_paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Consultas em lote (uma árvore por alvo) x uma busca por consulta')
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--queries', type=int, default=10000)
+    parser.add_argument('--targets', type=int, nargs='+', default=[1, 10])
+    parser.add_argument('--sample', type=int, default=20, help='Consultas individuais medidas para estimar a vazão das buscas isoladas')
+    parser.add_argument('--wall-density', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    maze = generate_maze(args.size, args.wall_density, args.seed)
+    components = maze.connected_components()
+    label = components[maze.index(*maze.pos_S)]
+    reachable = [(linha, coluna) for linha in range(maze.rows) for coluna in range(maze.cols)
+                 if components[maze.index(linha, coluna)] == label]
+    print(f"Labirinto {maze.rows}x{maze.cols}, {len(reachable)} células no componente de S, {args.queries} consultas\n")
+    
+    print(f"{'alvos':>6} {'lote (s)':>9} {'consultas/s':>12} {'a_star/s':>9} {'baldes/s':>9} {'expansões':>10}")
+    print("-" * 62)
+    
+    for target_count in args.targets:
+        targets = rng.sample(reachable, target_count)
+        queries = [(rng.choice(reachable), rng.choice(targets)) for _ in range(args.queries)]
+        
+        stats = {}
+        start = time.perf_counter()
+        paths = batch_paths(maze, queries, stats)
+        batch_time = time.perf_counter() - start
+        assert all(path is not None for path in paths)
+        
+        sample = queries[:args.sample]
+        start = time.perf_counter()
+        for begin, goal in sample:
+            a_star(maze, begin, goal)
+        astar_rate = len(sample) / (time.perf_counter() - start)
+        
+        start = time.perf_counter()
+        for begin, goal in sample:
+            bucket_a_star(maze, begin, goal)
+        bucket_rate = len(sample) / (time.perf_counter() - start)
+        
+        print(f"{target_count:>6} {batch_time:>9.2f} {len(queries) / batch_time:>12.0f} "
+              f"{astar_rate:>9.1f} {bucket_rate:>9.1f} {stats['expansions']:>10}")
+
+
+if __name__ == "__main__":
+    main()
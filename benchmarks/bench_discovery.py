@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from genetic import run_genetic
+from explorer import run_frontier
+
+
+def bench_ga(maze, generations, seed):
+    random.seed(seed)
+    params = {
+        'VERBOSE': False,
+        'NUM_GERACOES': generations,
+        'TAMANHO_POPULACAO': 100,
+    }
+    start = time.perf_counter()
+    results = run_genetic(maze, params)
+    elapsed = time.perf_counter() - start
+    return results['success'], results['generation'], elapsed
+
+
+def bench_frontier(maze):
+    start = time.perf_counter()
+    results = run_frontier(maze, {'VERBOSE': False})
+    elapsed = time.perf_counter() - start
+    return results['success'], results['steps'], results['cells_observed'], elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Descoberta da saída: AG x exploração de fronteira')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 50, 100])
+    parser.add_argument('--frontier-sizes', type=int, nargs='+', default=[250, 500, 1000],
+                        help='Tamanhos extras medidos só com a exploração de fronteira')
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--generations', type=int, default=30)
+    parser.add_argument('--wall-density', type=float, default=0.3)
+    args = parser.parse_args()
+    
+    print(f"{'n':>6} {'motor':<10} {'sucesso':>8} {'geracoes/passos':>16} {'observadas':>11} {'tempo (s)':>10}")
+    print("-" * 66)
+    
+    for n in sorted(set(args.sizes) | set(args.frontier_sizes)):
+        mazes = [generate_maze(n, args.wall_density, seed) for seed in range(args.seeds)]
+        
+        if n in args.sizes:
+            runs = [bench_ga(maze, args.generations, seed) for seed, maze in enumerate(mazes)]
+            successes = [run for run in runs if run[0]]
+            avg_generations = sum(run[1] for run in successes) / len(successes) if successes else float('nan')
+            print(f"{n:>6} {'ga':<10} {len(successes):>5}/{len(runs):<2} {avg_generations:>16.1f} "
+                  f"{'-':>11} {sum(run[2] for run in runs) / len(runs):>10.3f}")
+        
+        runs = [bench_frontier(maze) for maze in mazes]
+        successes = [run for run in runs if run[0]]
+        print(f"{n:>6} {'frontier':<10} {len(successes):>5}/{len(runs):<2} "
+              f"{sum(run[1] for run in runs) / len(runs):>16.0f} {sum(run[2] for run in runs) / len(runs):>11.0f} "
+              f"{sum(run[3] for run in runs) / len(runs):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from genetic import GeneticAlgorithm, run_genetic
+
+
+def ga_params(encoding, length, **extra):
+    params = {'VERBOSE': False, 'CODIFICACAO': encoding}
+    if length:
+        params['TAMANHO_CROMOSSOMO'] = length
+    params.update(extra)
+    return params
+
+
+def evaluation_stats(maze, encoding, length, samples):
+    # Tempo médio por avaliação e fração dos genes que viraram movimento
+    ga = GeneticAlgorithm(maze, ga_params(encoding, length))
+    chromosomes = [ga.create_random_chromosome() for _ in range(samples)]
+    
+    start = time.perf_counter()
+    moves = 0
+    for chromosome in chromosomes:
+        _, _, path, _ = ga.evaluate_fitness(chromosome)
+        moves += len(path) - 1
+    elapsed = time.perf_counter() - start
+    
+    genes = samples * ga.params['TAMANHO_CROMOSSOMO']
+    return ga.params['TAMANHO_CROMOSSOMO'], elapsed / samples, moves / genes
+
+
+def discovery_stats(mazes, encoding, length, generations):
+    # Sucessos e gerações médias até a descoberta, com a mesma semente por labirinto
+    found = []
+    start = time.perf_counter()
+    for seed, maze in enumerate(mazes):
+        random.seed(seed)
+        results = run_genetic(maze, ga_params(encoding, length, NUM_GERACOES=generations))
+        if results['success']:
+            found.append(results['generation'])
+    elapsed = time.perf_counter() - start
+    return found, elapsed / len(mazes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Codificação absoluta (n²/2 genes) x relativa (genes sobre movimentos livres)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200])
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--samples', type=int, default=20, help='Cromossomos avaliados por medição de tempo')
+    parser.add_argument('--generations', type=int, default=30)
+    parser.add_argument('--wall-density', type=float, default=0.4)
+    parser.add_argument('--length', type=int, default=None,
+                        help='Mesmo comprimento de cromossomo para as duas codificações (padrão: o de cada uma)')
+    args = parser.parse_args()
+    
+    print(f"{'n':>6} {'codificacao':<12} {'genes':>8} {'ms/aval':>9} {'genes uteis':>12} {'sucesso':>8} {'geracoes':>9} {'s/execucao':>11}")
+    print("-" * 82)
+    
+    for n in args.sizes:
+        mazes = [generate_maze(n, args.wall_density, seed) for seed in range(args.seeds)]
+        
+        for encoding in ('absoluta', 'relativa'):
+            random.seed(0)
+            length, per_eval, useful = evaluation_stats(mazes[0], encoding, args.length, args.samples)
+            found, per_run = discovery_stats(mazes, encoding, args.length, args.generations)
+            average = sum(found) / len(found) if found else float('nan')
+            print(f"{n:>6} {encoding:<12} {length:>8} {per_eval * 1000:>9.2f} {useful:>11.0%} "
+                  f"{len(found):>5}/{len(mazes):<2} {average:>9.1f} {per_run:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from genetic import run_genetic
+
+
+def generations_to_discovery(maze, model, generations, chromosome, seed):
+    # Gerações até o AG pisar em S (None se não encontrou dentro do limite)
+    random.seed(seed)
+    params = {
+        'VERBOSE': False,
+        'NUM_GERACOES': generations,
+        'TAMANHO_POPULACAO': 100,
+        'MODELO_FITNESS': model,
+    }
+    if chromosome:
+        params['TAMANHO_CROMOSSOMO'] = chromosome
+    
+    start = time.perf_counter()
+    results = run_genetic(maze, params)
+    elapsed = time.perf_counter() - start
+    return (results['generation'] if results['success'] else None), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gerações até a descoberta: fitness por novidade x por distância (pos_S)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200, 500])
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--generations', type=int, default=50)
+    parser.add_argument('--wall-density', type=float, default=0.4)
+    parser.add_argument('--chromosome', type=int, default=None,
+                        help='Comprimento do cromossomo (padrão do AG: n*n/2, lento em 500x500)')
+    args = parser.parse_args()
+    
+    print(f"{'n':>6} {'modelo':<12} {'sucesso':>8} {'geracoes (media)':>17} {'tempo (s)':>10}")
+    print("-" * 58)
+    
+    for n in args.sizes:
+        mazes = [generate_maze(n, args.wall_density, seed) for seed in range(args.seeds)]
+        
+        for model in ('exploracao', 'distancia'):
+            runs = [generations_to_discovery(maze, model, args.generations, args.chromosome, seed)
+                    for seed, maze in enumerate(mazes)]
+            found = [generation for generation, _ in runs if generation is not None]
+            average = sum(found) / len(found) if found else float('nan')
+            print(f"{n:>6} {model:<12} {len(found):>5}/{len(runs):<2} {average:>17.1f} "
+                  f"{sum(elapsed for _, elapsed in runs) / len(runs):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
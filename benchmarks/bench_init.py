@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from genetic import run_genetic
+from initialization import INIT_STRATEGIES, initial_population
+
+
+def generations_to_discovery(maze, strategy, encoding, generations, chromosome, seed):
+    # Gerações até o AG pisar em S (None se não encontrou dentro do limite)
+    random.seed(seed)
+    params = {
+        'VERBOSE': False,
+        'NUM_GERACOES': generations,
+        'TAMANHO_POPULACAO': 100,
+        'INICIALIZACAO': strategy,
+        'CODIFICACAO': encoding,
+        'TAMANHO_CROMOSSOMO': chromosome,
+    }
+    
+    start = time.perf_counter()
+    results = run_genetic(maze, params)
+    elapsed = time.perf_counter() - start
+    return (results['generation'] if results['success'] else None), elapsed
+
+
+def init_time(maze, strategy, length):
+    # Tempo para gerar só a população inicial (100 indivíduos)
+    start = time.perf_counter()
+    initial_population(maze, strategy, 100, length)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Gerações até a descoberta de S por estratégia de inicialização')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200])
+    parser.add_argument('--seeds', type=int, default=5)
+    parser.add_argument('--generations', type=int, default=50)
+    parser.add_argument('--wall-density', type=float, default=0.3)
+    parser.add_argument('--chromosome-factor', type=int, default=10,
+                        help='Cromossomo de fator x n genes (o padrão do AG, n*n/2, acha S já na população inicial)')
+    parser.add_argument('--encoding', default='absoluta', choices=['absoluta', 'relativa'])
+    parser.add_argument('--strategies', nargs='+', default=list(INIT_STRATEGIES), choices=INIT_STRATEGIES)
+    args = parser.parse_args()
+    
+    print(f"{'n':>6} {'inicializacao':<14} {'sucesso':>8} {'geracoes (media)':>17} {'init (s)':>9} {'tempo (s)':>10}")
+    print("-" * 70)
+    
+    for n in args.sizes:
+        mazes = [generate_maze(n, args.wall_density, seed) for seed in range(args.seeds)]
+        chromosome = args.chromosome_factor * n
+        
+        for strategy in args.strategies:
+            runs = [generations_to_discovery(maze, strategy, args.encoding, args.generations, chromosome, seed)
+                    for seed, maze in enumerate(mazes)]
+            found = [generation for generation, _ in runs if generation is not None]
+            average = sum(found) / len(found) if found else float('nan')
+            setup = init_time(mazes[0], strategy, chromosome)
+            print(f"{n:>6} {strategy:<14} {len(found):>5}/{len(runs):<2} {average:>17.1f} {setup:>9.2f} "
+                  f"{sum(elapsed for _, elapsed in runs) / len(runs):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze, add_terrain_costs
+from a_star import a_star
+from bounded_search import bounded_a_star
+
+
+def measure(search):
+    # (resultado, segundos, pico de memória em bytes) de uma busca
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = search()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pico de memória do A* (dict/set/Node) x A* com planos achatados')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 500, 1000])
+    parser.add_argument('--wall-density', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--capped-sizes', type=int, nargs='*', default=[1000],
+                        help='Labirintos em que o limite (metade dos planos) força o A* de fronteira')
+    args = parser.parse_args()
+    
+    print(f"{'tamanho':>8} {'expansões':>10} {'a_star MB':>10} {'s':>7} {'limitado MB':>12} {'s':>7} {'8000² MB':>9}")
+    print("-" * 70)
+    
+    for n in args.sizes:
+        maze = generate_maze(n, args.wall_density, args.seed)
+        
+        path, astar_time, astar_peak = measure(lambda: a_star(maze, maze.pos_E, maze.pos_S))
+        stats = {}
+        bounded, bounded_time, bounded_peak = measure(lambda: bounded_a_star(maze, maze.pos_E, maze.pos_S, None, stats))
+        assert (path is None) == (bounded is None)
+        
+        # Os planos crescem com o labirinto, não com a busca: projeção linear para 8000x8000
+        projected = bounded_peak * (8002 * 8002) / maze.size
+        print(f"{n:>8} {stats['expansions']:>10} {astar_peak / 2 ** 20:>10.1f} {astar_time:>7.2f} "
+              f"{bounded_peak / 2 ** 20:>12.1f} {bounded_time:>7.2f} {projected / 2 ** 20:>9.0f}")
+    
+    if args.capped_sizes:
+        # Limite abaixo dos planos achatados: a busca cai no A* de fronteira (divisão e conquista)
+        print(f"\n{'tamanho':>8} {'terreno':>8} {'limite MB':>10} {'modo':>9} {'buscas':>7} {'expansões':>10} "
+              f"{'A* exp.':>9} {'pico MB':>8} {'s':>7} {'A* s':>6}")
+        print("-" * 92)
+    for n in args.capped_sizes:
+        for terrain in (False, True):
+            maze = generate_maze(n, args.wall_density, args.seed)
+            if terrain:
+                add_terrain_costs(maze, 9, args.seed)
+            reference = {}
+            _, reference_time, _ = measure(lambda: bounded_a_star(maze, maze.pos_E, maze.pos_S, None, reference))
+            limit = reference['peak_bytes'] // 2
+            stats = {}
+            _, elapsed, peak = measure(lambda: bounded_a_star(maze, maze.pos_E, maze.pos_S, limit, stats))
+            assert stats['cost'] == reference['cost']
+            print(f"{n:>8} {'sim' if terrain else 'não':>8} {limit / 2 ** 20:>10.2f} {stats['mode']:>9} "
+                  f"{stats.get('searches', 1):>7} {stats['expansions']:>10} {reference['expansions']:>9} "
+                  f"{peak / 2 ** 20:>8.2f} {elapsed:>7.2f} {reference_time:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
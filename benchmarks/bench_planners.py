@@ -0,0 +1,55 @@
+import os
+import sys
+import math
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from a_star import a_star
+from theta_star import theta_star, path_length
+from path_optimizer import path_cost, DIAGONAL_CODES
+
+
+def euclidean_length(path):
+    # Comprimento real de um caminho de 8 direções (diagonal = √2, não 1.4)
+    diagonals = sum(path.moves.count(code) for code in DIAGONAL_CODES)
+    return (len(path.moves) - diagonals) + diagonals * math.sqrt(2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='A* octile (8 direções) x Theta* (qualquer ângulo): comprimento e expansões')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200])
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--wall-density', type=float, default=0.3)
+    args = parser.parse_args()
+    
+    print(f"{'n':>5} {'seed':>4} {'A* custo':>9} {'A* euclid':>10} {'Theta*':>9} {'ganho':>7} "
+          f"{'exp A*':>8} {'exp Theta*':>10} {'ms A*':>8} {'ms Theta*':>10}")
+    print("-" * 92)
+    
+    for n in args.sizes:
+        for seed in range(args.seeds):
+            maze = generate_maze(n, args.wall_density, seed)
+            
+            astar_stats = {}
+            start = time.perf_counter()
+            path = a_star(maze, maze.pos_E, maze.pos_S, astar_stats)
+            astar_time = time.perf_counter() - start
+            
+            theta_stats = {}
+            start = time.perf_counter()
+            waypoints = theta_star(maze, maze.pos_E, maze.pos_S, theta_stats)
+            theta_time = time.perf_counter() - start
+            
+            astar_length = euclidean_length(path)
+            theta_length = path_length(waypoints)
+            print(f"{n:>5} {seed:>4} {path_cost(path):>9.1f} {astar_length:>10.1f} {theta_length:>9.1f} "
+                  f"{(astar_length - theta_length) / astar_length:>6.1%} "
+                  f"{astar_stats['expansions']:>8} {theta_stats['expansions']:>10} "
+                  f"{astar_time * 1000:>8.1f} {theta_time * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from genetic import GeneticAlgorithm
+from progress import JsonlSink, PrometheusSink
+
+
+def run(maze, args, mode, jsonl_path):
+    # Mesma semente em todos os modos: só o custo do relato de progresso muda
+    random.seed(args.seed)
+    params = {
+        'VERBOSE': mode == 'console',
+        'VERBOSE_INTERVAL': 1,
+        'VERBOSE_DETAIL': True,
+        'ANALISE_CONVERGENCIA': True,
+        'NUM_GERACOES': args.generations,
+        'TAMANHO_POPULACAO': args.population,
+        'TAMANHO_CROMOSSOMO': args.chromosome,
+    }
+    sinks = []
+    if mode == 'jsonl':
+        sinks.append(JsonlSink(jsonl_path))
+    elif mode == 'metricas':
+        sinks.append(PrometheusSink(0))
+    params['PROGRESSO'] = sinks
+    
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        results = GeneticAlgorithm(maze, params).run()
+        elapsed = time.perf_counter() - start
+    for sink in sinks:
+        sink.close()
+    # Na geração que encontra S o AG para antes da reprodução; conta como executada
+    generations = results['generation'] + 1 if results['success'] else results['generation']
+    return elapsed, generations
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Custo do relato de progresso do AG: console x JSONL x métricas x nenhum')
+    parser.add_argument('--size', type=int, default=100)
+    parser.add_argument('--wall-density', type=float, default=0.3)
+    parser.add_argument('--population', type=int, default=100)
+    parser.add_argument('--chromosome', type=int, default=50,
+                        help='Cromossomo curto: avaliação barata, então o custo do relato aparece')
+    parser.add_argument('--generations', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    maze = generate_maze(args.size, args.wall_density, args.seed)
+    jsonl_path = os.path.join(tempfile.mkdtemp(), 'progresso.jsonl')
+    
+    print(f"{'relato':<10} {'geracoes':>9} {'ms/geracao':>11} {'avaliacoes/s':>13} {'custo extra':>12}")
+    print("-" * 60)
+    
+    baseline = None
+    for mode in ('nenhum', 'jsonl', 'metricas', 'console'):
+        elapsed, generations = run(maze, args, mode, jsonl_path)
+        per_generation = elapsed / generations
+        if baseline is None:
+            baseline = per_generation
+        print(f"{mode:<10} {generations:>9} {per_generation * 1000:>11.3f} "
+              f"{generations * args.population / elapsed:>13.0f} {(per_generation / baseline - 1) * 100:>11.1f}%")
+    
+    print(f"\nJSONL: {os.path.getsize(jsonl_path)} bytes em {jsonl_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from a_star import a_star
+from d_star_lite import DStarLite
+
+
+def random_edits(maze, rng, count):
+    # Sorteia células (exceto E e S) para alternar entre parede e livre
+    edits = []
+    while len(edits) < count:
+        linha, coluna = rng.randrange(maze.rows), rng.randrange(maze.cols)
+        if maze.grid[linha][coluna] not in ('E', 'S'):
+            edits.append((linha, coluna))
+    return edits
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replanejamento D* Lite x A* completo após edições aleatórias de paredes')
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--edits', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--trials', type=int, default=3, help='Rodadas de edição por quantidade')
+    parser.add_argument('--wall-density', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    maze = generate_maze(args.size, args.wall_density, args.seed)
+    
+    start = time.perf_counter()
+    planner = DStarLite(maze, maze.pos_E, maze.pos_S)
+    planner.compute_shortest_path()
+    print(f"Labirinto {args.size}x{args.size}: planejamento inicial D* Lite em {time.perf_counter() - start:.2f}s "
+          f"({planner.stats['expansions']} expansões)\n")
+    
+    print(f"{'edições':>8} {'rodada':>6} {'D* Lite (ms)':>13} {'expansões':>10} {'A* (ms)':>9} {'expansões':>10} {'custos iguais':>14}")
+    print("-" * 78)
+    
+    for count in args.edits:
+        for trial in range(args.trials):
+            expansions_before = planner.stats['expansions']
+            start = time.perf_counter()
+            for linha, coluna in random_edits(maze, rng, count):
+                planner.toggle_cell(linha, coluna)
+            found = planner.compute_shortest_path()
+            replan_time = time.perf_counter() - start
+            
+            astar_stats = {}
+            start = time.perf_counter()
+            path = a_star(maze, maze.pos_E, maze.pos_S, astar_stats)
+            astar_time = time.perf_counter() - start
+            
+            if path is None:
+                same = not found
+            else:
+                astar_cost = sum(1.4 if direction & 1 else 1.0 for direction in path.moves)
+                same = found and abs(astar_cost - planner.cost()) < 1e-6
+            print(f"{count:>8} {trial:>6} {replan_time * 1000:>13.1f} {planner.stats['expansions'] - expansions_before:>10} "
+                  f"{astar_time * 1000:>9.1f} {astar_stats['expansions']:>10} {'sim' if same else 'NAO':>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from compact_path import CompactPath
+from output_writer import (open_report, write_generation_evolution,
+                           write_all_populations, write_phases_section)
+
+
+def build_generation_details(population_size, generations, chromosome_length):
+    # Gera dados sintéticos no formato de generation_details/phase_logs do AG.
+    # Todas as gerações compartilham a mesma lista de indivíduos para caber na memória.
+    population = []
+    for i in range(population_size):
+        moves = bytearray(random.randrange(8) for _ in range(random.randint(10, 40)))
+        path = CompactPath((0, 0), moves)
+        population.append({
+            'id': i,
+            'chromosome': [random.randint(0, 7) for _ in range(chromosome_length)],
+            'fitness': random.uniform(0.1, 500.0),
+            'position': path.end,
+            'path': path,
+            'path_length': len(path),
+            'unique_cells': len(path) // 2 + 1,
+        })
+    
+    details = []
+    phase_logs = []
+    for generation in range(generations):
+        details.append({
+            'generation': generation,
+            'population': population,
+            'best_fitness_generation': 500.0,
+            'best_fitness_global': 500.0,
+            'avg_fitness': 250.0,
+            'min_fitness': 0.1,
+            'max_fitness': 500.0,
+            'diversity': 0.8,
+            'valid_paths': population_size,
+            'total_population': population_size,
+            'best_position': (5, 5),
+            'path_length': 30,
+        })
+        phase_logs.append({
+            'generation': generation,
+            'phase': 'AVALIAÇÃO DE FITNESS',
+            'description': 'Cada cromossomo é avaliado (simulação no labirinto)',
+            'details': {'total_evaluations': population_size, 'best_fitness': 500.0,
+                        'avg_fitness': 250.0, 'worst_fitness': 0.1, 'valid_paths': population_size},
+        })
+    return details, phase_logs
+
+
+def write_report(f, details, phase_logs):
+    write_phases_section(f, phase_logs)
+    write_generation_evolution(f, details)
+    write_all_populations(f, details)
+
+
+def run(label, opener, path, details, phase_logs):
+    start = time.perf_counter()
+    f = opener(path)
+    write_report(f, details, phase_logs)
+    f.close()
+    elapsed = time.perf_counter() - start
+    
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    print(f"{label:<28} {size_mb:>10.1f} MB em disco {elapsed:>9.2f} s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vazão da escrita do relatório (MB/s)')
+    parser.add_argument('--population', type=int, default=10000)
+    parser.add_argument('--generations', type=int, default=1000)
+    parser.add_argument('--chromosome', type=int, default=50)
+    parser.add_argument('--no-gzip', action='store_true', help='Não medir a variante gzip')
+    args = parser.parse_args()
+    
+    random.seed(0)
+    details, phase_logs = build_generation_details(args.population, args.generations, args.chromosome)
+    print(f"Relatório sintético: {args.population} indivíduos x {args.generations} gerações\n")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        direct = os.path.join(tmp, 'direto.txt')
+        chunked = os.path.join(tmp, 'blocos.txt')
+        
+        # Referência: escritas diretas no arquivo com buffer padrão
+        direct_time = run('escrita direta', lambda p: open(p, 'w', encoding='utf-8'),
+                          direct, details, phase_logs)
+        chunked_time = run('em blocos (open_report)', open_report, chunked, details, phase_logs)
+        
+        text_mb = os.path.getsize(chunked) / (1024 * 1024)
+        print(f"\nVazão direta:    {text_mb / direct_time:8.1f} MB/s")
+        print(f"Vazão em blocos: {text_mb / chunked_time:8.1f} MB/s")
+        
+        if not args.no_gzip:
+            gz_time = run('em blocos + gzip', lambda p: open_report(p, compress=True),
+                          os.path.join(tmp, 'blocos.txt.gz'), details, phase_logs)
+            print(f"Vazão gzip:      {text_mb / gz_time:8.1f} MB/s (texto não compactado)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import os
+import sys
+import copy
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+from genetic import GeneticAlgorithm
+from reproduction import reproduce
+
+
+LABELS = {'salto_geometrico': 'salto', 'por_gene': 'gene'}
+
+
+def individual_generation(ga, population, fitnesses):
+    # O laço original de _evolve: torneio, crossover de um ponto e mutação por gene, par a par
+    new_population = [copy.deepcopy(population[0])]
+    while len(new_population) < len(population):
+        parent1 = ga.tournament_selection(population, fitnesses)
+        parent2 = ga.tournament_selection(population, fitnesses)
+        child1, child2 = ga.crossover(parent1, parent2)
+        child1_original = copy.deepcopy(child1)
+        child2_original = copy.deepcopy(child2)
+        child1 = ga.mutate(child1)
+        child2 = ga.mutate(child2)
+        sum(1 for i in range(len(child1)) if child1[i] != child1_original[i])
+        sum(1 for i in range(len(child2)) if child2[i] != child2_original[i])
+        new_population.append(child1)
+        if len(new_population) < len(population):
+            new_population.append(child2)
+    return new_population
+
+
+def batched_generation(params, population, fitnesses):
+    offspring, _ = reproduce(population, fitnesses, len(population) - 1, len(population[0]), params)
+    return [population[0]] + offspring
+
+
+def timed(function, repeats):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tempo para gerar uma nova geração: laço individual x operadores em lote')
+    parser.add_argument('--populations', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--lengths', type=int, nargs='+', default=[50, 1000, 10000])
+    parser.add_argument('--mutation-rate', type=float, default=0.01)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    
+    maze = generate_maze(10, 0.3, 0)
+    variants = [('um_ponto', 'salto_geometrico'), ('dois_pontos', 'salto_geometrico'),
+                ('uniforme', 'salto_geometrico'), ('uniforme', 'por_gene')]
+    
+    print(f"{'populacao':>9} {'genes':>6} {'individual (ms)':>16} "
+          + ' '.join(f"{crossover + '+' + LABELS[mutation]:>24}" for crossover, mutation in variants))
+    print("-" * (34 + 25 * len(variants)))
+    
+    for size in args.populations:
+        for length in args.lengths:
+            random.seed(0)
+            population = [[random.randint(0, 7) for _ in range(length)] for _ in range(size)]
+            fitnesses = [random.random() for _ in range(size)]
+            params = {'TAMANHO_CROMOSSOMO': length, 'TAXA_MUTACAO': args.mutation_rate, 'TAXA_CROSSOVER': 0.8,
+                      'TORNEIO_SIZE': 3, 'VERBOSE': False}
+            ga = GeneticAlgorithm(maze, params)
+            
+            individual = timed(lambda: individual_generation(ga, population, fitnesses), args.repeats)
+            cells = []
+            for crossover, mutation in variants:
+                variant_params = dict(params, CROSSOVER=crossover, MUTACAO=mutation)
+                batched = timed(lambda: batched_generation(variant_params, population, fitnesses), args.repeats)
+                cells.append(f"{batched * 1000:>14.2f} ms ({individual / batched:>4.0f}x)")
+            print(f"{size:>9} {length:>6} {individual * 1000:>16.2f} " + ' '.join(f"{cell:>24}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
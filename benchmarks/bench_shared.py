@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+import pickle
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze
+
+
+def touch(maze):
+    # Job mínimo: o custo medido é só o envio do labirinto ao processo (e o anexo)
+    return maze.cells[maze.index(*maze.pos_E)]
+
+
+def dispatch_time(maze, workers, jobs):
+    # Segundos por job para enviar o labirinto a um pool já aquecido
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(touch, [maze] * workers))
+        start = time.perf_counter()
+        list(executor.map(touch, [maze] * jobs))
+        return (time.perf_counter() - start) / jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Envio do Maze a um pool de processos: pickle dos planos x memória compartilhada')
+    parser.add_argument('--size', type=int, default=2000, help='Lado do labirinto (ex: 4000)')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--jobs', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    maze = generate_maze(args.size, 0.3, args.seed)
+    maze.neighbor_masks()
+    maze.exit_mask()
+    print(f"Labirinto {maze.rows}x{maze.cols}, {args.workers} processos, {args.jobs} jobs\n")
+    
+    start = time.perf_counter()
+    plain = pickle.dumps(maze)
+    plain_pickle = time.perf_counter() - start
+    plain_dispatch = dispatch_time(maze, args.workers, args.jobs)
+    
+    start = time.perf_counter()
+    handle = maze.share()
+    share_time = time.perf_counter() - start
+    shared = pickle.dumps(maze)
+    
+    from maze import Maze
+    start = time.perf_counter()
+    attached = Maze.attach(handle)
+    attach_time = time.perf_counter() - start
+    attached.release_shared()
+    shared_dispatch = dispatch_time(maze, args.workers, args.jobs)
+    
+    print(f"{'':<24} {'bytes':>12} {'ms/job':>9}")
+    print("-" * 48)
+    print(f"{'pickle dos planos':<24} {len(plain):>12} {plain_dispatch * 1000:>9.2f}   (pickle {plain_pickle * 1000:.1f} ms)")
+    print(f"{'memória compartilhada':<24} {len(shared):>12} {shared_dispatch * 1000:>9.2f}   "
+          f"(share {share_time * 1000:.1f} ms uma vez, attach {attach_time * 1000:.2f} ms)")
+    maze.release_shared()
+
+
+if __name__ == "__main__":
+    main()
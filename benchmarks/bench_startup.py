@@ -0,0 +1,61 @@
+import os
+import re
+import sys
+import statistics
+import subprocess
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOLVER = os.path.join(ROOT, 'solver.py')
+
+# Orçamento de importação do CLI (tempo cumulativo do módulo 'cli', mediana das execuções)
+IMPORT_BUDGET_US = 25000
+RUNS = 7
+
+# Módulos que não podem ser carregados em --help nem quando a validação falha
+HEAVY_MODULES = {'simulator', 'genetic', 'a_star', 'output_writer', 'output_formatter',
+                 'visualizer', 'datetime', 'hashlib'}
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)')
+
+
+def measure(args):
+    # Executa o CLI com -X importtime e retorna ({módulo: cumulativo_us}, tempo do 'cli')
+    proc = subprocess.run([sys.executable, '-X', 'importtime', SOLVER] + args,
+                          capture_output=True, text=True, cwd=ROOT)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            modules[match.group(4)] = int(match.group(2))
+    return modules, modules.get('cli', 0)
+
+
+def main():
+    failures = []
+    
+    for label, args in [('--help', ['--help']), ('validacao falha', ['arquivo_inexistente.txt'])]:
+        samples = []
+        loaded_heavy = set()
+        
+        for _ in range(RUNS):
+            modules, cli_time = measure(args)
+            samples.append(cli_time)
+            loaded_heavy |= HEAVY_MODULES & set(modules)
+        
+        median = statistics.median(samples)
+        print(f"{label:<18} import cli: mediana {median / 1000:.1f} ms "
+              f"(min {min(samples) / 1000:.1f} ms, orçamento {IMPORT_BUDGET_US / 1000:.1f} ms)")
+        
+        if loaded_heavy:
+            failures.append(f"{label}: módulos pesados importados: {', '.join(sorted(loaded_heavy))}")
+        if median > IMPORT_BUDGET_US:
+            failures.append(f"{label}: importação do CLI acima do orçamento ({median / 1000:.1f} ms)")
+    
+    for failure in failures:
+        print(f"FALHA: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+import heapq
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from maze_generator import generate_maze, add_terrain_costs
+from a_star import a_star
+from bucket_search import bucket_a_star, BASE_COSTS
+
+
+def heap_a_star_cost(maze, start_pos, goal_pos):
+    # Referência: o mesmo A* de custos inteiros, mas com heapq no lugar da fila de baldes
+    cells, costs, offsets, stride = maze.cells, maze.cost_plane(), maze.offsets, maze.stride
+    min_cost = maze.cost_range()[0]
+    goal_linha, goal_coluna = goal_pos[0] + 1, goal_pos[1] + 1
+    
+    def heuristic(index):
+        diff_linha = abs(index // stride - goal_linha)
+        diff_coluna = abs(index % stride - goal_coluna)
+        return (min(diff_linha, diff_coluna) * 14 + abs(diff_linha - diff_coluna) * 10) * min_cost
+    
+    start, goal = maze.index(*start_pos), maze.index(*goal_pos)
+    g = {start: 0}
+    closed = set()
+    heap = [(heuristic(start), start)]
+    while heap:
+        _, index = heapq.heappop(heap)
+        if index in closed:
+            continue
+        if index == goal:
+            return g[goal]
+        closed.add(index)
+        for direction in range(8):
+            neighbor = index + offsets[direction]
+            if not cells[neighbor] or neighbor in closed:
+                continue
+            tentative_g = g[index] + BASE_COSTS[direction] * costs[neighbor]
+            if tentative_g < g.get(neighbor, tentative_g + 1):
+                g[neighbor] = tentative_g
+                heapq.heappush(heap, (tentative_g + heuristic(neighbor), neighbor))
+    return None
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='A* com fila de baldes (custos inteiros) x A* float e x heapq, com e sem terreno')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[250, 500, 1000])
+    parser.add_argument('--max-cost', type=int, default=9)
+    parser.add_argument('--wall-density', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    print(f"{'n':>6} {'terreno':<9} {'a_star (s)':>11} {'heapq int (s)':>14} {'baldes (s)':>11} {'custo x10':>10} {'iguais':>7}")
+    print("-" * 74)
+    
+    for n in args.sizes:
+        maze = generate_maze(n, args.wall_density, args.seed)
+        
+        stats = {}
+        path, astar_time = timed(a_star, maze, maze.pos_E, maze.pos_S)
+        heap_cost, heap_time = timed(heap_a_star_cost, maze, maze.pos_E, maze.pos_S)
+        _, bucket_time = timed(bucket_a_star, maze, maze.pos_E, maze.pos_S, stats)
+        astar_cost = round(sum(1.4 if direction & 1 else 1.0 for direction in path.moves) * 10)
+        same = astar_cost == heap_cost == stats['cost']
+        print(f"{n:>6} {'uniforme':<9} {astar_time:>11.2f} {heap_time:>14.2f} {bucket_time:>11.2f} "
+              f"{stats['cost']:>10} {'sim' if same else 'NAO':>7}")
+        
+        # a_star ignora custos de terreno: só as buscas com custos inteiros são comparadas
+        add_terrain_costs(maze, args.max_cost, args.seed)
+        stats = {}
+        heap_cost, heap_time = timed(heap_a_star_cost, maze, maze.pos_E, maze.pos_S)
+        _, bucket_time = timed(bucket_a_star, maze, maze.pos_E, maze.pos_S, stats)
+        print(f"{n:>6} {f'1-{args.max_cost}':<9} {'-':>11} {heap_time:>14.2f} {bucket_time:>11.2f} "
+              f"{stats['cost']:>10} {'sim' if heap_cost == stats['cost'] else 'NAO':>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from job_server import main
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
+import heapq
 import math
+from compact_path import CompactPath
 
 class Node:
-    # Nó para o algoritmo A*
+    # Nó para o algoritmo A* (__slots__: sem __dict__ por nó)
+    __slots__ = ('position', 'parent', 'g', 'h', 'f')
+    
     def __init__(self, position, parent=None, g=0, h=0):
         self.position = position
         self.parent = parent
@@ -27,30 +31,39 @@ def heuristic_octile(pos1, pos2):
 
 
 def reconstruct_path(node):
-    # Reconstrói caminho do nó final até o início
+    # Reconstrói caminho do nó final até o início (retorna CompactPath)
     path = []
     current = node
     while current is not None:
         path.append(current.position)
         current = current.parent
-    return path[::-1]
+    return CompactPath.from_positions(reversed(path))
 
 
-def a_star(maze, start_pos, goal_pos):
-    # Implementa A* para encontrar caminho ótimo
+def a_star(maze, start_pos, goal_pos, stats=None):
+    # Implementa A* para encontrar caminho ótimo (stats: dict opcional que recebe 'expansions')
+    maze.require_free(start_pos, "Início")
+    maze.require_free(goal_pos, "Objetivo")
     start_node = Node(start_pos, None, 0, heuristic_octile(start_pos, goal_pos))
     
-    open_list = [start_node]
+    # Fila de prioridade (f, ordem de inserção, nó): o contador desempata f iguais pela ordem
+    # de inserção, a mesma da lista ordenada de forma estável; entradas superadas são
+    # descartadas ao sair da fila em vez de removidas da lista a cada melhoria
+    open_heap = [(start_node.f, 0, start_node)]
+    counter = 1
     closed_set = set()
     best_g = {start_pos: 0}
     
-    while open_list:
-        # Ordenar por f (custo total) e pegar o melhor
-        open_list.sort()
-        current_node = open_list.pop(0)
+    while open_heap:
+        # Pegar o melhor f
+        _, _, current_node = heapq.heappop(open_heap)
+        if current_node.position in closed_set or current_node.g > best_g[current_node.position]:
+            continue
         
         # Verificar se chegamos ao objetivo
         if current_node.position == goal_pos:
+            if stats is not None:
+                stats['expansions'] = len(closed_set)
             return reconstruct_path(current_node)
         
         # Adicionar à lista fechada
@@ -77,11 +90,11 @@ def a_star(maze, start_pos, goal_pos):
                 h = heuristic_octile(neighbor_pos, goal_pos)
                 neighbor_node = Node(neighbor_pos, current_node, tentative_g, h)
                 
-                # Remover versão antiga se existir
-                open_list = [node for node in open_list if node.position != neighbor_pos]
-                
-                # Adicionar novo nó
-                open_list.append(neighbor_node)
+                # Adicionar novo nó (a versão antiga, se existir, fica obsoleta na fila)
+                heapq.heappush(open_heap, (neighbor_node.f, counter, neighbor_node))
+                counter += 1
     
     # Nenhum caminho encontrado
+    if stats is not None:
+        stats['expansions'] = len(closed_set)
     return None
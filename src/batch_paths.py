@@ -0,0 +1,134 @@
+from array import array
+from compact_path import CompactPath
+from bucket_search import BASE_COSTS, cost_typecode
+
+
+class PathTree:
+    # Árvore de caminhos mínimos de todas as células até um alvo: um Dijkstra reverso
+    # (fila de baldes, custos inteiros 10/14 x terreno) a partir do alvo. Cada célula fechada
+    # guarda a distância e a direção do próximo passo rumo ao alvo, então o caminho de
+    # qualquer início sai da árvore em O(comprimento) sem nova busca.
+    # A busca é incremental: settle() só avança até fechar os inícios pedidos.
+    # Alvo e inícios fora do labirinto ou em parede levantam ValueError (Maze.require_free).
+    
+    def __init__(self, maze, target):
+        maze.require_free(target, "Alvo")
+        self.maze = maze
+        self.target = target
+        size = maze.size
+        
+        self._cells = maze.cells
+        self._costs = maze.cost_plane()
+        self._offsets = maze.offsets
+        max_cost = maze.cost_range()[1]
+        self._dist = array(cost_typecode(14 * max_cost * size), [-1]) * size
+        self._toward = bytearray(size)    # direção do próximo passo rumo ao alvo
+        self._settled = bytearray(size)
+        
+        self._ring = 14 * max_cost + 1
+        self._buckets = [[] for _ in range(self._ring)]
+        self._current = 0
+        self._pending = 0
+        self.expansions = 0
+        
+        index = maze.index(*target)
+        self._dist[index] = 0
+        self._buckets[0].append(index)
+        self._pending = 1
+    
+    def settle(self, starts=None):
+        # Avança a busca até fechar todos os inícios (ou a área alcançável inteira, se starts=None)
+        settled = self._settled
+        remaining = None
+        if starts is not None:
+            for start in starts:
+                self.maze.require_free(start, "Início")
+            remaining = {self.maze.index(*start) for start in starts}
+            remaining = {index for index in remaining if not settled[index]}
+            if not remaining:
+                return
+        
+        cells, costs, offsets = self._cells, self._costs, self._offsets
+        dist, toward = self._dist, self._toward
+        buckets, ring = self._buckets, self._ring
+        distance = self._current
+        
+        while self._pending:
+            bucket = buckets[distance % ring]
+            while bucket:
+                index = bucket.pop()
+                self._pending -= 1
+                if settled[index] or dist[index] != distance:
+                    continue
+                
+                settled[index] = 1
+                self.expansions += 1
+                
+                # Entrar em index custa base x custo de terreno de index, para qualquer vizinho
+                entry_cost = costs[index]
+                for direction in range(8):
+                    neighbor = index + offsets[direction]
+                    if not cells[neighbor] or settled[neighbor]:
+                        continue
+                    candidate = distance + BASE_COSTS[direction] * entry_cost
+                    if dist[neighbor] < 0 or candidate < dist[neighbor]:
+                        dist[neighbor] = candidate
+                        toward[neighbor] = (direction + 4) % 8
+                        buckets[candidate % ring].append(neighbor)
+                        self._pending += 1
+                
+                if remaining is not None:
+                    remaining.discard(index)
+                    if not remaining:
+                        self._current = distance
+                        return
+            distance += 1
+        
+        self._current = distance
+    
+    def cost(self, start):
+        # Custo do caminho mínimo de start até o alvo (escala do a_star) ou None se inalcançável
+        self.settle([start])
+        index = self.maze.index(*start)
+        return self._dist[index] / 10 if self._settled[index] else None
+    
+    def path(self, start):
+        # Caminho mínimo (CompactPath) de start até o alvo ou None se inalcançável
+        if self.cost(start) is None:
+            return None
+        
+        offsets, toward = self._offsets, self._toward
+        index = self.maze.index(*start)
+        goal = self.maze.index(*self.target)
+        moves = bytearray()
+        while index != goal:
+            direction = toward[index]
+            moves.append(direction)
+            index += offsets[direction]
+        return CompactPath(start, moves, self.target)
+
+
+def batch_paths(maze, queries, stats=None):
+    # Responde várias consultas (início, alvo) agrupando-as por alvo: uma PathTree por alvo
+    # atende todos os inícios do grupo. Retorna a lista de caminhos (ou None, se inalcançável) na ordem
+    # das consultas; stats recebe 'trees' e 'expansions'. Extremidades inválidas levantam ValueError
+    # antes de qualquer busca.
+    groups = {}
+    for position, (start, goal) in enumerate(queries):
+        maze.require_free(start, "Início")
+        maze.require_free(goal, "Alvo")
+        groups.setdefault(tuple(goal), []).append(position)
+    
+    results = [None] * len(queries)
+    expansions = 0
+    for goal, positions in groups.items():
+        tree = PathTree(maze, goal)
+        tree.settle([tuple(queries[position][0]) for position in positions])
+        for position in positions:
+            results[position] = tree.path(tuple(queries[position][0]))
+        expansions += tree.expansions
+    
+    if stats is not None:
+        stats['trees'] = len(groups)
+        stats['expansions'] = expansions
+    return results
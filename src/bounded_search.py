@@ -0,0 +1,245 @@
+import heapq
+from array import array
+from compact_path import CompactPath
+from bucket_search import BASE_COSTS, cost_typecode
+
+
+# Bytes estimados por entrada da fila de prioridade (int de 32 bytes + ponteiro na lista)
+HEAP_ENTRY_BYTES = 40
+# Bytes estimados por entrada da fronteira do A* de fronteira (dict índice -> tupla de 4 inteiros)
+FRONTIER_ENTRY_BYTES = 200
+
+# Flags do plano de estado (1 byte por célula): bits 0-2 = direção de chegada
+SEEN = 0x08
+CLOSED = 0x10
+
+
+def bounded_a_star(maze, start_pos, goal_pos, memory_limit=None, stats=None):
+    # A* para labirintos enormes: nada de Node, dict ou set de tuplas. Por célula do plano com
+    # borda ficam só g (array de inteiros, 4 bytes quando o maior custo possível cabe) e 1 byte
+    # com a direção de chegada e as flags visto/fechado; a fila guarda inteiros f * size + índice.
+    # Custos inteiros 10/14 x terreno (os mesmos de bucket_search), então o caminho é ótimo.
+    # memory_limit (bytes): se os planos não cabem, ou se a fila crescer até estourar o limite,
+    # a busca recomeça com o A* de fronteira (frontier_a_star), que guarda só a lista aberta.
+    # stats recebe 'mode' ('a_star' | 'frontier'), 'expansions', 'cost' (x10) e 'peak_bytes'.
+    maze.require_free(start_pos, "Início")
+    maze.require_free(goal_pos, "Objetivo")
+    if stats is None:
+        stats = {}
+    start = maze.index(*start_pos)
+    goal = maze.index(*goal_pos)
+    size = maze.size
+    min_cost, max_cost = maze.cost_range()
+    
+    # 4 bytes por célula quando o maior g possível (todas as células com o maior passo) cabe
+    typecode = cost_typecode(14 * max_cost * size)
+    plane_bytes = size * (array(typecode).itemsize + 1)
+    if memory_limit is not None and plane_bytes > memory_limit:
+        return frontier_a_star(maze, start_pos, goal_pos, stats, memory_limit)
+    
+    cells = maze.cells
+    costs = maze.costs
+    offsets = maze.offsets
+    heuristic = _octile(maze.stride, goal, min_cost)
+    # Entradas da fila que cabem no que sobra do limite
+    max_entries = None if memory_limit is None else (memory_limit - plane_bytes) // HEAP_ENTRY_BYTES
+    
+    g = array(typecode, [0]) * size
+    state = bytearray(size)
+    
+    open_heap = [heuristic(start) * size + start]
+    state[start] = SEEN
+    peak = 1
+    expansions = 0
+    
+    while open_heap:
+        index = heapq.heappop(open_heap) % size
+        flags = state[index]
+        # Heurística consistente: uma entrada superada sai depois da melhor, com a célula já fechada
+        if flags & CLOSED:
+            continue
+        
+        if index == goal:
+            stats.update(mode='a_star', expansions=expansions, cost=g[goal],
+                         peak_bytes=plane_bytes + peak * HEAP_ENTRY_BYTES)
+            return _reconstruct(maze, start, goal, state, offsets)
+        
+        state[index] = flags | CLOSED
+        expansions += 1
+        current_g = g[index]
+        
+        for direction in range(8):
+            neighbor = index + offsets[direction]
+            if not cells[neighbor]:
+                continue
+            neighbor_flags = state[neighbor]
+            if neighbor_flags & CLOSED:
+                continue
+            tentative_g = current_g + BASE_COSTS[direction] * (costs[neighbor] if costs is not None else 1)
+            if not neighbor_flags & SEEN or tentative_g < g[neighbor]:
+                g[neighbor] = tentative_g
+                state[neighbor] = SEEN | direction
+                heapq.heappush(open_heap, (tentative_g + heuristic(neighbor)) * size + neighbor)
+        
+        if len(open_heap) > peak:
+            peak = len(open_heap)
+            if max_entries is not None and peak > max_entries:
+                # Sem memória para a fila: libera os planos antes de recomeçar só com a fronteira
+                del g, state, open_heap
+                return frontier_a_star(maze, start_pos, goal_pos, stats, memory_limit)
+    
+    stats.update(mode='a_star', expansions=expansions, cost=None,
+                 peak_bytes=plane_bytes + peak * HEAP_ENTRY_BYTES)
+    return None
+
+
+def frontier_a_star(maze, start_pos, goal_pos, stats=None, memory_limit=None):
+    # A* de fronteira com divisão e conquista (Korf): só a lista aberta fica em memória. Fechados
+    # não são guardados; cada nó aberto marca as direções que levam a vizinhos já expandidos,
+    # então eles nunca são gerados de novo (heurística consistente). Sem ponteiros de pai, cada
+    # busca devolve o custo e a aresta de revezamento em que o caminho ótimo cruza metade do custo;
+    # o caminho sai de resolver recursivamente as duas metades, cada uma com custo conhecido.
+    # memory_limit (bytes) limita a fronteira + fila de cada busca; se não couber, MemoryError.
+    # stats recebe 'mode' ('frontier'), 'expansions', 'searches', 'cost' (x10) e 'peak_bytes'.
+    maze.require_free(start_pos, "Início")
+    maze.require_free(goal_pos, "Objetivo")
+    if stats is None:
+        stats = {}
+    start = maze.index(*start_pos)
+    goal = maze.index(*goal_pos)
+    # Menor custo de terreno (peso da heurística), calculado uma vez para todas as buscas
+    counters = {'expansions': 0, 'searches': 0, 'peak': 0, 'min_cost': maze.cost_range()[0]}
+    moves = bytearray()
+    
+    cost = None
+    if start == goal or _frontier_solve(maze, start, goal, None, moves, counters, memory_limit):
+        cost = sum(BASE_COSTS[direction] * (maze.costs[index] if maze.costs is not None else 1)
+                   for direction, index in _walk(maze, start, moves))
+    stats.update(mode='frontier', expansions=counters['expansions'], searches=counters['searches'],
+                 cost=cost, peak_bytes=counters['peak'])
+    if cost is None:
+        return None
+    return CompactPath(maze.position(start), moves, maze.position(goal))
+
+
+def _frontier_solve(maze, start, goal, cost, moves, counters, memory_limit):
+    # Acrescenta a moves o caminho ótimo de start a goal; False se goal é inalcançável.
+    # Na raiz o custo é desconhecido e o limiar do revezamento vem da heurística; nas metades,
+    # o custo exato é conhecido e o limiar é a metade dele (divisão equilibrada).
+    if start == goal:
+        return True
+    if cost is None:
+        threshold = max(1, _octile(maze.stride, goal, counters['min_cost'])(start) // 2)
+    else:
+        threshold = max(1, cost // 2)
+    found = _frontier_search(maze, start, goal, threshold, counters, memory_limit)
+    if found is None:
+        return False
+    
+    # Aresta de revezamento (relay_from -> relay_to): g(relay_from) < limiar <= g(relay_to),
+    # então as duas metades têm custo estritamente menor e a recursão termina
+    total, relay_from, direction, relay_g = found
+    relay_to = relay_from + maze.offsets[direction]
+    step_cost = BASE_COSTS[direction] * (maze.costs[relay_to] if maze.costs is not None else 1)
+    _frontier_solve(maze, start, relay_from, relay_g, moves, counters, memory_limit)
+    moves.append(direction)
+    _frontier_solve(maze, relay_to, goal, total - relay_g - step_cost, moves, counters, memory_limit)
+    return True
+
+
+def _frontier_search(maze, start, goal, threshold, counters, memory_limit):
+    # Uma busca de fronteira: devolve (custo, origem da aresta de revezamento, direção, g da origem)
+    # ou None. Entradas da fronteira: índice -> (g, direções usadas, revezamento, g do revezamento),
+    # com o revezamento codificado como origem * 8 + direção (-1 antes de cruzar o limiar)
+    cells = maze.cells
+    costs = maze.costs
+    offsets = maze.offsets
+    size = maze.size
+    heuristic = _octile(maze.stride, goal, counters['min_cost'])
+    counters['searches'] += 1
+    
+    frontier = {start: (0, 0, -1, 0)}
+    open_heap = [heuristic(start) * size + start]
+    expansions = 0
+    
+    while open_heap:
+        index = heapq.heappop(open_heap) % size
+        entry = frontier.get(index)
+        if entry is None:
+            # Entrada superada: o nó já foi expandido com g menor
+            continue
+        g, used, relay, relay_g = entry
+        
+        if index == goal:
+            counters['expansions'] += expansions
+            relay_from, direction = divmod(relay, 8)
+            return g, relay_from, direction, relay_g
+        
+        del frontier[index]
+        expansions += 1
+        
+        for direction in range(8):
+            if used >> direction & 1:
+                continue
+            neighbor = index + offsets[direction]
+            if not cells[neighbor]:
+                continue
+            neighbor_g = g + BASE_COSTS[direction] * (costs[neighbor] if costs is not None else 1)
+            back = 1 << ((direction + 4) & 7)
+            other = frontier.get(neighbor)
+            if other is not None and neighbor_g >= other[0]:
+                frontier[neighbor] = (other[0], other[1] | back, other[2], other[3])
+                continue
+            if g < threshold <= neighbor_g:
+                new_relay, new_relay_g = index * 8 + direction, g
+            else:
+                new_relay, new_relay_g = relay, relay_g
+            frontier[neighbor] = (neighbor_g, back if other is None else other[1] | back, new_relay, new_relay_g)
+            heapq.heappush(open_heap, (neighbor_g + heuristic(neighbor)) * size + neighbor)
+        
+        if len(open_heap) > 2 * len(frontier) + 64:
+            # Muitas entradas superadas na fila: reconstrói só com a fronteira atual
+            open_heap = [(entry[0] + heuristic(node)) * size + node for node, entry in frontier.items()]
+            heapq.heapify(open_heap)
+        
+        used_bytes = len(frontier) * FRONTIER_ENTRY_BYTES + len(open_heap) * HEAP_ENTRY_BYTES
+        if used_bytes > counters['peak']:
+            counters['peak'] = used_bytes
+            if memory_limit is not None and used_bytes > memory_limit:
+                raise MemoryError(f"Fronteira da busca passou do limite de memória ({memory_limit} bytes)")
+    
+    counters['expansions'] += expansions
+    return None
+
+
+def _walk(maze, start, moves):
+    # (direção, índice de chegada) de cada passo de moves a partir de start
+    index = start
+    for direction in moves:
+        index += maze.offsets[direction]
+        yield direction, index
+
+
+def _octile(stride, goal, weight):
+    # Octile 10/14 vezes o menor custo de terreno (a mesma heurística de bucket_a_star)
+    goal_linha, goal_coluna = divmod(goal, stride)
+    
+    def heuristic(index):
+        diff_linha = abs(index // stride - goal_linha)
+        diff_coluna = abs(index % stride - goal_coluna)
+        if diff_linha > diff_coluna:
+            return (diff_coluna * 14 + (diff_linha - diff_coluna) * 10) * weight
+        return (diff_linha * 14 + (diff_coluna - diff_linha) * 10) * weight
+    
+    return heuristic
+
+
+def _reconstruct(maze, start, goal, state, offsets):
+    moves = bytearray()
+    index = goal
+    while index != start:
+        direction = state[index] & 0x07
+        moves.append(direction)
+        index -= offsets[direction]
+    moves.reverse()
+    return CompactPath(maze.position(start), moves, maze.position(goal))
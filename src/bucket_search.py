@@ -0,0 +1,111 @@
+from array import array
+from compact_path import CompactPath
+
+
+# Custo base inteiro por direção (Maze.DIRECTIONS): 10 ortogonal, 14 diagonal (≈ 1.0 / 1.4 x 10).
+# Entrar em uma célula custa base x custo de terreno da célula (1-255), então g e f são inteiros.
+BASE_COSTS = (10, 14, 10, 14, 10, 14, 10, 14)
+
+
+def cost_typecode(largest):
+    # Tipo do array de custos: 'i' (4 bytes, com sinal) se o maior valor cabe em 31 bits, senão 'q'.
+    # Nunca 'l', que tem 8 bytes no Linux mas só 4 no Windows e estouraria em labirintos grandes.
+    return 'i' if largest < 2 ** 31 else 'q'
+
+
+def bucket_a_star(maze, start_pos, goal_pos, stats=None, use_heuristic=True):
+    # A* (ou Dijkstra, com use_heuristic=False) com fila de baldes circular (algoritmo de Dial).
+    # Com custos inteiros limitados, f cresce no máximo 2 x 14 x custo_máximo por expansão,
+    # então basta um anel com esse número de baldes e nenhuma comparação de prioridade.
+    # Retorna CompactPath ou None; stats recebe 'expansions' e 'cost' (inteiro, escala x10).
+    maze.require_free(start_pos, "Início")
+    maze.require_free(goal_pos, "Objetivo")
+    cells = maze.cells
+    costs = maze.cost_plane()
+    offsets = maze.offsets
+    stride = maze.stride
+    size = maze.size
+    min_cost, max_cost = maze.cost_range()
+    
+    # Octile 10/14 vezes o menor custo de terreno: admissível e consistente
+    goal_linha, goal_coluna = goal_pos[0] + 1, goal_pos[1] + 1
+    weight = min_cost if use_heuristic else 0
+    
+    def heuristic(index):
+        diff_linha = abs(index // stride - goal_linha)
+        diff_coluna = abs(index % stride - goal_coluna)
+        if diff_linha > diff_coluna:
+            return (diff_coluna * 14 + (diff_linha - diff_coluna) * 10) * weight
+        return (diff_linha * 14 + (diff_coluna - diff_linha) * 10) * weight
+    
+    start = maze.index(*start_pos)
+    goal = maze.index(*goal_pos)
+    
+    # Maior g possível: todas as células com o maior passo; f = g + h e h nunca passa disso
+    typecode = cost_typecode(2 * 14 * max_cost * size)
+    g = array(typecode, [-1]) * size
+    f_values = array(typecode, [-1]) * size
+    came_from = bytearray(size)   # direção usada para chegar em cada célula
+    closed = bytearray(size)
+    
+    ring = 2 * 14 * max_cost + 1
+    buckets = [[] for _ in range(ring)]
+    
+    g[start] = 0
+    f = f_values[start] = heuristic(start)
+    buckets[f % ring].append(start)
+    pending = 1
+    expansions = 0
+    
+    while pending:
+        bucket = buckets[f % ring]
+        while bucket:
+            index = bucket.pop()
+            pending -= 1
+            # Entradas superadas (f menor encontrado depois) ou já fechadas são descartadas
+            if closed[index] or f_values[index] != f:
+                continue
+            
+            if index == goal:
+                if stats is not None:
+                    stats['expansions'] = expansions
+                    stats['cost'] = g[goal]
+                return _reconstruct(maze, start, goal, came_from, offsets)
+            
+            closed[index] = 1
+            expansions += 1
+            current_g = g[index]
+            
+            for direction in range(8):
+                neighbor = index + offsets[direction]
+                if not cells[neighbor] or closed[neighbor]:
+                    continue
+                tentative_g = current_g + BASE_COSTS[direction] * costs[neighbor]
+                if g[neighbor] < 0 or tentative_g < g[neighbor]:
+                    g[neighbor] = tentative_g
+                    came_from[neighbor] = direction
+                    neighbor_f = f_values[neighbor] = tentative_g + heuristic(neighbor)
+                    buckets[neighbor_f % ring].append(neighbor)
+                    pending += 1
+        f += 1
+    
+    if stats is not None:
+        stats['expansions'] = expansions
+        stats['cost'] = None
+    return None
+
+
+def bucket_dijkstra(maze, start_pos, goal_pos, stats=None):
+    # Dijkstra com a mesma fila de baldes (sem heurística)
+    return bucket_a_star(maze, start_pos, goal_pos, stats, use_heuristic=False)
+
+
+def _reconstruct(maze, start, goal, came_from, offsets):
+    moves = bytearray()
+    index = goal
+    while index != start:
+        direction = came_from[index]
+        moves.append(direction)
+        index -= offsets[direction]
+    moves.reverse()
+    return CompactPath(maze.position(start), moves, maze.position(goal))
@@ -1,6 +1,5 @@
 import sys
 import argparse
-from simulator import run_simulation
 
 
 def create_parser():
@@ -14,6 +13,7 @@ Exemplos de uso:
   python solver.py data/caso_teste_01.txt slow --population 10
   python solver.py data/caso_teste_01.txt slow --elitism --population -1
   python solver.py data/caso_teste_01.txt ultra --pause 5 --delay 0.5
+  python solver.py data/caso_teste_01.txt --no-progress --progress-jsonl progresso.jsonl --metrics-port 9100
 
 Modos disponíveis:
   fast  - Rápido, mostra progresso a cada 10 gerações (padrão)
@@ -27,6 +27,8 @@ Modos disponíveis:
                        choices=['fast', 'slow', 'ultra'],
                        help='Modo de execução (padrão: fast)')
     
+    parser.add_argument('--discovery', default='ga', choices=['ga', 'frontier'],
+                       help='Motor de descoberta da saída: ga (Algoritmo Genético) ou frontier (exploração de fronteira)')
     parser.add_argument('--pause', type=int, default=0, metavar='N',
                        help='Pausar a cada N gerações esperando Enter')
     parser.add_argument('--delay', type=float, default=0, metavar='S',
@@ -37,6 +39,45 @@ Modos disponíveis:
                        help='Mostrar status de elitismo no CLI')
     parser.add_argument('--population', type=int, default=0, metavar='N',
                        help='Mostrar top N indivíduos por geração (use -1 para todos)')
+    parser.add_argument('--gzip', action='store_true',
+                       help='Gravar o relatório em outputs/ compactado (.txt.gz)')
+    parser.add_argument('--run-log', action='store_true',
+                       help='Gravar também o log binário da execução (.rlog) para análise')
+    parser.add_argument('--image', action='store_true',
+                       help='Exportar imagem PNG do labirinto com os caminhos (1 pixel por célula)')
+    parser.add_argument('--heatmap', action='store_true',
+                       help='Acumular o mapa de calor das visitas do AG (console, relatório e imagem)')
+    parser.add_argument('--planner', default='astar', choices=['astar', 'theta', 'bucket', 'bounded'],
+                       help='Busca da fase 2: astar (8 direções, custos 1.0/1.4), theta (Theta*, qualquer ângulo), '
+                            'bucket (custos inteiros com fila de baldes; usado sempre que o labirinto tem custos de terreno) '
+                            'ou bounded (A* com planos achatados e A* de fronteira sob --memory-limit, para labirintos enormes)')
+    parser.add_argument('--memory-limit', type=float, default=None, metavar='MB',
+                       help='Limite de memória da busca da fase 2 em MB (implica --planner bounded); '
+                            'se nem a fronteira da busca couber, a simulação falha com "limite de memória insuficiente"')
+    parser.add_argument('--astar-tolerance', type=float, default=None, metavar='T',
+                       help='Dispensar o A* se o caminho descoberto, encurtado, custar no máximo (1+T) vezes o limite inferior octile (ex: 0.05)')
+    parser.add_argument('--checkpoint', default=None, metavar='PATH',
+                       help='Gravar checkpoints do AG (população, históricos, melhor global e gerador aleatório) em PATH')
+    parser.add_argument('--checkpoint-every', type=int, default=10, metavar='N',
+                       help='Gerações entre checkpoints (padrão: 10); também é gravado ao interromper e ao final')
+    parser.add_argument('--resume', action='store_true',
+                       help='Continuar a execução a partir de --checkpoint (começa do zero se o arquivo ainda não existe)')
+    parser.add_argument('--crossover', default='um_ponto', choices=['um_ponto', 'dois_pontos', 'uniforme'],
+                       help='Crossover do AG: um_ponto (padrão), dois_pontos ou uniforme (máscara aleatória por gene)')
+    parser.add_argument('--mutation', default='por_gene', choices=['por_gene', 'salto_geometrico'],
+                       help='Mutação do AG: por_gene (um sorteio por gene) ou salto_geometrico (um sorteio por mutação); '
+                            'qualquer escolha diferente do padrão gera a nova geração em lote')
+    parser.add_argument('--progress-jsonl', default=None, metavar='PATH',
+                       help='Gravar o progresso do AG em PATH, um objeto JSON por geração (com avaliações/s e gerações/s)')
+    parser.add_argument('--metrics-port', type=int, default=None, metavar='PORT',
+                       help='Expor as métricas do AG em http://127.0.0.1:PORT/metrics (formato texto do Prometheus; 0 = porta livre)')
+    parser.add_argument('--no-progress', action='store_true',
+                       help='Não imprimir o progresso do AG no console (útil com --progress-jsonl/--metrics-port)')
+    parser.add_argument('--encoding', default='absoluta', choices=['absoluta', 'relativa'],
+                       help='Codificação dos genes do AG: absoluta (direção 0-7) ou relativa (índice entre os movimentos livres)')
+    parser.add_argument('--init', default='aleatoria', choices=['aleatoria', 'legal', 'parede', 'fronteira'],
+                       help='População inicial do AG: genes aleatórios ou caminhadas a partir de E (legal: só vizinhos livres, '
+                            'parede: seguidor de parede, fronteira: prefere células não visitadas)')
     
     return parser
 
@@ -56,6 +97,43 @@ def validate_args(args):
         print("ERRO: --delay deve ser >= 0")
         return False
     
+    if args.astar_tolerance is not None and args.astar_tolerance < 0:
+        print("ERRO: --astar-tolerance deve ser >= 0")
+        return False
+    
+    if args.checkpoint_every < 1:
+        print("ERRO: --checkpoint-every deve ser >= 1")
+        return False
+    
+    if args.resume and args.checkpoint is None:
+        print("ERRO: --resume requer --checkpoint")
+        return False
+    
+    if args.run_log and args.discovery != 'ga':
+        print("ERRO: --run-log só vale para a descoberta pelo AG (o log guarda as gerações)")
+        return False
+    
+    if args.checkpoint is not None and args.discovery != 'ga':
+        print("ERRO: --checkpoint só vale para a descoberta pelo AG")
+        return False
+    
+    if (args.progress_jsonl is not None or args.metrics_port is not None or args.no_progress) and args.discovery != 'ga':
+        print("ERRO: --progress-jsonl, --metrics-port e --no-progress só valem para a descoberta pelo AG")
+        return False
+    
+    if args.metrics_port is not None and not 0 <= args.metrics_port <= 65535:
+        print("ERRO: --metrics-port deve estar entre 0 e 65535")
+        return False
+    
+    if args.memory_limit is not None:
+        if args.memory_limit <= 0:
+            print("ERRO: --memory-limit deve ser > 0")
+            return False
+        if args.planner not in ('astar', 'bounded'):
+            print("ERRO: --memory-limit só vale para --planner bounded")
+            return False
+        args.planner = 'bounded'
+    
     return True
 
 
@@ -66,6 +144,9 @@ def main():
     if not validate_args(args):
         sys.exit(1)
     
+    # Importado só aqui: --help e erros de validação não carregam AG, A* e relatórios
+    from simulator import run_simulation
+    
     try:
         results = run_simulation(
             maze_file=args.maze_file,
@@ -74,7 +155,25 @@ def main():
             delay=args.delay,
             analyze=args.analyze,
             show_elitism=args.elitism,
-            show_population=args.population
+            show_population=args.population,
+            compress_output=args.gzip,
+            run_log=args.run_log,
+            image=args.image,
+            heatmap=args.heatmap,
+            discovery=args.discovery,
+            encoding=args.encoding,
+            init=args.init,
+            crossover=args.crossover,
+            mutation=args.mutation,
+            astar_tolerance=args.astar_tolerance,
+            planner=args.planner,
+            memory_limit=args.memory_limit,
+            checkpoint=args.checkpoint,
+            checkpoint_every=args.checkpoint_every,
+            resume=args.resume,
+            progress_jsonl=args.progress_jsonl,
+            metrics_port=args.metrics_port,
+            console_progress=not args.no_progress
         )
         
         if results is None:
@@ -85,6 +184,8 @@ def main():
         
     except KeyboardInterrupt:
         print("\n\nSimulação interrompida pelo usuário.")
+        if args.checkpoint is not None:
+            print(f"Para continuar: repita o comando com --checkpoint {args.checkpoint} --resume")
         sys.exit(130)
     except Exception as e:
         print(f"\nERRO durante a execução: {str(e)}")
@@ -0,0 +1,71 @@
+from maze import Maze
+
+
+# Tabela inversa (delta_linha, delta_coluna) -> código da direção
+_DIRECTION_CODES = {delta: i for i, delta in enumerate(Maze.DIRECTIONS)}
+
+
+class CompactPath:
+    # Caminho compacto: célula inicial + códigos de direção (0-7) em um bytearray.
+    # Cada passo ocupa 1 byte em vez de uma tupla (linha, coluna) de ~64 bytes;
+    # as posições só são decodificadas quando o caminho é percorrido/formatado.
+    __slots__ = ('start', 'moves', 'end')
+
+    def __init__(self, start, moves=None, end=None):
+        self.start = start
+        self.moves = moves if isinstance(moves, bytearray) else bytearray(moves or b'')
+        self.end = end if end is not None else self._decode_end()
+
+    @classmethod
+    def from_positions(cls, positions):
+        # Codifica uma lista de posições adjacentes (8-conectadas)
+        positions = list(positions)
+        if not positions:
+            raise ValueError("Caminho vazio não pode ser codificado")
+
+        moves = bytearray()
+        linha, coluna = positions[0]
+        for nova_linha, nova_coluna in positions[1:]:
+            code = _DIRECTION_CODES.get((nova_linha - linha, nova_coluna - coluna))
+            if code is None:
+                raise ValueError(f"Posições não adjacentes: {(linha, coluna)} -> {(nova_linha, nova_coluna)}")
+            moves.append(code)
+            linha, coluna = nova_linha, nova_coluna
+
+        return cls(positions[0], moves, (linha, coluna))
+
+    def _decode_end(self):
+        linha, coluna = self.start
+        for direction in self.moves:
+            delta_linha, delta_coluna = Maze.DIRECTIONS[direction]
+            linha += delta_linha
+            coluna += delta_coluna
+        return (linha, coluna)
+
+    def __len__(self):
+        # Número de posições (inclui a célula inicial), como len() da lista de tuplas
+        return len(self.moves) + 1
+
+    def __iter__(self):
+        # Decodifica as posições sob demanda
+        linha, coluna = self.start
+        yield (linha, coluna)
+        for direction in self.moves:
+            delta_linha, delta_coluna = Maze.DIRECTIONS[direction]
+            linha += delta_linha
+            coluna += delta_coluna
+            yield (linha, coluna)
+
+    def __eq__(self, other):
+        if isinstance(other, CompactPath):
+            return self.start == other.start and self.moves == other.moves
+        return NotImplemented
+
+    def __repr__(self):
+        return f"CompactPath(start={self.start}, steps={len(self.moves)}, end={self.end})"
+
+    def copy(self):
+        return CompactPath(self.start, bytearray(self.moves), self.end)
+
+    def to_list(self):
+        return list(self)
@@ -0,0 +1,159 @@
+import heapq
+from array import array
+from compact_path import CompactPath
+
+
+INF = float('inf')
+
+
+class DStarLite:
+    # D* Lite sobre o Maze: busca reversa (de S até E) que mantém g/rhs entre replanejamentos.
+    # Após editar paredes com set_cell/toggle_cell, só os vértices afetados são reprocessados.
+    # Custos e heurística iguais aos do a_star (1.0 ortogonal, 1.4 diagonal, octile), guardados
+    # internamente como inteiros 10/14: com floats, somas arredondadas diferentes empatam ou não
+    # com a chave do início e deixam vértices inconsistentes fora do caminho calculado.
+    
+    def __init__(self, maze, start_pos, goal_pos):
+        maze.require_free(start_pos, "Início")
+        maze.require_free(goal_pos, "Objetivo")
+        self.maze = maze
+        self._stride = maze.stride
+        self._start = maze.index(*start_pos)
+        self._goal = maze.index(*goal_pos)
+        self._masks = maze.neighbor_masks()
+        self._offsets = maze.offsets
+        self._costs = [10 if delta_linha == 0 or delta_coluna == 0 else 14 for delta_linha, delta_coluna in maze.DIRECTIONS]
+        
+        self._g = array('d', [INF]) * maze.size
+        self._rhs = array('d', [INF]) * maze.size
+        self._rhs[self._goal] = 0
+        self._km = 0
+        self._last_start = self._start
+        
+        # Fila com remoção preguiçosa: _open_keys guarda a chave válida de cada índice na fila
+        self._open = []
+        self._open_keys = {}
+        self._push(self._goal)
+        
+        self.stats = {'expansions': 0, 'replans': 0}
+    
+    def _heuristic(self, index):
+        # Octile entre index e a posição atual do agente (início)
+        stride = self._stride
+        diff_linha = abs(index // stride - self._start // stride)
+        diff_coluna = abs(index % stride - self._start % stride)
+        return (max(diff_linha, diff_coluna) - min(diff_linha, diff_coluna)) * 10 + min(diff_linha, diff_coluna) * 14
+    
+    def _key(self, index):
+        best = min(self._g[index], self._rhs[index])
+        return (best + self._heuristic(index) + self._km, best)
+    
+    def _push(self, index):
+        key = self._key(index)
+        self._open_keys[index] = key
+        heapq.heappush(self._open, (key, index))
+    
+    def _update_vertex(self, index):
+        if index != self._goal:
+            best = INF
+            mask = self._masks[index]
+            if mask:
+                g = self._g
+                for i, offset in enumerate(self._offsets):
+                    if mask >> i & 1:
+                        candidate = self._costs[i] + g[index + offset]
+                        if candidate < best:
+                            best = candidate
+            self._rhs[index] = best
+        
+        if self._g[index] != self._rhs[index]:
+            self._push(index)
+        else:
+            self._open_keys.pop(index, None)
+    
+    def _update_neighbors(self, index):
+        mask = self._masks[index]
+        for i, offset in enumerate(self._offsets):
+            if mask >> i & 1:
+                self._update_vertex(index + offset)
+    
+    def compute_shortest_path(self):
+        # Processa a fila até o início ficar consistente; retorna True se há caminho
+        g, rhs = self._g, self._rhs
+        start = self._start
+        open_heap, open_keys = self._open, self._open_keys
+        
+        while open_heap:
+            key, index = open_heap[0]
+            if open_keys.get(index) != key:
+                heapq.heappop(open_heap)
+                continue
+            if key >= self._key(start) and rhs[start] == g[start]:
+                break
+            
+            heapq.heappop(open_heap)
+            del open_keys[index]
+            self.stats['expansions'] += 1
+            
+            new_key = self._key(index)
+            if key < new_key:
+                self._push(index)
+            elif g[index] > rhs[index]:
+                g[index] = rhs[index]
+                self._update_neighbors(index)
+            else:
+                g[index] = INF
+                self._update_vertex(index)
+                self._update_neighbors(index)
+        
+        self.stats['replans'] += 1
+        return g[start] < INF
+    
+    def set_cell(self, linha, coluna, value):
+        # Edita a célula no labirinto e marca ela e as vizinhas para reprocessamento
+        self.maze.set_cell(linha, coluna, value)
+        index = self.maze.index(linha, coluna)
+        cells = self.maze.cells
+        self._update_vertex(index)
+        for offset in self._offsets:
+            if cells[index + offset]:
+                self._update_vertex(index + offset)
+    
+    def toggle_cell(self, linha, coluna):
+        value = '0' if self.maze.get_cell(linha, coluna) == '1' else '1'
+        self.set_cell(linha, coluna, value)
+        return value
+    
+    def move_start(self, position):
+        # Agente avançou: o deslocamento da heurística é acumulado em km (sem reordenar a fila)
+        self.maze.require_free(position, "Início")
+        self._start = self.maze.index(*position)
+        self._km += self._heuristic(self._last_start)
+        self._last_start = self._start
+    
+    def cost(self):
+        # Custo do caminho atual do início até a saída, na escala do a_star (inf se não houver)
+        return self._g[self._start] / 10
+    
+    def path(self):
+        # Caminho atual (CompactPath) descendo pelo menor custo + g a partir do início
+        g = self._g
+        if g[self._start] == INF:
+            return None
+        
+        index = self._start
+        moves = bytearray()
+        while index != self._goal:
+            mask = self._masks[index]
+            best, best_direction = INF, None
+            for i, offset in enumerate(self._offsets):
+                if mask >> i & 1:
+                    candidate = self._costs[i] + g[index + offset]
+                    if candidate < best:
+                        best, best_direction = candidate, i
+            if best_direction is None or len(moves) > len(g):
+                return None
+            moves.append(best_direction)
+            index += self._offsets[best_direction]
+        
+        return CompactPath(self.maze.position(self._start), moves, self.maze.position(index))
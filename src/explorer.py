@@ -0,0 +1,141 @@
+from compact_path import CompactPath
+
+
+class FrontierExplorer:
+    # Agente de descoberta da saída por exploração da fronteira mais próxima.
+    # O agente não conhece pos_S: ao entrar em uma célula ele vê se ela é a saída
+    # e observa quais das 8 vizinhas são paredes. A fronteira são as células livres já
+    # observadas e ainda não visitadas; o agente sempre anda até a mais próxima delas.
+    # Com uma vizinha nova, ela é a mais próxima (um passo); sem nenhuma, uma busca em
+    # largura sobre as células já visitadas acha a fronteira mais próxima e o caminho até ela.
+    # A busca para na primeira fronteira alcançada, então só percorre a vizinhança explorada
+    # que a separa do agente, em vez de refazer o caminho de volta pela pilha de um DFS.
+    
+    def __init__(self, maze, params=None):
+        self.maze = maze
+        self.params = {'VERBOSE': True}
+        if params:
+            self.params.update(params)
+    
+    def run(self):
+        maze = self.maze
+        cells = maze.cells
+        masks = maze.neighbor_masks()
+        offsets = maze.offsets
+        
+        # Índices do plano com borda; a borda já nasce "observada" para não ser contada
+        visited = bytearray(maze.size)
+        observed = bytearray(b'\x01') * maze.size
+        for linha in range(maze.rows):
+            base = maze.index(linha, 0)
+            observed[base:base + maze.cols] = bytes(maze.cols)
+        cells_observed = 0
+        
+        # Direção pela qual cada célula foi visitada pela primeira vez: as direções de
+        # S até E, invertidas, formam o caminho de descoberta (sem os passos de volta)
+        entered = bytearray(maze.size)
+        start = maze.index(*maze.pos_E)
+        visited[start] = 1
+        current = start
+        steps = 0
+        cells_visited = 1
+        found = None
+        
+        if self.params['VERBOSE']:
+            print(f"Explorando a partir de E = {maze.pos_E} (saida desconhecida)...")
+        
+        while True:
+            # Célula nova: observar conteúdo e vizinhança
+            if not observed[current]:
+                observed[current] = 1
+                cells_observed += 1
+            for offset in offsets:
+                if not observed[current + offset]:
+                    observed[current + offset] = 1
+                    cells_observed += 1
+            
+            if cells[current] == maze.EXIT:
+                found = maze.position(current)
+                break
+            
+            mask = masks[current]
+            direction = 0
+            while direction < 8 and not (mask >> direction & 1 and not visited[current + offsets[direction]]):
+                direction += 1
+            
+            if direction < 8:
+                # Vizinha livre ainda não visitada: a fronteira mais próxima, a um passo
+                following = current + offsets[direction]
+                steps += 1
+            else:
+                # Busca em largura pelas células visitadas até a fronteira mais próxima
+                following, walk = _nearest_frontier(current, visited, masks, offsets)
+                if following is None:
+                    break
+                direction = walk[-1]
+                steps += len(walk)
+            
+            visited[following] = 1
+            entered[following] = direction
+            cells_visited += 1
+            current = following
+        
+        moves = bytearray()
+        if found is not None:
+            index = current
+            while index != start:
+                direction = entered[index]
+                moves.append(direction)
+                index -= offsets[direction]
+            moves.reverse()
+        
+        success = found is not None
+        path = CompactPath(maze.pos_E, moves) if success else None
+        
+        if self.params['VERBOSE']:
+            if success:
+                print(f"\nSAIDA ENCONTRADA em {found} apos {steps} passos "
+                      f"({cells_visited} celulas visitadas, {cells_observed} observadas)")
+            else:
+                print(f"ERRO: exploracao esgotou a area alcancavel ({cells_visited} celulas) sem encontrar a saida.")
+        
+        return {
+            'engine': 'frontier',
+            'success': success,
+            's_position': found,
+            'path': path,
+            'steps': steps,
+            'cells_visited': cells_visited,
+            'cells_observed': cells_observed,
+        }
+
+
+def _nearest_frontier(origin, visited, masks, offsets):
+    # (fronteira, direções do caminho até ela) da célula não visitada mais próxima de origin,
+    # andando só por células visitadas; (None, None) se a área alcançável já foi esgotada
+    came_from = {origin: None}
+    queue = [origin]
+    for index in queue:
+        mask = masks[index]
+        for direction in range(8):
+            if not mask >> direction & 1:
+                continue
+            neighbor = index + offsets[direction]
+            if neighbor in came_from:
+                continue
+            came_from[neighbor] = (index, direction)
+            if not visited[neighbor]:
+                frontier = neighbor
+                walk = bytearray()
+                while neighbor != origin:
+                    neighbor, step = came_from[neighbor]
+                    walk.append(step)
+                walk.reverse()
+                return frontier, walk
+            queue.append(neighbor)
+    return None, None
+
+
+def run_frontier(maze, params=None):
+    # Função de conveniência para executar o explorador
+    return FrontierExplorer(maze, params).run()
@@ -0,0 +1,98 @@
+import os
+import pickle
+import hashlib
+
+
+# Formato do checkpoint (dict serializado com pickle): versão, identidade do labirinto, parâmetros
+# que afetam a evolução, geração em que a execução continua, população empacotada (1 byte por gene),
+# históricos (populações completas em colunas, ver pack_details), melhor global e estado do gerador
+# aleatório do módulo random.
+CHECKPOINT_VERSION = 1
+
+# Parâmetros que precisam ser iguais para a retomada reproduzir a execução original
+# (NUM_GERACOES pode mudar: retomar com mais gerações estende a execução)
+EVOLUTION_PARAMS = ('TAMANHO_POPULACAO', 'TAMANHO_CROMOSSOMO', 'TAXA_MUTACAO', 'TAXA_CROSSOVER',
+                    'TORNEIO_SIZE', 'MODELO_FITNESS', 'CODIFICACAO', 'TRACK_HEATMAP', 'CROSSOVER', 'MUTACAO')
+
+
+def maze_fingerprint(maze):
+    # Identidade do labirinto: dimensões + hash do plano de células e dos custos
+    digest = hashlib.sha256(maze.cells)
+    if maze.costs is not None:
+        digest.update(maze.costs)
+    return (maze.rows, maze.cols, digest.hexdigest())
+
+
+def pack_population(population):
+    # Cromossomos de mesmo comprimento concatenados em um único bytes (genes 0-255)
+    return b''.join(bytes(chromosome) for chromosome in population)
+
+
+def unpack_population(packed, length):
+    return [list(packed[start:start + length]) for start in range(0, len(packed), length)]
+
+
+def pack_details(details):
+    # generation_details com as populações completas (TRACK_FULL_POPULATION) em colunas: um bytes
+    # com todos os cromossomos e uma lista por campo, em vez de um dict por indivíduo
+    packed = []
+    for detail in details:
+        population = detail.get('population')
+        if population:
+            detail = dict(detail, population={
+                'length': len(population[0]['chromosome']),
+                'chromosomes': pack_population(individual['chromosome'] for individual in population),
+                'fitness': [individual['fitness'] for individual in population],
+                'positions': [individual['position'] for individual in population],
+                'paths': [individual['path'] for individual in population],
+                'unique_cells': [individual['unique_cells'] for individual in population],
+            })
+        packed.append(detail)
+    return packed
+
+
+def unpack_details(packed):
+    # Inverso de pack_details
+    details = []
+    for detail in packed:
+        columns = detail.get('population')
+        if isinstance(columns, dict):
+            chromosomes = unpack_population(columns['chromosomes'], columns['length'])
+            detail = dict(detail, population=[
+                {'id': i, 'chromosome': chromosome, 'fitness': fitness, 'position': position,
+                 'path': path, 'path_length': len(path), 'unique_cells': unique_cells}
+                for i, (chromosome, fitness, position, path, unique_cells) in enumerate(zip(
+                    chromosomes, columns['fitness'], columns['positions'], columns['paths'], columns['unique_cells']))
+            ])
+        details.append(detail)
+    return details
+
+
+def save_checkpoint(path, state):
+    # Gravação atômica: arquivo temporário no mesmo diretório + fsync + os.replace, então uma
+    # interrupção no meio da escrita deixa o checkpoint anterior intacto
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path, maze, params):
+    # Lê e valida um checkpoint gravado por save_checkpoint (pickle: só carregue arquivos próprios)
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    
+    if not isinstance(state, dict) or state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"'{path}' não é um checkpoint do AG (versão {CHECKPOINT_VERSION})")
+    if state['maze'] != maze_fingerprint(maze):
+        raise ValueError(f"Checkpoint '{path}' foi gravado para outro labirinto")
+    
+    saved = state['params']
+    different = [name for name in EVOLUTION_PARAMS if saved.get(name) != params.get(name)]
+    if different:
+        raise ValueError(f"Checkpoint '{path}' usa outros valores para: {', '.join(different)}")
+    return state
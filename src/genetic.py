@@ -1,6 +1,33 @@
+import os
 import random
 import copy
 import time
+from array import array
+from compact_path import CompactPath
+from initialization import INIT_DESCRIPTIONS, initial_population
+from progress import ConsoleSink
+from reproduction import CROSSOVER_DESCRIPTIONS, CROSSOVER_NAMES, MUTATION_DESCRIPTIONS, reproduce
+
+
+# Direções livres (em ordem) para cada máscara de vizinhança de 8 bits: usado pela
+# codificação relativa, em que o gene escolhe entre os movimentos legais da célula
+LEGAL_DIRECTIONS = tuple(tuple(i for i in range(8) if mask >> i & 1) for mask in range(256))
+
+# Na codificação relativa o gene g (0-7) escolhe legal[g * n >> 3] entre as n direções livres:
+# 0-7 vira n faixas contíguas de 1 ou 2 genes. Com 8 valores nenhuma regra é exata quando n não
+# divide 8, mas g % n dava os genes excedentes sempre aos primeiros índices (N, NE, ...), e a
+# caminhada derivava para essas direções; as faixas espalham o excedente pela lista (n = 5:
+# 2, 2, 1, 2, 1 em vez de 2, 2, 2, 1, 1). Genes 0-839 (mmc de 1 a 8) seriam exatos, mas
+# custariam 2 bytes por gene na população empacotada (reprodução, checkpoint e log .rlog).
+# RELATIVE_GENES[n][k] é o menor gene que escolhe o índice k (caminhadas da inicialização).
+RELATIVE_GENES = tuple(tuple((8 * k + n - 1) // n for k in range(n)) for n in range(9))
+
+# Fitness base de uma caminhada que pisou na saída; as demais ficam sempre abaixo
+BASE_SUCCESS = 10000.0
+
+# Peso da novidade da posição final no modelo 'exploracao': vale NOVELTY_WEIGHT numa célula onde
+# nenhuma caminhada anterior passou e cai com 1 / (1 + visitas)
+NOVELTY_WEIGHT = 5000.0
 
 
 class GeneticAlgorithm:
@@ -13,7 +40,7 @@ class GeneticAlgorithm:
             'TAXA_MUTACAO': 0.01,
             'TAXA_CROSSOVER': 0.8,
             'NUM_GERACOES': 10,
-            'TAMANHO_CROMOSSOMO': max(50, (maze.n * maze.n) // 2),
+            'TAMANHO_CROMOSSOMO': max(50, (maze.rows * maze.cols) // 2),
             'TORNEIO_SIZE': 3,
             'VERBOSE': True,
             'VERBOSE_INTERVAL': 1,
@@ -27,11 +54,26 @@ class GeneticAlgorithm:
             'TRACK_FULL_POPULATION': False,
             'SHOW_POPULATION': 0,
             'TRACK_PHASES': False,
+            'TRACK_HEATMAP': False,
+            'MODELO_FITNESS': 'exploracao',
+            'CODIFICACAO': 'absoluta',
+            'INICIALIZACAO': 'aleatoria',
+            'CHECKPOINT': None,
+            'CHECKPOINT_A_CADA': 10,
+            'RETOMAR': False,
+            'PROGRESSO': (),
+            'CROSSOVER': 'um_ponto',
+            'MUTACAO': 'por_gene',
         }
         
         if params:
             default_params.update(params)
         
+        # Na codificação relativa todo gene avança o agente (na absoluta ~40% batem em parede),
+        # então o mesmo alcance cabe em um cromossomo menor; pode ser reduzido via TAMANHO_CROMOSSOMO
+        if default_params['CODIFICACAO'] == 'relativa' and 'TAMANHO_CROMOSSOMO' not in (params or {}):
+            default_params['TAMANHO_CROMOSSOMO'] = max(50, (maze.rows * maze.cols) // 8)
+        
         self.params = default_params
         self.best_fitness_history = []
         self.avg_fitness_history = []
@@ -40,6 +82,43 @@ class GeneticAlgorithm:
         self.s_position = None
         self.generation_details = []
         self.phase_logs = []
+        
+        # Estado da execução em self (e não em locais de run) para poder ir para o checkpoint
+        self.population = None
+        self.start_generation = 0
+        self.best_ever_chromosome = None
+        self.best_ever_fitness = 0
+        self.best_ever_position = None
+        self.best_ever_path = None
+        self._boundary = None
+        
+        # Operadores em lote (src/reproduction.py) para qualquer combinação diferente da original;
+        # um ponto + por gene mantém o laço individual e a mesma sequência aleatória de antes
+        self._batched = (self.params['CROSSOVER'], self.params['MUTACAO']) != ('um_ponto', 'por_gene')
+        
+        # Observadores de progresso (src/progress.py): VERBOSE vira o observador de console
+        self._sinks = ([ConsoleSink()] if self.params['VERBOSE'] else []) + list(self.params['PROGRESSO'])
+        self._started = None
+        self._evaluations = 0
+        
+        # Bitmap de visitas reutilizado por todas as avaliações: cada caminhada
+        # recebe um carimbo novo, então não é preciso limpar entre indivíduos.
+        # Bitmap, mapa de calor e máscaras usam o índice do plano com borda do Maze.
+        self._visit_stamps = array('I', [0]) * maze.size
+        self._current_stamp = 0
+        
+        # Mapa de calor opcional: visitas por célula somadas sobre todos os indivíduos e gerações
+        self.visit_counts = array('I', [0]) * maze.size if self.params['TRACK_HEATMAP'] else None
+        
+        # Arquivo de novidade do modelo 'exploracao': quantas caminhadas de gerações anteriores
+        # passaram por cada célula. As células novas de cada caminhada ficam em _new_visits
+        # (só durante a evolução) e entram no arquivo ao fim da geração.
+        self._novelty = array('I', [0]) * maze.size if self.params['MODELO_FITNESS'] == 'exploracao' else None
+        self._new_visits = None
+        
+        # A saída é reconhecida ao pisar nela (máscara por célula), sem consultar pos_S
+        self._exit_mask = maze.exit_mask()
+        self._neighbor_masks = maze.neighbor_masks() if self.params['CODIFICACAO'] == 'relativa' else None
     
     #1. Criação
     def create_random_chromosome(self):
@@ -48,48 +127,139 @@ class GeneticAlgorithm:
     
     #2. Heuristica (Finesse)
     def evaluate_fitness(self, chromosome):
-        # Avalia aptidão: retorna (fitness, posição_final, caminho)
-        linha, coluna = self.maze.pos_E
-        path = [(linha, coluna)]
-        visited_cells = {(linha, coluna)}
+        # Avalia aptidão: retorna (fitness, posição_final, caminho compacto, células_únicas)
+        if self._neighbor_masks is not None:
+            return self._evaluate_relative(chromosome)
+        
+        # A caminhada anda direto no plano com borda: a parede da borda bloqueia como
+        # qualquer outra, sem verificar limites a cada gene
+        cells = self.maze.cells
+        offsets = self.maze.offsets
+        stamp = self._next_stamp()
+        stamps = self._visit_stamps
+        counts = self.visit_counts
+        exit_mask = self._exit_mask
+        new_visits = self._new_visits
+        
+        index = self.maze.index(*self.maze.pos_E)
+        moves = bytearray()
+        stamps[index] = stamp
+        unique_cells = 1
+        if counts is not None:
+            counts[index] += 1
+        if new_visits is not None:
+            new_visits.append(index)
         
         for direction in chromosome:
-            result = self.maze.move(linha, coluna, direction)
+            target = index + offsets[direction]
             
-            if result is None:
+            if not cells[target]:
                 continue
             
-            linha, coluna = result
-            path.append((linha, coluna))
-            visited_cells.add((linha, coluna))
+            index = target
+            moves.append(direction)
+            
+            if stamps[index] != stamp:
+                stamps[index] = stamp
+                unique_cells += 1
+                if new_visits is not None:
+                    new_visits.append(index)
+            if counts is not None:
+                counts[index] += 1
             
-            if self.maze.get_cell(linha, coluna) == 'S':
-                BASE_SUCCESS = 10000.0
+            if exit_mask[index]:
+                position = self.maze.position(index)
+                path = CompactPath(self.maze.pos_E, moves, position)
                 efficiency_bonus = 1000.0 / len(path)
-                return BASE_SUCCESS + efficiency_bonus, (linha, coluna), path
+                return BASE_SUCCESS + efficiency_bonus, position, path, unique_cells
         
-        linha_entrada, coluna_entrada = self.maze.pos_E
-        linha_saida, coluna_saida = self.maze.pos_S
+        return self._score_walk(*self.maze.position(index), moves, unique_cells)
+    
+    def _evaluate_relative(self, chromosome):
+        # Codificação relativa: o gene escolhe uma das direções livres da célula atual (faixas de
+        # RELATIVE_GENES), então nenhum gene é desperdiçado em paredes. O caminho guarda a direção absoluta.
+        stamp = self._next_stamp()
+        stamps = self._visit_stamps
+        counts = self.visit_counts
+        exit_mask = self._exit_mask
+        new_visits = self._new_visits
+        masks = self._neighbor_masks
+        offsets = self.maze.offsets
+        
+        index = self.maze.index(*self.maze.pos_E)
+        moves = bytearray()
+        stamps[index] = stamp
+        unique_cells = 1
+        if counts is not None:
+            counts[index] += 1
+        if new_visits is not None:
+            new_visits.append(index)
+        
+        for gene in chromosome:
+            legal = LEGAL_DIRECTIONS[masks[index]]
+            if not legal:
+                break
+            
+            direction = legal[gene * len(legal) >> 3]
+            index += offsets[direction]
+            moves.append(direction)
+            
+            if stamps[index] != stamp:
+                stamps[index] = stamp
+                unique_cells += 1
+                if new_visits is not None:
+                    new_visits.append(index)
+            if counts is not None:
+                counts[index] += 1
+            
+            if exit_mask[index]:
+                position = self.maze.position(index)
+                path = CompactPath(self.maze.pos_E, moves, position)
+                efficiency_bonus = 1000.0 / len(path)
+                return BASE_SUCCESS + efficiency_bonus, position, path, unique_cells
         
-        # Distância do ponto final até a saída (quanto menor, melhor)
-        distance_to_exit = abs(linha - linha_saida) + abs(coluna - coluna_saida)
+        return self._score_walk(*self.maze.position(index), moves, unique_cells)
+    
+    def _score_walk(self, linha, coluna, moves, unique_cells):
+        # Fitness de uma caminhada que terminou sem encontrar S
+        path = CompactPath(self.maze.pos_E, moves, (linha, coluna))
         
         # Quanto mais células únicas exploradas, melhor
-        exploration_bonus = len(visited_cells) * 10.0
-        
-        # Penalidade por estar longe da saída
-        distance_penalty = distance_to_exit * 5.0
+        exploration_bonus = unique_cells * 10.0
         
         # Bônus por ter se movido (não ficar parado)
         movement_bonus = len(path) * 0.5
         
-        # Fitness final
-        fitness = exploration_bonus + movement_bonus - distance_penalty
+        if self.params['MODELO_FITNESS'] == 'distancia':
+            # Modelo antigo: usa a posição real da saída (pos_S), que o AG não deveria conhecer.
+            # Mantido apenas para comparação nos benchmarks.
+            linha_saida, coluna_saida = self.maze.pos_S
+            distance_to_exit = abs(linha - linha_saida) + abs(coluna - coluna_saida)
+            fitness = exploration_bonus + movement_bonus - distance_to_exit * 5.0
+        else:
+            # Observabilidade parcial (busca por novidade): premia terminar onde poucas caminhadas
+            # de gerações anteriores passaram, empurrando a população para regiões ainda não
+            # visitadas, onde S pode estar. A distância a E não servia: premiava corredores sem
+            # saída longe de E e achava S menos que o modelo 'distancia'.
+            visits = self._novelty[self.maze.index(linha, coluna)]
+            fitness = exploration_bonus + movement_bonus + NOVELTY_WEIGHT / (1 + visits)
         
         # Evitar fitness negativo (mínimo 0.1 para cromossomos que exploram mas não acham S)
         fitness = max(0.1, fitness)
         
-        return fitness, (linha, coluna), path
+        # Comprime abaixo de BASE_SUCCESS: em labirintos grandes caminhadas longas passavam de
+        # 10000 e contavam como saída encontrada. É monotônica, então o torneio não muda.
+        fitness = BASE_SUCCESS * fitness / (fitness + BASE_SUCCESS)
+        
+        return fitness, (linha, coluna), path, unique_cells
+    
+    def _next_stamp(self):
+        # Próximo carimbo de visita; zera o bitmap só quando o contador estoura 32 bits
+        self._current_stamp += 1
+        if self._current_stamp > 0xFFFFFFFF:
+            self._visit_stamps = array('I', [0]) * len(self._visit_stamps)
+            self._current_stamp = 1
+        return self._current_stamp
     
     #3. Seleção Torneio
     def tournament_selection(self, population, fitnesses):
@@ -174,48 +344,165 @@ class GeneticAlgorithm:
         
         return False
     
+    def checkpoint_state(self, generation):
+        # Estado no início de generation (antes da avaliação): o suficiente para retomar exatamente
+        return self._boundary_state(self._mark_boundary(generation))
+    
+    def _mark_boundary(self, generation):
+        # Marca barata do início de generation, tirada a cada N gerações: gerador aleatório, população
+        # empacotada, melhor global e só os comprimentos das listas de histórico (que só crescem).
+        # O checkpoint completo sai de _boundary_state, apenas quando for mesmo gravado.
+        from ga_checkpoint import pack_population
+        return {
+            'generation': generation,
+            'population': pack_population(self.population),
+            'best_ever': (bytes(self.best_ever_chromosome) if self.best_ever_chromosome is not None else None,
+                          self.best_ever_fitness, self.best_ever_position, self.best_ever_path),
+            'lengths': (len(self.best_fitness_history), len(self.avg_fitness_history), len(self.diversity_history),
+                        len(self.generation_details), len(self.phase_logs)),
+            # O mapa de calor e o arquivo de novidade são somados no lugar: precisam de cópia
+            'visit_counts': array('I', self.visit_counts) if self.visit_counts is not None else None,
+            'novelty': array('I', self._novelty) if self._novelty is not None else None,
+            'random_state': random.getstate(),
+        }
+    
+    def _boundary_state(self, boundary):
+        # Checkpoint completo de uma marca: os históricos são cortados nos comprimentos da marca
+        from ga_checkpoint import CHECKPOINT_VERSION, EVOLUTION_PARAMS, maze_fingerprint, pack_details
+        chromosome, fitness, position, path = boundary['best_ever']
+        best, avg, diversity, details, phases = boundary['lengths']
+        return {
+            'version': CHECKPOINT_VERSION,
+            'maze': maze_fingerprint(self.maze),
+            'params': {name: self.params[name] for name in EVOLUTION_PARAMS},
+            'generation': boundary['generation'],
+            'population': boundary['population'],
+            'best_ever_chromosome': chromosome,
+            'best_ever_fitness': fitness,
+            'best_ever_position': position,
+            'best_ever_path': path,
+            'best_fitness_history': self.best_fitness_history[:best],
+            'avg_fitness_history': self.avg_fitness_history[:avg],
+            'diversity_history': self.diversity_history[:diversity],
+            'generation_details': pack_details(self.generation_details[:details]),
+            'phase_logs': self.phase_logs[:phases],
+            'visit_counts': boundary['visit_counts'],
+            'novelty': boundary['novelty'],
+            'random_state': boundary['random_state'],
+        }
+    
+    def restore_checkpoint(self, state):
+        # Inverso de checkpoint_state: a próxima geração executada é state['generation']
+        from ga_checkpoint import unpack_population, unpack_details
+        self.population = unpack_population(state['population'], self.params['TAMANHO_CROMOSSOMO'])
+        self.start_generation = state['generation']
+        chromosome = state['best_ever_chromosome']
+        self.best_ever_chromosome = list(chromosome) if chromosome is not None else None
+        self.best_ever_fitness = state['best_ever_fitness']
+        self.best_ever_position = state['best_ever_position']
+        self.best_ever_path = state['best_ever_path']
+        self.best_fitness_history = state['best_fitness_history']
+        self.avg_fitness_history = state['avg_fitness_history']
+        self.diversity_history = state['diversity_history']
+        self.generation_details = unpack_details(state['generation_details'])
+        self.phase_logs = state['phase_logs']
+        if state['visit_counts'] is not None:
+            self.visit_counts = state['visit_counts']
+        if state['novelty'] is not None:
+            self._novelty = state['novelty']
+        random.setstate(state['random_state'])
+    
+    def _save_checkpoint(self, state):
+        from ga_checkpoint import save_checkpoint
+        save_checkpoint(self.params['CHECKPOINT'], state)
+        self._emit('on_checkpoint', state['generation'], self.params['CHECKPOINT'])
+    
+    def _emit(self, event, *args):
+        for sink in self._sinks:
+            getattr(sink, event)(self, *args)
+    
     def run(self):
         # Executa o AG até encontrar S ou atingir máximo de gerações
-        # Mostrar informações iniciais
-        if self.params['VERBOSE']:
-            print(f"\n{'='*60}")
-            print(f"INICIANDO ALGORITMO GENETICO")
-            print(f"{'='*60}")
-            print(f"Parametros:")
-            print(f"   - Tamanho da Populacao: {self.params['TAMANHO_POPULACAO']}")
-            print(f"   - Tamanho do Cromossomo: {self.params['TAMANHO_CROMOSSOMO']} movimentos")
-            print(f"   - Taxa de Mutacao: {self.params['TAXA_MUTACAO']*100}%")
-            print(f"   - Taxa de Crossover: {self.params['TAXA_CROSSOVER']*100}%")
-            print(f"   - Geracoes Maximas: {self.params['NUM_GERACOES']}")
-            print(f"   - Tamanho do Torneio: {self.params['TORNEIO_SIZE']}")
-            print(f"Objetivo: Encontrar a saida 'S' do labirinto {self.maze.n}x{self.maze.n}")
-            print(f"   Partindo de E = {self.maze.pos_E}")
-            print(f"{'='*60}\n")
-        
+        checkpoint_file = self.params['CHECKPOINT']
+        resume = self.params['RETOMAR'] and checkpoint_file is not None and os.path.exists(checkpoint_file)
+        
+        self._started = time.perf_counter()
+        self._evaluations = 0
+        self._emit('on_start')
+        
+        if resume:
+            # Retomada: população, históricos, melhor global e gerador aleatório vêm do checkpoint
+            from ga_checkpoint import load_checkpoint
+            self.restore_checkpoint(load_checkpoint(checkpoint_file, self.maze, self.params))
+            self._emit('on_resume', checkpoint_file)
+        else:
+            self._initialize_population()
+        
+        try:
+            return self._evolve()
+        except KeyboardInterrupt:
+            # Interrompido: grava a última marca (início da última geração múltipla de N, ou da primeira
+            # desta execução) e repassa a interrupção; a retomada refaz as gerações desde ela
+            self._new_visits = None
+            if self._boundary is not None:
+                self._save_checkpoint(self._boundary_state(self._boundary))
+            raise
+    
+    def _initialize_population(self):
         # Final Elitismo
-        population = [self.create_random_chromosome() 
-                      for _ in range(self.params['TAMANHO_POPULACAO'])]
+        strategy = self.params['INICIALIZACAO']
+        if strategy == 'aleatoria':
+            self.population = [self.create_random_chromosome() 
+                               for _ in range(self.params['TAMANHO_POPULACAO'])]
+        else:
+            # Caminhadas heurísticas baratas geradas em lote (src/initialization.py)
+            self.population = initial_population(self.maze, strategy, self.params['TAMANHO_POPULACAO'],
+                                                 self.params['TAMANHO_CROMOSSOMO'], self.params['CODIFICACAO'])
         
         if self.params.get('TRACK_PHASES', False):
             self.phase_logs.append({
                 'generation': 0,
                 'phase': 'INICIALIZAÇÃO',
-                'description': 'População inicial criada aleatoriamente',
+                'description': 'População inicial criada aleatoriamente' if strategy == 'aleatoria'
+                               else 'População inicial criada por caminhadas heurísticas a partir de E',
                 'details': {
-                    'population_size': len(population),
+                    'population_size': len(self.population),
                     'chromosome_length': self.params['TAMANHO_CROMOSSOMO'],
-                    'method': 'Geração aleatória de movimentos (0-7)'
+                    'method': INIT_DESCRIPTIONS[strategy]
+                              + (' relativos aos vizinhos livres'
+                                 if strategy == 'aleatoria' and self.params['CODIFICACAO'] == 'relativa' else '')
                 }
             })
-        
-        best_ever_chromosome = None
-        best_ever_fitness = 0
-        best_ever_position = None
-        best_ever_path = None
-        
-        for generation in range(self.params['NUM_GERACOES']):
+    
+    def _evolve(self):
+        # Laço de gerações a partir de self.start_generation (0, ou a geração do checkpoint)
+        checkpoint_file = self.params['CHECKPOINT']
+        checkpoint_every = self.params['CHECKPOINT_A_CADA']
+        self._boundary = None
+        
+        for generation in range(self.start_generation, self.params['NUM_GERACOES']):
+            if checkpoint_file is not None:
+                # Marca do início da geração só a cada N gerações (empacotar a população e copiar os mapas
+                # custa O(população)): vira checkpoint na hora e, até a próxima, é a gravada ao ser interrompido
+                periodic = checkpoint_every > 0 and generation % checkpoint_every == 0
+                if periodic or generation == self.start_generation:
+                    self._boundary = self._mark_boundary(generation)
+                if periodic and generation > self.start_generation:
+                    self._save_checkpoint(self._boundary_state(self._boundary))
+            
             # FASE 1: Avaliar fitness de toda a população
-            fitness_results = [self.evaluate_fitness(chromo) for chromo in population]
+            evaluation_start = time.perf_counter()
+            if self._novelty is not None:
+                self._new_visits = []
+            fitness_results = [self.evaluate_fitness(chromo) for chromo in self.population]
+            if self._novelty is not None:
+                # As visitas desta geração só contam como "já exploradas" a partir da próxima
+                novelty = self._novelty
+                for index in self._new_visits:
+                    novelty[index] += 1
+                self._new_visits = None
+            evaluation_s = time.perf_counter() - evaluation_start
+            self._evaluations += len(fitness_results)
             fitnesses = [f[0] for f in fitness_results]
             
             # Armazenar cromossomos completos para output detalhado
@@ -224,15 +511,15 @@ class GeneticAlgorithm:
                     'generation': generation,
                     'population': []
                 }
-                for i, (chromo, (fit, pos, path)) in enumerate(zip(population, fitness_results)):
+                for i, (chromo, (fit, pos, path, unique_cells)) in enumerate(zip(self.population, fitness_results)):
                     current_gen_data['population'].append({
                         'id': i,
-                        'chromosome': chromo.copy(),
+                        'chromosome': list(chromo),
                         'fitness': fit,
                         'position': pos,
                         'path': path.copy(),
                         'path_length': len(path),
-                        'unique_cells': len(set(path))
+                        'unique_cells': unique_cells
                     })
                 
                 # Adicionar à lista de detalhes
@@ -258,7 +545,7 @@ class GeneticAlgorithm:
             # FASE 2: Encontrar o melhor desta geração
             best_idx = fitnesses.index(max(fitnesses))
             best_fitness = fitnesses[best_idx]
-            best_chromosome = population[best_idx]
+            best_chromosome = self.population[best_idx]
             best_position = fitness_results[best_idx][1]
             best_path = fitness_results[best_idx][2]
             
@@ -278,11 +565,11 @@ class GeneticAlgorithm:
             
             # FASE 3: Atualizar melhor global (Elitismo)
             elite_preserved = False
-            if best_fitness > best_ever_fitness:
-                best_ever_fitness = best_fitness
-                best_ever_chromosome = copy.deepcopy(best_chromosome)
-                best_ever_position = best_position
-                best_ever_path = best_path
+            if best_fitness > self.best_ever_fitness:
+                self.best_ever_fitness = best_fitness
+                self.best_ever_chromosome = copy.deepcopy(best_chromosome)
+                self.best_ever_position = best_position
+                self.best_ever_path = best_path
                 elite_preserved = False  # Novo melhor encontrado
             else:
                 elite_preserved = True  # Elite anterior preservado
@@ -293,7 +580,7 @@ class GeneticAlgorithm:
                     'phase': 'ELITISMO',
                     'description': 'Melhor indivíduo global é preservado para próxima geração',
                     'details': {
-                        'elite_fitness': best_ever_fitness,
+                        'elite_fitness': self.best_ever_fitness,
                         'status': 'Preservado da geração anterior' if elite_preserved else 'Novo melhor encontrado',
                         'elite_will_survive': True
                     }
@@ -301,9 +588,9 @@ class GeneticAlgorithm:
             
             # Calcular métricas
             avg_fitness = sum(fitnesses) / len(fitnesses)
-            diversity = self.calculate_diversity(population)
+            diversity = self.calculate_diversity(self.population)
             
-            self.best_fitness_history.append(best_ever_fitness)
+            self.best_fitness_history.append(self.best_ever_fitness)
             self.avg_fitness_history.append(avg_fitness)
             self.diversity_history.append(diversity)
             
@@ -318,13 +605,13 @@ class GeneticAlgorithm:
                     generation_data = self.generation_details[generation]
                     generation_data.update({
                         'best_fitness_generation': best_fitness,
-                        'best_fitness_global': best_ever_fitness,
+                        'best_fitness_global': self.best_ever_fitness,
                         'avg_fitness': avg_fitness,
                         'min_fitness': min_fitness,
                         'max_fitness': max_fitness,
                         'diversity': diversity,
                         'valid_paths': valid_paths,
-                        'total_population': len(population),
+                        'total_population': len(self.population),
                         'best_position': best_position,
                         'path_length': len(best_path)
                     })
@@ -333,161 +620,116 @@ class GeneticAlgorithm:
                     generation_data = {
                         'generation': generation,
                         'best_fitness_generation': best_fitness,
-                        'best_fitness_global': best_ever_fitness,
+                        'best_fitness_global': self.best_ever_fitness,
                         'avg_fitness': avg_fitness,
                         'min_fitness': min_fitness,
                         'max_fitness': max_fitness,
                         'diversity': diversity,
                         'valid_paths': valid_paths,
-                        'total_population': len(population),
+                        'total_population': len(self.population),
                         'best_position': best_position,
                         'path_length': len(best_path)
                     }
                     self.generation_details.append(generation_data)
             
+            # Progresso da geração para os observadores (console, JSONL, métricas)
+            found = best_fitness >= 10000.0
+            if self._sinks:
+                elapsed_s = time.perf_counter() - self._started
+                self._emit('on_generation', {
+                    'generation': generation,
+                    'population': len(fitnesses),
+                    'best_index': best_idx,
+                    'best_fitness': best_fitness,
+                    'best_fitness_global': self.best_ever_fitness,
+                    'avg_fitness': avg_fitness,
+                    'diversity': diversity,
+                    'valid_paths': sum(1 for f in fitnesses if f > 0),
+                    'best_position': best_position,
+                    'path_length': len(best_path),
+                    'found': found,
+                    'evaluations_total': self._evaluations,
+                    'evaluation_s': evaluation_s,
+                    'elapsed_s': elapsed_s,
+                    'evaluations_per_s': self._evaluations / elapsed_s if elapsed_s > 0 else 0.0,
+                    'generations_per_s': (generation - self.start_generation + 1) / elapsed_s if elapsed_s > 0 else 0.0,
+                }, fitness_results)
+            
             # Verificar se encontrou a solução
             # Fitness >= 10000.0 indica que a saída foi encontrada
-            if best_fitness >= 10000.0:
+            if found:
                 self.generation_found = generation
                 self.s_position = best_position
                 
-                if self.params['VERBOSE']:
-                    print(f"\n{'='*60}")
-                    print(f"SAIDA ENCONTRADA!")
-                    print(f"{'='*60}")
-                    print(f"   Geracao: {generation}")
-                    print(f"   Posicao da Saida: {best_position}")
-                    print(f"   Tamanho do Caminho: {len(best_ever_path)} passos")
-                    print(f"{'='*60}\n")
-                
-                return {
+                result = {
                     'success': True,
                     'generation': generation,
                     's_position': best_position,
-                    'chromosome': best_ever_chromosome,
-                    'path': best_ever_path,
-                    'fitness': best_ever_fitness,
+                    'chromosome': self.best_ever_chromosome,
+                    'path': self.best_ever_path,
+                    'fitness': self.best_ever_fitness,
                     'best_fitness_history': self.best_fitness_history,
                     'avg_fitness_history': self.avg_fitness_history,
                     'diversity_history': self.diversity_history,
                     'generation_details': self.generation_details,
-                    'phase_logs': self.phase_logs
+                    'phase_logs': self.phase_logs,
+                    'heatmap': self.visit_counts
                 }
-            
-            # Log de progresso
-            if self.params['VERBOSE'] and (generation % self.params['VERBOSE_INTERVAL'] == 0 or generation == 0):
-                print(f"\n{'-'*60}")
-                print(f"GERACAO {generation}")
-                print(f"{'-'*60}")
-                print(f"  Melhor Fitness da Geracao: {best_fitness:.2f}")
-                print(f"  Melhor Fitness Global: {best_ever_fitness:.2f}")
-                print(f"  Posicao Final: {best_position}")
-                
-                # Visualização de elitismo
-                if self.params.get('SHOW_ELITISM', False):
-                    if generation > 0:
-                        status = "[ELITE PRESERVADO]" if best_ever_fitness == self.best_fitness_history[-2] else "[NOVO MELHOR]"
-                        print(f"  Elitismo: {status}")
-                
-                # Mostrar população completa ou top N
-                show_pop = self.params.get('SHOW_POPULATION', 0)
-                if show_pop > 0:
-                    print(f"\n  Top {show_pop} Individuos desta Geracao:")
-                    print(f"  {'ID':<5} {'Fitness':<15} {'Posicao Final':<20} {'Passos':<8} {'Celulas Unicas':<15}")
-                    print(f"  {'-'*70}")
-                    
-                    # Ordenar por fitness (melhor primeiro)
-                    sorted_pop = sorted(enumerate(fitness_results), key=lambda x: x[1][0], reverse=True)
-                    
-                    for rank, (idx, (fit, pos, path)) in enumerate(sorted_pop[:show_pop], 1):
-                        unique_cells = len(set(path))
-                        status = "[*] " if rank == 1 else "    "
-                        print(f"  {status}{idx:<3} {fit:<15.2f} {str(pos):<20} {len(path):<8} {unique_cells:<15}")
-                    
-                    if show_pop < len(population):
-                        print(f"  ... e mais {len(population) - show_pop} indivíduos")
-                
-                if self.params.get('VERBOSE_DETAIL', False):
-                    # Estatísticas da população
-                    valid_paths = sum(1 for f in fitnesses if f > 0)
-                    print(f"  Fitness Medio: {avg_fitness:.2f}")
-                    print(f"  Caminhos Validos: {valid_paths}/{len(fitnesses)}")
-                    print(f"  Tamanho do Caminho: {len(best_path)} passos")
-                    
-                    # Análise de convergência
-                    if self.params.get('ANALISE_CONVERGENCIA', False):
-                        print(f"  Diversidade Genetica: {diversity:.2%}")
-                        
-                        if len(self.best_fitness_history) >= 10:
-                            stagnation = len(self.best_fitness_history) - max((i for i, f in enumerate(self.best_fitness_history) if f != best_ever_fitness), default=0) - 1
-                            print(f"  Geracoes Estagnadas: {stagnation}")
-                            
-                            if diversity < 0.1:
-                                print(f"  ALERTA: Baixa diversidade - risco de convergência prematura!")
-                            
-                            if self.detect_convergence(self.best_fitness_history):
-                                print(f"  ALERTA: Convergência detectada!")
-                    
-                    # Mostrar início do caminho
-                    if len(best_path) > 1:
-                        path_preview = " > ".join([f"{p}" for p in best_path[:min(5, len(best_path))]])
-                        if len(best_path) > 5:
-                            path_preview += " > ..."
-                        print(f"  Caminho: {path_preview}")
-                
-                print(f"{'-'*60}")
-                
-                # Modo lento: adicionar delay entre gerações
-                if self.params.get('MODO_LENTO', False):
-                    delay = self.params.get('DELAY_GERACAO', 0.5)
-                    time.sleep(delay)
-                
-                # Pausa interativa: esperar Enter do usuário
-                pausar_a_cada = self.params.get('PAUSAR_A_CADA', 0)
-                if pausar_a_cada > 0 and generation > 0 and generation % pausar_a_cada == 0:
-                    input(f"\n[PAUSA] Pressione Enter para continuar (próximas {pausar_a_cada} gerações)...")
+                self._emit('on_finish', result)
+                return result
             
             # FASE 4: Criar nova população
             new_population = []
             
             # Elitismo: manter o melhor (se existir)
-            if best_ever_chromosome is not None:
-                new_population.append(copy.deepcopy(best_ever_chromosome))
+            if self.best_ever_chromosome is not None:
+                new_population.append(copy.deepcopy(self.best_ever_chromosome))
             else:
                 new_population.append(copy.deepcopy(best_chromosome))
             
-            # Contadores para estatísticas
-            selections_count = 0
-            crossovers_count = 0
-            mutations_count = 0
-            genes_mutated = 0
-            
-            # Gerar o resto da população
-            while len(new_population) < self.params['TAMANHO_POPULACAO']:
-                # FASE 5: Seleção por Torneio
-                parent1 = self.tournament_selection(population, fitnesses)
-                parent2 = self.tournament_selection(population, fitnesses)
-                selections_count += 2
-                
-                # FASE 6: Crossover
-                child1, child2 = self.crossover(parent1, parent2)
-                crossovers_count += 1
-                
-                # FASE 7: Mutação
-                child1_original = copy.deepcopy(child1)
-                child2_original = copy.deepcopy(child2)
-                child1 = self.mutate(child1)
-                child2 = self.mutate(child2)
+            if self._batched:
+                # FASES 5-7 em lote sobre a matriz da população (src/reproduction.py)
+                offspring, counts = reproduce(self.population, fitnesses,
+                                              self.params['TAMANHO_POPULACAO'] - len(new_population),
+                                              self.params['TAMANHO_CROMOSSOMO'], self.params)
+                new_population.extend(offspring)
+                selections_count = counts['selections']
+                crossovers_count = counts['crossovers']
+                mutations_count = counts['mutations']
+                genes_mutated = counts['genes_mutated']
+            else:
+                # Contadores para estatísticas
+                selections_count = 0
+                crossovers_count = 0
+                mutations_count = 0
+                genes_mutated = 0
                 
-                # Contar genes mutados
-                genes_mutated += sum(1 for i in range(len(child1)) if child1[i] != child1_original[i])
-                genes_mutated += sum(1 for i in range(len(child2)) if child2[i] != child2_original[i])
-                mutations_count += 2
+                # Gerar o resto da população
+                while len(new_population) < self.params['TAMANHO_POPULACAO']:
+                    # FASE 5: Seleção por Torneio
+                    parent1 = self.tournament_selection(self.population, fitnesses)
+                    parent2 = self.tournament_selection(self.population, fitnesses)
+                    selections_count += 2
+                    
+                    # FASE 6: Crossover
+                    child1, child2 = self.crossover(parent1, parent2)
+                    crossovers_count += 1
+                    
+                    # FASE 7: Mutação
+                    child1_original = copy.deepcopy(child1)
+                    child2_original = copy.deepcopy(child2)
+                    child1 = self.mutate(child1)
+                    child2 = self.mutate(child2)
+                    
+                    # Contar genes mutados
+                    genes_mutated += sum(1 for i in range(len(child1)) if child1[i] != child1_original[i])
+                    genes_mutated += sum(1 for i in range(len(child2)) if child2[i] != child2_original[i])
+                    mutations_count += 2
+                    
+                    new_population.append(child1)
+                    if len(new_population) < self.params['TAMANHO_POPULACAO']:
+                        new_population.append(child2)
                 
-                new_population.append(child1)
-                if len(new_population) < self.params['TAMANHO_POPULACAO']:
-                    new_population.append(child2)
-            
             if self.params.get('TRACK_PHASES', False):
                 self.phase_logs.append({
                     'generation': generation,
@@ -503,12 +745,12 @@ class GeneticAlgorithm:
                 self.phase_logs.append({
                     'generation': generation,
                     'phase': 'CROSSOVER (RECOMBINAÇÃO)',
-                    'description': 'Pais combinados para gerar filhos (crossover de um ponto)',
+                    'description': f'Pais combinados para gerar filhos ({CROSSOVER_NAMES[self.params["CROSSOVER"]]})',
                     'details': {
                         'total_crossovers': crossovers_count,
                         'rate': self.params['TAXA_CROSSOVER'] * 100,
-                        'method': 'One-point crossover',
-                        'preserves_sequences': True
+                        'method': CROSSOVER_DESCRIPTIONS[self.params['CROSSOVER']],
+                        'preserves_sequences': self.params['CROSSOVER'] != 'uniforme'
                     }
                 })
                 
@@ -518,6 +760,7 @@ class GeneticAlgorithm:
                     'description': 'Genes alterados aleatoriamente para manter diversidade',
                     'details': {
                         'individuals_processed': mutations_count,
+                        'method': MUTATION_DESCRIPTIONS[self.params['MUTACAO']],
                         'genes_mutated': genes_mutated,
                         'mutation_rate': self.params['TAXA_MUTACAO'] * 100,
                         'expected_mutations_per_chromosome': self.params['TAMANHO_CROMOSSOMO'] * self.params['TAXA_MUTACAO'],
@@ -536,26 +779,30 @@ class GeneticAlgorithm:
                     }
                 })
             
-            population = new_population
+            self.population = new_population
         
-        # Não encontrou solução
-        if self.params['VERBOSE']:
-            print(f"ERRO: Algoritmo genético não encontrou a saída após {self.params['NUM_GERACOES']} gerações.")
-            print(f"Melhor fitness alcançado: {best_ever_fitness:.2f}")
+        if checkpoint_file is not None:
+            # Estado final: retomar com mais gerações (NUM_GERACOES maior) estende a execução
+            self._boundary = None
+            self._save_checkpoint(self.checkpoint_state(self.params['NUM_GERACOES']))
         
-        return {
+        # Não encontrou solução
+        result = {
             'success': False,
             'generation': self.params['NUM_GERACOES'],
             's_position': None,
-            'chromosome': best_ever_chromosome,
-            'path': best_ever_path,
-            'fitness': best_ever_fitness,
+            'chromosome': self.best_ever_chromosome,
+            'path': self.best_ever_path,
+            'fitness': self.best_ever_fitness,
             'best_fitness_history': self.best_fitness_history,
             'avg_fitness_history': self.avg_fitness_history,
             'diversity_history': self.diversity_history,
             'generation_details': self.generation_details,
-            'phase_logs': self.phase_logs
+            'phase_logs': self.phase_logs,
+            'heatmap': self.visit_counts
         }
+        self._emit('on_finish', result)
+        return result
 
 
 def run_genetic(maze, params=None):
@@ -0,0 +1,124 @@
+import math
+import struct
+import zlib
+
+
+# Paleta indexada: um byte por pixel, convertido em cor só na gravação
+WALL, FREE, ENTRY, EXIT, GA_PATH, ASTAR_PATH, BOTH_PATHS = range(7)
+HEAT_FIRST = 8
+HEAT_LEVELS = 256 - HEAT_FIRST
+
+BASE_PALETTE = [
+    (30, 30, 30),     # Parede
+    (255, 255, 255),  # Espaço livre
+    (0, 170, 0),      # Entrada (E)
+    (220, 0, 0),      # Saída (S)
+    (0, 200, 200),    # Caminho do AG
+    (0, 60, 255),     # Caminho do A*
+    (140, 0, 220),    # Células nos dois caminhos
+    (255, 255, 255),  # (não usado)
+]
+
+# Tabela dos códigos do plano de células do Maze (parede, livre, E, S) para o índice da paleta
+CELL_TRANSLATION = bytes.maketrans(bytes(range(4)), bytes([WALL, FREE, ENTRY, EXIT]))
+
+
+def _heat_color(level):
+    # Gradiente amarelo claro -> vermelho escuro para o mapa de calor
+    t = level / (HEAT_LEVELS - 1)
+    return (255 - int(75 * t), int(245 * (1 - t)), int(200 * (1 - t) ** 2))
+
+
+PALETTE = BASE_PALETTE + [_heat_color(level) for level in range(HEAT_LEVELS)]
+
+
+def build_index_plane(maze, ga_path=None, astar_path=None, heatmap=None):
+    # Plano de índices (um byte por célula, linha * cols + coluna): paredes, mapa de calor opcional
+    # e caminhos por cima. O heatmap vem no índice do plano com borda do Maze.
+    cols, stride = maze.cols, maze.stride
+    cells = maze.cells
+    # Linhas do plano de células sem a borda, traduzidas em bloco (maze.grid não é decodificada)
+    rows = b''.join(cells[start:start + cols] for start in range(stride + 1, (maze.rows + 1) * stride, stride))
+    plane = bytearray(rows.translate(CELL_TRANSLATION))
+    
+    if heatmap is not None:
+        peak = max(heatmap)
+        if peak > 0:
+            scale = (HEAT_LEVELS - 1) / math.log1p(peak)
+            for linha in range(maze.rows):
+                base = maze.index(linha, 0)
+                for coluna, count in enumerate(heatmap[base:base + cols]):
+                    index = linha * cols + coluna
+                    if count and plane[index] == FREE:
+                        plane[index] = HEAT_FIRST + int(math.log1p(count) * scale)
+    
+    ga_cells = set()
+    if ga_path:
+        for linha, coluna in ga_path:
+            index = linha * cols + coluna
+            ga_cells.add(index)
+            if plane[index] not in (ENTRY, EXIT):
+                plane[index] = GA_PATH
+    
+    if astar_path:
+        for linha, coluna in astar_path:
+            index = linha * cols + coluna
+            if plane[index] not in (ENTRY, EXIT):
+                plane[index] = BOTH_PATHS if index in ga_cells else ASTAR_PATH
+    
+    return plane
+
+
+def _scale_plane(plane, width, height, scale):
+    # Amplia cada célula para scale x scale pixels
+    if scale == 1:
+        return plane, width, height
+    
+    rows = []
+    for linha in range(height):
+        row = plane[linha * width:(linha + 1) * width]
+        wide = bytes(b for b in row for _ in range(scale))
+        rows.extend([wide] * scale)
+    return bytearray(b''.join(rows)), width * scale, height * scale
+
+
+def _png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+def write_png(path, width, height, plane, palette=PALETTE, compress_level=1):
+    # PNG indexado (tipo de cor 3, 8 bits) usando apenas zlib; nível 1 prioriza velocidade
+    stride = width
+    raw = b''.join(b'\x00' + bytes(plane[linha * stride:(linha + 1) * stride]) for linha in range(height))
+    
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0)))
+        f.write(_png_chunk(b'PLTE', b''.join(bytes(color) for color in palette)))
+        f.write(_png_chunk(b'IDAT', zlib.compress(raw, compress_level)))
+        f.write(_png_chunk(b'IEND', b''))
+    return path
+
+
+def write_ppm(path, width, height, plane, palette=PALETTE):
+    # PPM binário (P6): expande os índices em RGB com três traduções por canal
+    palette = list(palette) + [(0, 0, 0)] * (256 - len(palette))
+    rgb = bytearray(3 * width * height)
+    for channel in range(3):
+        table = bytes(color[channel] for color in palette)
+        rgb[channel::3] = bytes(plane).translate(table)
+    
+    with open(path, 'wb') as f:
+        f.write(f"P6\n{width} {height}\n255\n".encode('ascii'))
+        f.write(rgb)
+    return path
+
+
+def export_maze_image(path, maze, ga_path=None, astar_path=None, heatmap=None, scale=1):
+    # Exporta o labirinto como imagem (1 pixel por célula por padrão); formato pela extensão
+    plane = build_index_plane(maze, ga_path, astar_path, heatmap)
+    plane, width, height = _scale_plane(plane, maze.cols, maze.rows, scale)
+    
+    if path.lower().endswith('.ppm'):
+        return write_ppm(path, width, height, plane)
+    return write_png(path, width, height, plane)
@@ -0,0 +1,150 @@
+import random
+from array import array
+
+
+# Estratégias de inicialização da população do AG (parâmetro INICIALIZACAO)
+INIT_STRATEGIES = ('aleatoria', 'legal', 'parede', 'fronteira')
+
+INIT_DESCRIPTIONS = {
+    'aleatoria': 'Geração aleatória de movimentos (0-7)',
+    'legal': 'Caminhadas aleatórias só por vizinhos livres, sem voltar pelo passo anterior',
+    'parede': 'Caminhadas seguindo a parede (mão esquerda ou direita, com ruído)',
+    'fronteira': 'Caminhadas que preferem células ainda não visitadas pela própria caminhada',
+}
+
+# Probabilidade de um passo aleatório no seguidor de parede: sem ruído, só existiriam
+# 16 caminhadas distintas (8 direções iniciais x 2 mãos) para a população inteira
+WALL_NOISE = 0.1
+
+# Ordem de busca do seguidor de parede para cada (mão, direção atual): começa 90° para o
+# lado da mão e gira para o outro lado (Maze.DIRECTIONS está em sentido horário)
+_WALL_ORDER = tuple(
+    tuple(tuple((heading - hand * 2 + hand * turn) % 8 for turn in range(8)) for heading in range(8))
+    for hand in (1, -1)
+)
+
+
+def initial_population(maze, strategy, count, length, encoding='absoluta', rng=random):
+    # Gera a população inicial inteira em um lote: máscaras de vizinhança, direções legais
+    # e o plano de carimbos de visita são montados uma vez e reutilizados por todas as caminhadas.
+    # As caminhadas partem de E e nunca usam pos_S. Na codificação absoluta o gene é a direção;
+    # na relativa, o gene que escolhe a direção entre os movimentos livres da célula (RELATIVE_GENES).
+    if strategy not in INIT_STRATEGIES:
+        raise ValueError(f"Estratégia de inicialização desconhecida: '{strategy}'")
+    if strategy == 'aleatoria':
+        return [[rng.randint(0, 7) for _ in range(length)] for _ in range(count)]
+    
+    from genetic import LEGAL_DIRECTIONS, RELATIVE_GENES
+    walk = {'legal': _legal_walk, 'parede': _wall_walk, 'fronteira': _frontier_walk}[strategy]
+    context = {
+        'masks': maze.neighbor_masks(),
+        'offsets': maze.offsets,
+        'legal': LEGAL_DIRECTIONS,
+        'start': maze.index(*maze.pos_E),
+        # Índice entre os movimentos livres -> gene, por número de movimentos (None na absoluta)
+        'relative': RELATIVE_GENES if encoding == 'relativa' else None,
+        'rng': rng,
+    }
+    if strategy == 'fronteira':
+        # Carimbo por caminhada: não é preciso limpar o plano entre indivíduos
+        context['stamps'] = array('I', [0]) * maze.size
+        context['visits'] = array('I', [0]) * maze.size
+    
+    population = []
+    for walk_id in range(1, count + 1):
+        chromosome = walk(context, length, walk_id)
+        # Caminhada presa (E sem vizinhos livres): completa com genes aleatórios
+        chromosome.extend(rng.randint(0, 7) for _ in range(length - len(chromosome)))
+        population.append(chromosome)
+    return population
+
+
+def _legal_walk(context, length, walk_id):
+    # Passo uniforme entre os vizinhos livres, evitando desfazer o passo anterior quando há outra opção
+    masks, offsets, legal_table = context['masks'], context['offsets'], context['legal']
+    relative, randrange = context['relative'], context['rng'].randrange
+    index = context['start']
+    previous = None
+    genes = []
+    
+    for _ in range(length):
+        legal = legal_table[masks[index]]
+        if not legal:
+            break
+        choice = randrange(len(legal))
+        if previous is not None and len(legal) > 1 and legal[choice] == (previous + 4) % 8:
+            # Sorteia de novo entre os demais (a volta fica no fim do sorteio)
+            choice = (choice + 1 + randrange(len(legal) - 1)) % len(legal)
+        direction = legal[choice]
+        genes.append(relative[len(legal)][choice] if relative else direction)
+        index += offsets[direction]
+        previous = direction
+    return genes
+
+
+def _wall_walk(context, length, walk_id):
+    # Seguidor de parede: em cada célula toma a primeira direção livre a partir de 90° para o
+    # lado da mão, girando para o outro lado; com WALL_NOISE, um passo aleatório legal
+    masks, offsets, legal_table = context['masks'], context['offsets'], context['legal']
+    relative, rng = context['relative'], context['rng']
+    rand, randrange = rng.random, rng.randrange
+    order = _WALL_ORDER[randrange(2)]
+    heading = randrange(8)
+    index = context['start']
+    genes = []
+    
+    for _ in range(length):
+        mask = masks[index]
+        if not mask:
+            break
+        if rand() < WALL_NOISE:
+            legal = legal_table[mask]
+            direction = legal[randrange(len(legal))]
+        else:
+            for direction in order[heading]:
+                if mask >> direction & 1:
+                    break
+        if relative:
+            legal = legal_table[mask]
+            genes.append(relative[len(legal)][legal.index(direction)])
+        else:
+            genes.append(direction)
+        index += offsets[direction]
+        heading = direction
+    return genes
+
+
+def _frontier_walk(context, length, walk_id):
+    # Prefere vizinhos ainda não visitados por esta caminhada; sem nenhum, vai para o vizinho
+    # menos visitado (empates sorteados), o que tira a caminhada de áreas já cobertas
+    masks, offsets, legal_table = context['masks'], context['offsets'], context['legal']
+    relative, randrange = context['relative'], context['rng'].randrange
+    stamps, visits = context['stamps'], context['visits']
+    index = context['start']
+    stamps[index] = walk_id
+    visits[index] = 1
+    genes = []
+    
+    for _ in range(length):
+        legal = legal_table[masks[index]]
+        if not legal:
+            break
+        
+        fresh = [i for i, direction in enumerate(legal) if stamps[index + offsets[direction]] != walk_id]
+        if fresh:
+            choice = fresh[randrange(len(fresh))]
+        else:
+            counts = [visits[index + offsets[direction]] for direction in legal]
+            least = min(counts)
+            ties = [i for i, visit_count in enumerate(counts) if visit_count == least]
+            choice = ties[randrange(len(ties))]
+        
+        direction = legal[choice]
+        genes.append(relative[len(legal)][choice] if relative else direction)
+        index += offsets[direction]
+        if stamps[index] != walk_id:
+            stamps[index] = walk_id
+            visits[index] = 1
+        else:
+            visits[index] += 1
+    return genes
@@ -0,0 +1,365 @@
+import os
+import sys
+import json
+import random
+import signal
+import asyncio
+import threading
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from maze_cache import get_maze_cache
+from genetic import run_genetic
+from a_star import a_star
+from batch_paths import batch_paths
+
+
+# Parâmetros do AG aceitos nas requisições (demais chaves são rejeitadas)
+ALLOWED_GA_PARAMS = {
+    'TAMANHO_POPULACAO', 'TAXA_MUTACAO', 'TAXA_CROSSOVER',
+    'NUM_GERACOES', 'TAMANHO_CROMOSSOMO', 'TORNEIO_SIZE', 'MODELO_FITNESS',
+    'CODIFICACAO', 'INICIALIZACAO', 'CROSSOVER', 'MUTACAO',
+}
+
+SERVER_GA_PARAMS = {
+    'VERBOSE': False,
+    'TRACK_HISTORY': False,
+    'TRACK_FULL_POPULATION': False,
+    'TRACK_PHASES': False,
+    'NUM_GERACOES': 10,
+    'TAMANHO_POPULACAO': 100,
+    'TAXA_MUTACAO': 0.01,
+    'TAXA_CROSSOVER': 0.8,
+}
+
+
+class JobError(Exception):
+    # Erro de requisição reportado ao cliente (não derruba a conexão)
+    pass
+
+
+def _path_to_json(path):
+    return [list(pos) for pos in path] if path is not None else None
+
+
+def _valid_id(value):
+    # ids de requisição: texto, inteiro (não booleano) ou null
+    return value is None or type(value) in (str, int)
+
+
+def _cell_field(maze, value, field):
+    # Converte [linha, coluna] da requisição em posição, exigindo uma célula livre do labirinto
+    try:
+        linha, coluna = value
+    except (TypeError, ValueError):
+        raise JobError(f"'{field}' deve ser [linha, coluna]")
+    if type(linha) is not int or type(coluna) is not int:
+        raise JobError(f"'{field}' deve ser [linha, coluna] com inteiros")
+    if not maze.is_valid(linha, coluna):
+        raise JobError(f"'{field}' {[linha, coluna]} fora do labirinto {maze.rows}x{maze.cols}")
+    if not maze.is_free(linha, coluna):
+        raise JobError(f"'{field}' {[linha, coluna]} é parede")
+    return (linha, coluna)
+
+
+# Funções executadas nos processos do pool (precisam ser picláveis)
+def _solve_job(maze, ga_params, seed):
+    if seed is not None:
+        random.seed(seed)
+    
+    ga_results = run_genetic(maze, ga_params)
+    result = {
+        'success': ga_results['success'],
+        'generation': ga_results['generation'],
+        's_position': ga_results['s_position'],
+        'fitness': ga_results['fitness'],
+        'ga_path': _path_to_json(ga_results['path']),
+        'best_fitness_history': ga_results['best_fitness_history'],
+        'avg_fitness_history': ga_results['avg_fitness_history'],
+        'optimal_path': None,
+    }
+    
+    if ga_results['success']:
+        result['optimal_path'] = _path_to_json(a_star(maze, maze.pos_E, ga_results['s_position']))
+    
+    return result
+
+
+def _astar_job(maze, start, goal):
+    path = a_star(maze, start, goal)
+    return {
+        'success': path is not None,
+        'path': _path_to_json(path),
+        'steps': len(path) if path is not None else None,
+    }
+
+
+def _paths_job(maze, queries):
+    stats = {}
+    paths = batch_paths(maze, queries, stats)
+    return {
+        'paths': [_path_to_json(path) for path in paths],
+        'steps': [len(path) if path is not None else None for path in paths],
+        'trees': stats['trees'],
+    }
+
+
+class JobServer:
+    # Servidor asyncio de JSON por linha sobre socket Unix.
+    # Mantém os labirintos já carregados em memória e executa os jobs em um pool de processos.
+    
+    def __init__(self, socket_path, workers=None, max_pending=64, cache_bytes=None):
+        self.socket_path = socket_path
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._cache = get_maze_cache()
+        if cache_bytes is not None:
+            self._cache.max_bytes = cache_bytes
+        self._pending = 0
+        # O cache não é seguro entre threads: carregamentos (fora do laço de eventos) um por vez
+        self._load_lock = threading.Lock()
+        self._executor = None
+        self._server = None
+        self._slots = None
+        # Tarefas que enviam resultados de jobs (referências fortes até terminarem)
+        self._senders = set()
+    
+    def load_maze(self, maze_file):
+        # Labirintos ficam quentes no cache do processo (chave = hash do conteúdo) e em memória
+        # compartilhada: cada job envia ao pool só o descritor e os processos anexam o mesmo bloco
+        with self._load_lock:
+            try:
+                maze = self._cache.get(maze_file)
+            except OSError:
+                raise JobError(f"Arquivo '{maze_file}' não encontrado")
+            maze.share()
+        return maze
+    
+    async def start(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        # Limita os jobs entregues ao pool: os excedentes esperam aqui e podem ser cancelados
+        self._slots = asyncio.Semaphore(self.workers)
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
+    
+    async def serve_forever(self):
+        await self.start()
+        print(f"Servidor escutando em {self.socket_path} ({self.workers} processos)")
+        
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        
+        try:
+            async with self._server:
+                await stop.wait()
+        finally:
+            self.close()
+        print("Servidor encerrado.")
+    
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._cache.release_shared()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+    
+    async def _handle_client(self, reader, writer):
+        tasks = {}
+        
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("requisição deve ser um objeto JSON")
+                except ValueError as e:
+                    await self._send(writer, {'id': None, 'status': 'error', 'error': f"JSON inválido: {e}"})
+                    continue
+                
+                request_id = request.get('id')
+                op = request.get('op')
+                
+                if not _valid_id(request_id):
+                    # Listas e objetos nem podem ser chaves de tasks: rejeitados antes de qualquer operação
+                    await self._send(writer, {'id': None, 'status': 'error',
+                                              'error': "'id' deve ser texto, inteiro ou null"})
+                    continue
+                
+                if op == 'cancel':
+                    target = request.get('target')
+                    task = tasks.get(target) if _valid_id(target) else None
+                    cancelled = task is not None and task.cancel()
+                    await self._send(writer, {'id': request_id, 'status': 'ok', 'result': {'cancelled': cancelled}})
+                elif op == 'ping':
+                    await self._send(writer, {'id': request_id, 'status': 'ok', 'result': self.stats()})
+                elif op in ('solve', 'astar', 'paths'):
+                    if request_id in tasks:
+                        await self._send(writer, {'id': request_id, 'status': 'error', 'error': 'id já está em uso'})
+                    elif self._pending >= self.max_pending:
+                        # Backpressure: rejeita em vez de enfileirar sem limite
+                        await self._send(writer, {'id': request_id, 'status': 'error', 'error': 'servidor ocupado'})
+                    else:
+                        self._pending += 1
+                        task = asyncio.create_task(self._run_job(request))
+                        tasks[request_id] = task
+                        task.add_done_callback(lambda t, rid=request_id: self._job_done(writer, tasks, rid, t))
+                else:
+                    await self._send(writer, {'id': request_id, 'status': 'error', 'error': f"operação desconhecida: {op}"})
+        except ConnectionError:
+            pass
+        finally:
+            # Cliente desconectou: cancelar os jobs que ainda não terminaram
+            for task in list(tasks.values()):
+                task.cancel()
+            writer.close()
+    
+    async def _run_job(self, request):
+        request_id = request.get('id')
+        
+        try:
+            func, args = await self._prepare_job(request)
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._executor, func, *args)
+            return {'id': request_id, 'status': 'ok', 'result': result}
+        except JobError as e:
+            return {'id': request_id, 'status': 'error', 'error': str(e)}
+        except Exception as e:
+            return {'id': request_id, 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+    
+    def _job_done(self, writer, tasks, request_id, task):
+        # Chamado ao fim de cada job, inclusive quando cancelado antes de começar.
+        # Um job já em execução no pool não é interrompido; seu resultado é descartado.
+        self._pending -= 1
+        tasks.pop(request_id, None)
+        
+        if task.cancelled():
+            response = {'id': request_id, 'status': 'cancelled'}
+        else:
+            response = task.result()
+        
+        if not writer.is_closing():
+            # O callback não pode aguardar: a resposta sai por uma tarefa que espera drain()
+            sender = asyncio.ensure_future(self._send_job_response(writer, response))
+            self._senders.add(sender)
+            sender.add_done_callback(self._senders.discard)
+    
+    async def _send_job_response(self, writer, response):
+        try:
+            await self._send(writer, response)
+        except ConnectionError:
+            # Cliente desconectou antes do resultado: nada a entregar
+            pass
+    
+    async def _prepare_job(self, request):
+        # Valida a requisição e monta (função, argumentos) para o pool.
+        # Ler, calcular o hash, interpretar e compartilhar um labirinto novo leva tempo proporcional
+        # ao arquivo: roda em uma thread para não travar o laço de eventos (e os demais clientes)
+        maze_file = request.get('maze')
+        if not maze_file:
+            raise JobError("campo 'maze' é obrigatório")
+        loop = asyncio.get_running_loop()
+        maze = await loop.run_in_executor(None, self.load_maze, maze_file)
+        
+        if request['op'] == 'astar':
+            goal = request.get('goal')
+            if goal is None:
+                raise JobError("campo 'goal' é obrigatório para 'astar'")
+            start = request.get('start')
+            start = maze.pos_E if start is None else _cell_field(maze, start, 'start')
+            return _astar_job, (maze, start, _cell_field(maze, goal, 'goal'))
+        
+        if request['op'] == 'paths':
+            # Consultas em lote: "queries" [[início, alvo], ...] ou "starts" [...] com um "goal" comum
+            queries = request.get('queries')
+            if queries is None:
+                starts, goal = request.get('starts'), request.get('goal')
+                if starts is None or goal is None:
+                    raise JobError("'paths' requer 'queries' ou 'starts' e 'goal'")
+                queries = [(start, goal) for start in starts]
+            try:
+                queries = [(start, goal) for start, goal in queries]
+            except (TypeError, ValueError):
+                raise JobError("'queries' deve ser uma lista de pares [[linha, coluna], [linha, coluna]]")
+            queries = [(_cell_field(maze, start, f'queries[{i}][0]'), _cell_field(maze, goal, f'queries[{i}][1]'))
+                       for i, (start, goal) in enumerate(queries)]
+            return _paths_job, (maze, queries)
+        
+        params = request.get('params') or {}
+        unknown = set(params) - ALLOWED_GA_PARAMS
+        if unknown:
+            raise JobError(f"parâmetros não suportados: {', '.join(sorted(unknown))}")
+        
+        ga_params = dict(SERVER_GA_PARAMS)
+        ga_params.update(params)
+        return _solve_job, (maze, ga_params, request.get('seed'))
+    
+    def stats(self):
+        return {
+            'pending': self._pending,
+            'max_pending': self.max_pending,
+            'workers': self.workers,
+            'maze_cache': self._cache.stats(),
+        }
+    
+    def _encode(self, message):
+        return (json.dumps(message, ensure_ascii=False) + "\n").encode('utf-8')
+    
+    async def _send(self, writer, message):
+        writer.write(self._encode(message))
+        await writer.drain()
+
+
+def create_parser():
+    parser = argparse.ArgumentParser(
+        description='Servidor de jobs do resolvedor de labirintos (JSON por linha em socket Unix)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Exemplo de requisição (uma por linha):
+  {"id": 1, "op": "solve", "maze": "data/caso_teste_01.txt", "seed": 42}
+  {"id": 2, "op": "astar", "maze": "data/caso_teste_01.txt", "goal": [8, 9]}
+  {"id": 3, "op": "paths", "maze": "data/caso_teste_01.txt", "starts": [[0, 0], [5, 5]], "goal": [8, 9]}
+  {"id": 4, "op": "cancel", "target": 1}
+  {"id": 5, "op": "ping"}
+        '''
+    )
+    parser.add_argument('--socket', default='/tmp/labyrinth-agent.sock', metavar='PATH',
+                       help='Caminho do socket Unix (padrão: /tmp/labyrinth-agent.sock)')
+    parser.add_argument('--workers', type=int, default=None, metavar='N',
+                       help='Número de processos do pool (padrão: número de CPUs)')
+    parser.add_argument('--max-pending', type=int, default=64, metavar='N',
+                       help='Máximo de jobs pendentes antes de rejeitar requisições')
+    parser.add_argument('--cache-mb', type=int, default=None, metavar='MB',
+                       help='Limite de memória do cache de labirintos em MB')
+    return parser
+
+
+def main():
+    args = create_parser().parse_args()
+    
+    if args.workers is not None and args.workers < 1:
+        print("ERRO: --workers deve ser >= 1")
+        sys.exit(1)
+    if args.max_pending < 1:
+        print("ERRO: --max-pending deve ser >= 1")
+        sys.exit(1)
+    if args.cache_mb is not None and args.cache_mb < 1:
+        print("ERRO: --cache-mb deve ser >= 1")
+        sys.exit(1)
+    
+    cache_bytes = args.cache_mb * 1024 * 1024 if args.cache_mb is not None else None
+    server = JobServer(args.socket, args.workers, args.max_pending, cache_bytes)
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,14 @@
+from array import array
+from collections import deque
+from itertools import compress
+
+
+# Labirintos anexados neste processo (nome do bloco -> Maze): desserializar o mesmo labirinto
+# de novo (um job por requisição no pool) reaproveita o anexo e as estruturas já calculadas
+_ATTACHED = {}
+MAX_ATTACHED = 8
+
+
 class Maze:
     # Representação do labirinto com 8 direções
     
@@ -14,53 +25,420 @@ class Maze:
     
     DIRECTION_NAMES = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
     
-    def __init__(self, n, grid, pos_E, pos_S):
-        # Inicializa labirinto
-        self.n = n
-        self.grid = grid
+    # Códigos do plano de células (parede/borda = 0, então "livre" é qualquer valor não nulo)
+    WALL = 0
+    FREE = 1
+    ENTRY = 2
+    EXIT = 3
+    
+    CELL_CODES = {'1': WALL, '0': FREE, 'E': ENTRY, 'S': EXIT}
+    CELL_SYMBOLS = '10ES'
+    
+    def __init__(self, rows, cols, grid, pos_E, pos_S, costs=None):
+        # Inicializa labirinto (rows x cols; não precisa ser quadrado).
+        # costs: custo de terreno opcional por célula (linhas de inteiros 1-255).
+        # A grade só é usada para montar o plano de células; maze.grid a reconstrói sob demanda.
+        self._init_plane(rows, cols, pos_E, pos_S)
+        self.cells = bytearray(self.size)
+        codes = self.CELL_CODES
+        for linha, row in enumerate(grid):
+            base = (linha + 1) * self.stride + 1
+            self.cells[base:base + cols] = bytes(codes[cell] for cell in row)
+        
+        if costs is not None:
+            self.set_costs(costs)
+    
+    def _init_plane(self, rows, cols, pos_E, pos_S):
+        self.rows = rows
+        self.cols = cols
         self.pos_E = pos_E
         self.pos_S = pos_S
+        self._grid = None
+        
+        # Plano achatado com uma borda de paredes: índice (linha + 1) * stride + (coluna + 1).
+        # Todo vizinho de uma célula interna existe no plano, então move/neighbors e os laços
+        # das buscas não precisam verificar limites. As estruturas derivadas usam o mesmo índice.
+        self.stride = cols + 2
+        self.size = (rows + 2) * self.stride
+        self.offsets = [delta_linha * self.stride + delta_coluna for delta_linha, delta_coluna in self.DIRECTIONS]
+        
+        # (deslocamento, delta_linha, delta_coluna, custo) por direção, para neighbors()
+        self._steps = [(offset, delta_linha, delta_coluna, 1.0 if delta_linha == 0 or delta_coluna == 0 else 1.4)
+                       for offset, (delta_linha, delta_coluna) in zip(self.offsets, self.DIRECTIONS)]
+        
+        # Plano de custos de terreno (uint8, mesmo índice); None = terreno uniforme (custo 1)
+        self.costs = None
+        
+        # Estruturas derivadas, calculadas sob demanda e mantidas junto do labirinto
+        self._uniform_costs = None
+        self._neighbor_masks = None
+        self._exit_mask = None
+        self._components = None
+        self._distance_fields = {}
+        
+        # Memória compartilhada (share/attach): (SharedMemory, descritor, finalizador do dono), ou None
+        self._shared = None
+    
+    @property
+    def grid(self):
+        # Grade como lista de linhas de caracteres ('1', '0', 'E', 'S'), decodificada do plano de
+        # células no primeiro acesso (só visualização e gravação de arquivos precisam dela)
+        if self._grid is None:
+            symbols = self.CELL_SYMBOLS
+            self._grid = []
+            for linha in range(self.rows):
+                base = self.index(linha, 0)
+                self._grid.append([symbols[cell] for cell in self.cells[base:base + self.cols]])
+        return self._grid
+    
+    def grid_nbytes(self):
+        # Memória da grade decodificada (0 enquanto não foi pedida)
+        if self._grid is None:
+            return 0
+        import sys
+        return sys.getsizeof(self._grid) + sum(sys.getsizeof(row) for row in self._grid)
+    
+    def index(self, linha, coluna):
+        # Índice da célula no plano com borda
+        return (linha + 1) * self.stride + coluna + 1
+    
+    def position(self, index):
+        # (linha, coluna) de um índice do plano com borda
+        linha, coluna = divmod(index, self.stride)
+        return (linha - 1, coluna - 1)
     
     def is_valid(self, linha, coluna):
         # Verifica se posição está dentro dos limites
-        return 0 <= linha < self.n and 0 <= coluna < self.n
+        return 0 <= linha < self.rows and 0 <= coluna < self.cols
     
     def is_free(self, linha, coluna):
-        # Verifica se célula é livre (não parede)
+        # Verifica se célula é livre (não parede); aceita qualquer coordenada
         if not self.is_valid(linha, coluna):
             return False
-        return self.grid[linha][coluna] in ['0', 'E', 'S']
+        return self.cells[(linha + 1) * self.stride + coluna + 1] != self.WALL
     
     def get_cell(self, linha, coluna):
         # Retorna valor da célula
         if not self.is_valid(linha, coluna):
             return None
-        return self.grid[linha][coluna]
+        return self.CELL_SYMBOLS[self.cells[(linha + 1) * self.stride + coluna + 1]]
     
     def neighbors(self, linha, coluna):
-        # Retorna vizinhos válidos com custos (1.0 ortogonal, 1.4 diagonal)
-        result = []
-        
-        for i, (delta_linha, delta_coluna) in enumerate(self.DIRECTIONS):
-            nova_linha = linha + delta_linha
-            nova_coluna = coluna + delta_coluna
-            
-            if self.is_free(nova_linha, nova_coluna):
-                cost = 1.0 if (delta_linha == 0 or delta_coluna == 0) else 1.4
-                result.append((nova_linha, nova_coluna, cost))
-        
-        return result
+        # Retorna vizinhos válidos com custos (1.0 ortogonal, 1.4 diagonal).
+        # Dentro do labirinto a borda do plano faz o papel dos limites; fora dele (o índice
+        # cairia em outra linha ou fora do plano), cada vizinho é conferido por is_free.
+        if not (0 <= linha < self.rows and 0 <= coluna < self.cols):
+            return [(linha + delta_linha, coluna + delta_coluna, cost)
+                    for _, delta_linha, delta_coluna, cost in self._steps
+                    if self.is_free(linha + delta_linha, coluna + delta_coluna)]
+        cells = self.cells
+        index = (linha + 1) * self.stride + coluna + 1
+        return [(linha + delta_linha, coluna + delta_coluna, cost)
+                for offset, delta_linha, delta_coluna, cost in self._steps if cells[index + offset]]
     
     def move(self, linha, coluna, direction):
         # Move para direção (0-7). Retorna (nova_linha, nova_coluna) ou None
-        if direction < 0 or direction >= len(self.DIRECTIONS):
+        if not 0 <= direction < 8:
+            return None
+        if not (0 <= linha < self.rows and 0 <= coluna < self.cols):
+            delta_linha, delta_coluna = self.DIRECTIONS[direction]
+            if self.is_free(linha + delta_linha, coluna + delta_coluna):
+                return (linha + delta_linha, coluna + delta_coluna)
             return None
+        if self.cells[(linha + 1) * self.stride + coluna + 1 + self.offsets[direction]]:
+            delta_linha, delta_coluna = self.DIRECTIONS[direction]
+            return (linha + delta_linha, coluna + delta_coluna)
+        return None
+    
+    def require_free(self, position, role):
+        # Valida uma extremidade de busca na fronteira da API: o índice do plano de uma posição
+        # fora dos limites cairia em outra linha (ou fora do plano), então nada é assumido
+        linha, coluna = position
+        if not self.is_free(linha, coluna):
+            where = "parede" if self.is_valid(linha, coluna) else f"fora do labirinto {self.rows}x{self.cols}"
+            raise ValueError(f"{role} {tuple(position)} inválido: {where}")
+    
+    def set_cell(self, linha, coluna, value):
+        # Altera uma célula livre/parede ('0' ou '1') mantendo coerentes o plano e as máscaras já calculadas.
+        # Componentes e campos de distância são descartados. Labirintos do cache (load_maze) são
+        # compartilhados: edite uma cópia se o mesmo arquivo ainda for resolvido sem as alterações.
+        if value not in ('0', '1'):
+            raise ValueError(f"Valor de célula inválido: {value!r} (use '0' ou '1')")
+        if self._shared is not None:
+            raise ValueError("Labirinto em memória compartilhada é somente leitura")
+        current = self.get_cell(linha, coluna)
+        if current is None:
+            raise ValueError(f"Célula {(linha, coluna)} fora do labirinto {self.rows}x{self.cols}")
+        if current in ('E', 'S'):
+            raise ValueError(f"Entrada e saída não podem ser alteradas: {(linha, coluna)}")
+        if current == value:
+            return
+        
+        if self._grid is not None:
+            self._grid[linha][coluna] = value
+        index = self.index(linha, coluna)
+        free = value == '0'
+        self.cells[index] = self.CELL_CODES[value]
+        
+        if self._neighbor_masks is not None:
+            masks = self._neighbor_masks
+            cells = self.cells
+            mask = 0
+            for i, offset in enumerate(self.offsets):
+                neighbor = index + offset
+                if not cells[neighbor]:
+                    continue
+                # Bit da direção oposta (i + 4) na máscara do vizinho
+                if free:
+                    mask |= 1 << i
+                    masks[neighbor] |= 1 << ((i + 4) % 8)
+                else:
+                    masks[neighbor] &= ~(1 << ((i + 4) % 8))
+            masks[index] = mask
+        
+        self._components = None
+        self._distance_fields = {}
+    
+    def toggle_cell(self, linha, coluna):
+        # Alterna parede/livre e retorna o novo valor
+        value = '0' if self.get_cell(linha, coluna) == '1' else '1'
+        self.set_cell(linha, coluna, value)
+        return value
+    
+    def set_costs(self, costs):
+        # Define o custo de terreno de cada célula (1-255): entrar na célula custa
+        # custo x 10 em movimento ortogonal e custo x 14 na diagonal (ver bucket_search)
+        if self._shared is not None:
+            raise ValueError("Labirinto em memória compartilhada é somente leitura")
+        if len(costs) != self.rows:
+            raise ValueError(f"Custos com {len(costs)} linhas (esperado {self.rows})")
+        plane = bytearray(b'\x01') * self.size
+        for linha, row in enumerate(costs):
+            if len(row) != self.cols:
+                raise ValueError(f"Linha {linha + 1} dos custos tem {len(row)} valores (esperado {self.cols})")
+            if min(row) < 1 or max(row) > 255:
+                raise ValueError(f"Custos da linha {linha + 1} fora do intervalo 1-255")
+            base = self.index(linha, 0)
+            plane[base:base + self.cols] = bytes(row)
+        self.costs = plane
+    
+    def cost_plane(self):
+        # Plano de custos de terreno; um plano uniforme (todo 1) quando o labirinto não tem custos
+        if self.costs is not None:
+            return self.costs
+        if self._uniform_costs is None:
+            self._uniform_costs = bytearray(b'\x01') * self.size
+        return self._uniform_costs
+    
+    def cost_range(self):
+        # (menor, maior) custo de terreno entre as células livres
+        if self.costs is None:
+            return 1, 1
+        # compress filtra pelas células livres sem materializar uma lista do tamanho do plano
+        values = set(compress(self.costs, self.cells))
+        return (min(values), max(values)) if values else (1, 1)
+    
+    def neighbor_masks(self):
+        # Máscara de 8 bits por célula (índice do plano com borda): bit i ligado se a direção i é livre
+        if self._neighbor_masks is None:
+            cells = self.cells
+            masks = bytearray(self.size)
+            offsets = list(enumerate(self.offsets))
+            for linha in range(self.rows):
+                base = self.index(linha, 0)
+                for index in range(base, base + self.cols):
+                    if not cells[index]:
+                        continue
+                    mask = 0
+                    for i, offset in offsets:
+                        if cells[index + offset]:
+                            mask |= 1 << i
+                    masks[index] = mask
+            self._neighbor_masks = masks
+        return self._neighbor_masks
+    
+    def free_mask(self):
+        # Não nulo nas células livres ('0', 'E', 'S'), 0 nas paredes e na borda (o próprio plano de células)
+        return self.cells
+    
+    def exit_mask(self):
+        # 1 nas células de saída ('S'), 0 nas demais (índice do plano com borda)
+        if self._exit_mask is None:
+            exit_code = self.EXIT
+            self._exit_mask = bytearray(1 if cell == exit_code else 0 for cell in self.cells)
+        return self._exit_mask
+    
+    def connected_components(self):
+        # Rótulo do componente 8-conexo de cada célula livre (-1 para paredes e borda)
+        if self._components is None:
+            cells = self.cells
+            masks = self.neighbor_masks()
+            offsets = list(enumerate(self.offsets))
+            labels = array('i', [-1]) * self.size
+            label = 0
+            
+            for start in range(self.size):
+                if labels[start] != -1 or not cells[start]:
+                    continue
+                labels[start] = label
+                queue = deque([start])
+                while queue:
+                    index = queue.popleft()
+                    mask = masks[index]
+                    for i, offset in offsets:
+                        if mask >> i & 1 and labels[index + offset] == -1:
+                            labels[index + offset] = label
+                            queue.append(index + offset)
+                label += 1
+            
+            self._components = labels
+        return self._components
+    
+    def distance_field(self, target):
+        # Distância em passos (BFS 8-conexo) de cada célula até target (-1 se inalcançável)
+        field = self._distance_fields.get(target)
+        if field is None:
+            masks = self.neighbor_masks()
+            offsets = list(enumerate(self.offsets))
+            field = array('i', [-1]) * self.size
+            start = self.index(*target)
+            field[start] = 0
+            queue = deque([start])
+            
+            while queue:
+                index = queue.popleft()
+                mask = masks[index]
+                next_distance = field[index] + 1
+                for i, offset in offsets:
+                    if mask >> i & 1 and field[index + offset] == -1:
+                        field[index + offset] = next_distance
+                        queue.append(index + offset)
+            
+            self._distance_fields[target] = field
+        return field
+    
+    def derived_nbytes(self):
+        # Memória ocupada pelo plano de células e pelas estruturas derivadas já calculadas
+        total = len(self.cells)
+        total += len(self.costs) if self.costs is not None else 0
+        total += len(self._uniform_costs) if self._uniform_costs is not None else 0
+        total += len(self._neighbor_masks) if self._neighbor_masks is not None else 0
+        total += len(self._exit_mask) if self._exit_mask is not None else 0
+        if self._components is not None:
+            total += self._components.itemsize * len(self._components)
+        for field in self._distance_fields.values():
+            total += field.itemsize * len(field)
+        return total
+    
+    def share(self):
+        # Move o plano de células, os custos e as máscaras (vizinhança e saída) para um único bloco
+        # de multiprocessing.shared_memory e retorna o descritor (dict pequeno e piclável).
+        # A partir daí o labirinto é somente leitura e serializá-lo (pickle, pool de processos)
+        # envia só o descritor: cada processo anexa o mesmo bloco em O(1), sem copiar a grade.
+        # O bloco é removido quando este Maze é coletado (ou em release_shared).
+        if self._shared is not None:
+            return self._shared[1]
+        
+        from multiprocessing import shared_memory
         
-        delta_linha, delta_coluna = self.DIRECTIONS[direction]
-        nova_linha = linha + delta_linha
-        nova_coluna = coluna + delta_coluna
+        planes = [('cells', self.cells)]
+        if self.costs is not None:
+            planes.append(('costs', self.costs))
+        planes.append(('neighbor_masks', self.neighbor_masks()))
+        planes.append(('exit_mask', self.exit_mask()))
+        
+        block = shared_memory.SharedMemory(create=True, size=self.size * len(planes))
+        handle = {
+            'name': block.name,
+            'rows': self.rows,
+            'cols': self.cols,
+            'pos_E': self.pos_E,
+            'pos_S': self.pos_S,
+            'planes': [name for name, _ in planes],
+        }
+        for i, (_, plane) in enumerate(planes):
+            block.buf[i * self.size:(i + 1) * self.size] = plane
+        
+        self._bind_shared(block, handle, owner=True)
+        return handle
+    
+    @classmethod
+    def attach(cls, handle):
+        # Labirinto sobre um bloco criado por share() em outro processo: nenhuma cópia dos planos.
+        # Em Python < 3.13 o anexo é registrado no resource_tracker do processo; processos filhos
+        # do dono (pool de processos) compartilham o dele, então o bloco não é removido ao saírem.
+        maze = _ATTACHED.get(handle['name'])
+        if maze is not None:
+            return maze
         
-        if self.is_free(nova_linha, nova_coluna):
-            return (nova_linha, nova_coluna)
+        from multiprocessing import shared_memory
+        import sys
+        if sys.version_info >= (3, 13):
+            block = shared_memory.SharedMemory(name=handle['name'], track=False)
+        else:
+            block = shared_memory.SharedMemory(name=handle['name'])
         
-        return None
\ No newline at end of file
+        maze = cls.__new__(cls)
+        maze._init_plane(handle['rows'], handle['cols'], tuple(handle['pos_E']), tuple(handle['pos_S']))
+        maze._bind_shared(block, handle, owner=False)
+        
+        if len(_ATTACHED) >= MAX_ATTACHED:
+            _ATTACHED.pop(next(iter(_ATTACHED))).release_shared()
+        _ATTACHED[handle['name']] = maze
+        return maze
+    
+    def _bind_shared(self, block, handle, owner):
+        # Planos viram fatias (memoryview) do bloco; anexos são somente leitura
+        base = block.buf if owner else block.buf.toreadonly()
+        views = [base[i * self.size:(i + 1) * self.size] for i in range(len(handle['planes']))]
+        planes = dict(zip(handle['planes'], views))
+        self.cells = planes['cells']
+        self.costs = planes.get('costs')
+        self._neighbor_masks = planes['neighbor_masks']
+        self._exit_mask = planes['exit_mask']
+        
+        # O finalizador solta as fatias antes de fechar o bloco (e o remove, se for o dono)
+        if not owner:
+            views.append(base)
+        import weakref
+        finalizer = weakref.finalize(self, _destroy_block, block, views, owner)
+        self._shared = (block, handle, finalizer)
+    
+    def release_shared(self):
+        # Copia os planos de volta para a memória do processo e solta o bloco (o dono também o remove)
+        if self._shared is None:
+            return
+        _, handle, finalizer = self._shared
+        self.cells = bytearray(self.cells)
+        self.costs = bytearray(self.costs) if self.costs is not None else None
+        self._neighbor_masks = bytearray(self._neighbor_masks)
+        self._exit_mask = bytearray(self._exit_mask)
+        self._shared = None
+        if _ATTACHED.get(handle['name']) is self:
+            del _ATTACHED[handle['name']]
+        finalizer()
+    
+    def __reduce_ex__(self, protocol):
+        # Labirinto compartilhado: serializa só o descritor (o processo de destino chama attach)
+        if self._shared is not None:
+            return (Maze.attach, (self._shared[1],))
+        return super().__reduce_ex__(protocol)
+
+
+def _destroy_block(block, views, unlink):
+    # Solta as fatias, fecha o bloco neste processo e, no dono, o remove do sistema.
+    # Uma fatia ainda exportada em outro lugar impede o close; o unlink vale mesmo assim.
+    for view in views:
+        try:
+            view.release()
+        except BufferError:
+            pass
+    try:
+        block.close()
+    except BufferError:
+        pass
+    if unlink:
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
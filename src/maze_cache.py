@@ -0,0 +1,107 @@
+import os
+from collections import OrderedDict
+from parser import parse_maze_lines
+from maze import Maze
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class MazeCache:
+    # Cache LRU de labirintos já interpretados, chaveado pelo hash do conteúdo do arquivo.
+    # O mtime (e tamanho) de cada caminho evita reler/recalcular o hash quando o arquivo não mudou;
+    # arquivos com o mesmo conteúdo compartilham o mesmo Maze e suas estruturas derivadas.
+    
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # digest -> [maze, nbytes]
+        self._files = {}               # caminho -> (mtime_ns, tamanho, digest)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, maze_file):
+        # Retorna o Maze do arquivo, interpretando-o apenas se o conteúdo ainda não estiver no cache
+        stat = os.stat(maze_file)
+        path = os.path.abspath(maze_file)
+        known = self._files.get(path)
+        
+        content = None
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            digest = known[2]
+        else:
+            import hashlib  # adiado para não pesar na inicialização do CLI
+            with open(maze_file, 'rb') as f:
+                content = f.read()
+            digest = hashlib.sha256(content).hexdigest()
+            self._files[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        
+        entry = self._entries.get(digest)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(digest)
+        else:
+            self.misses += 1
+            if content is None:
+                with open(maze_file, 'rb') as f:
+                    content = f.read()
+            rows, cols, grid, pos_E, pos_S, costs = parse_maze_lines(content.decode('utf-8').splitlines())
+            entry = [Maze(rows, cols, grid, pos_E, pos_S, costs), 0]
+            self._entries[digest] = entry
+        
+        # As estruturas derivadas crescem depois da inserção, então o tamanho é reavaliado a cada acesso
+        self._update_size(entry)
+        self._evict(keep=digest)
+        return entry[0]
+    
+    def _update_size(self, entry):
+        nbytes = estimate_maze_bytes(entry[0])
+        self.total_bytes += nbytes - entry[1]
+        entry[1] = nbytes
+    
+    def _evict(self, keep):
+        # Remove os menos usados recentemente até respeitar o limite (nunca o recém-acessado)
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            digest, (maze, nbytes) = next(iter(self._entries.items()))
+            if digest == keep:
+                break
+            del self._entries[digest]
+            self.total_bytes -= nbytes
+            self._files = {path: info for path, info in self._files.items() if info[2] != digest}
+    
+    def release_shared(self):
+        # Solta os blocos de memória compartilhada dos labirintos em cache (encerramento do servidor)
+        for maze, _ in self._entries.values():
+            maze.release_shared()
+    
+    def clear(self):
+        self._entries.clear()
+        self._files.clear()
+        self.total_bytes = 0
+    
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+def estimate_maze_bytes(maze):
+    # Estimativa da memória do Maze: grade (se já decodificada) + plano e estruturas derivadas
+    return maze.grid_nbytes() + maze.derived_nbytes()
+
+
+# Cache compartilhado pelo processo (simulação, servidor e modos em lote)
+_shared_cache = MazeCache()
+
+
+def get_maze_cache():
+    return _shared_cache
+
+
+def load_maze(maze_file):
+    # Carrega o labirinto através do cache do processo
+    return _shared_cache.get(maze_file)
@@ -0,0 +1,58 @@
+import random
+from maze import Maze
+
+
+def generate_maze(n, wall_density=0.3, seed=None, cols=None):
+    # Gera um labirinto n x n (ou n x cols) com paredes aleatórias e um corredor garantido de E até S.
+    # E fica no canto superior esquerdo e S em uma célula sorteada na metade oposta.
+    rows = n
+    cols = cols if cols is not None else n
+    rng = random.Random(seed)
+    grid = [['1' if rng.random() < wall_density else '0' for _ in range(cols)] for _ in range(rows)]
+    
+    pos_E = (0, 0)
+    pos_S = (rng.randrange(rows // 2, rows), rng.randrange(cols // 2, cols))
+    if pos_S == pos_E:
+        pos_S = (rows - 1, cols - 1)
+    
+    # Escava um passeio aleatório tendendo a S para garantir que a saída é alcançável
+    linha, coluna = pos_E
+    while (linha, coluna) != pos_S:
+        grid[linha][coluna] = '0'
+        delta_linha = (pos_S[0] > linha) - (pos_S[0] < linha)
+        delta_coluna = (pos_S[1] > coluna) - (pos_S[1] < coluna)
+        choice = rng.random()
+        if choice < 0.4 and delta_linha:
+            linha += delta_linha
+        elif choice < 0.8 and delta_coluna:
+            coluna += delta_coluna
+        else:
+            linha += delta_linha
+            coluna += delta_coluna
+    
+    grid[pos_E[0]][pos_E[1]] = 'E'
+    grid[pos_S[0]][pos_S[1]] = 'S'
+    return Maze(rows, cols, grid, pos_E, pos_S)
+
+
+def add_terrain_costs(maze, max_cost=9, seed=None):
+    # Sorteia custos de terreno por célula: metade custa 1, as demais de 1 a max_cost
+    rng = random.Random(seed)
+    costs = [[1 if rng.random() < 0.5 else rng.randint(1, max_cost) for _ in range(maze.cols)]
+             for _ in range(maze.rows)]
+    maze.set_costs(costs)
+    return maze
+
+
+def write_maze_file(path, maze):
+    # Grava o labirinto no formato lido por parse_maze_file (com a seção de custos, se houver)
+    with open(path, 'w') as f:
+        f.write(f"{maze.rows}\n" if maze.rows == maze.cols else f"{maze.rows} {maze.cols}\n")
+        for row in maze.grid:
+            f.write("".join(row) + "\n")
+        if maze.costs is not None:
+            f.write("custos\n")
+            for linha in range(maze.rows):
+                base = maze.index(linha, 0)
+                f.write(" ".join(map(str, maze.costs[base:base + maze.cols])) + "\n")
+    return path
@@ -31,21 +31,23 @@ def format_detail_value(key, value):
         return f"{key_display}: {value}"
 
 
-def write_phase_details(f, details, indent="         - "):
+def format_phase_details(details, indent="         - "):
     if not details:
-        return
+        return ""
     
-    f.write("\n")
-    for key, value in details.items():
-        formatted = format_detail_value(key, value)
-        f.write(f"{indent}{formatted}\n")
+    lines = [f"{indent}{format_detail_value(key, value)}\n" for key, value in details.items()]
+    return "\n" + "".join(lines)
+
+
+def write_phase_details(f, details, indent="         - "):
+    f.write(format_phase_details(details, indent))
 
 
 def write_phase_log(f, phase):
-    f.write(f"[FASE] {phase['phase']}\n")
-    f.write(f"       {phase['description']}\n")
-    write_phase_details(f, phase.get('details', {}))
-    f.write("\n")
+    # Monta o bloco inteiro da fase e escreve de uma vez
+    f.write(f"[FASE] {phase['phase']}\n"
+            f"       {phase['description']}\n"
+            f"{format_phase_details(phase.get('details', {}))}\n")
 
 
 def write_generation_header(f, generation, width=80):
@@ -79,10 +81,30 @@ def format_path(path, max_per_line=8):
     if not path:
         return "(vazio)"
     
+    # Decodifica o caminho compacto apenas aqui, na formatação
     path_str = " -> ".join([f"{pos}" for pos in path])
     return path_str
 
 
+def write_path(f, path, chunk_positions=4096):
+    # Como format_path, mas escreve em blocos para não montar uma string gigante por caminho
+    if not path:
+        f.write("(vazio)")
+        return
+    
+    chunk = []
+    separator = ""
+    for pos in path:
+        chunk.append(f"{pos}")
+        if len(chunk) == chunk_positions:
+            f.write(separator + " -> ".join(chunk))
+            chunk = []
+            separator = " -> "
+    
+    if chunk:
+        f.write(separator + " -> ".join(chunk))
+
+
 def write_ga_parameters(f, chromosome_length):
     params = {
         "Tamanho da População": 100,
@@ -119,37 +141,39 @@ def format_chromosome(chromosome, max_genes=20):
 
 def write_population_details(f, population_data, generation):
     """Escreve detalhes completos da população de uma geração."""
-    f.write(f"\n{'='*100}\n")
-    f.write(f"DETALHES DA POPULAÇÃO - GERAÇÃO {generation}\n")
-    f.write(f"{'='*100}\n\n")
-    
-    # Cabeçalho
-    f.write(f"{'ID':<6} {'Fitness':<15} {'Posição':<15} {'Passos':<8} {'Células':<10} {'Cromossomo (primeiros/últimos genes)'}\n")
-    f.write("-" * 100 + "\n")
+    # Cada linha é formatada em uma lista e a seção inteira sai em uma única escrita
+    lines = [
+        f"\n{'='*100}\n",
+        f"DETALHES DA POPULAÇÃO - GERAÇÃO {generation}\n",
+        f"{'='*100}\n\n",
+        f"{'ID':<6} {'Fitness':<15} {'Posição':<15} {'Passos':<8} {'Células':<10} {'Cromossomo (primeiros/últimos genes)'}\n",
+        "-" * 100 + "\n",
+    ]
     
     # Ordenar por fitness (melhor primeiro)
     sorted_pop = sorted(population_data, key=lambda x: x['fitness'], reverse=True)
     
     for i, individual in enumerate(sorted_pop):
         marker = "[★] " if i == 0 else "    "
-        f.write(f"{marker}")
-        f.write(f"{individual['id']:<3} ")
-        f.write(f"{individual['fitness']:<15.2f} ")
-        f.write(f"{str(individual['position']):<15} ")
-        f.write(f"{individual['path_length']:<8} ")
-        f.write(f"{individual['unique_cells']:<10} ")
-        f.write(f"{format_chromosome(individual['chromosome'])}\n")
-    
-    f.write("\n")
+        lines.append(
+            f"{marker}{individual['id']:<3} "
+            f"{individual['fitness']:<15.2f} "
+            f"{str(individual['position']):<15} "
+            f"{individual['path_length']:<8} "
+            f"{individual['unique_cells']:<10} "
+            f"{format_chromosome(individual['chromosome'])}\n"
+        )
     
     # Estatísticas resumidas
     fitnesses = [ind['fitness'] for ind in population_data]
-    f.write("ESTATÍSTICAS DA POPULAÇÃO:\n")
-    f.write(f"  - Melhor Fitness: {max(fitnesses):.2f}\n")
-    f.write(f"  - Pior Fitness: {min(fitnesses):.2f}\n")
-    f.write(f"  - Fitness Médio: {sum(fitnesses)/len(fitnesses):.2f}\n")
-    f.write(f"  - Total de Indivíduos: {len(population_data)}\n")
-    f.write(f"  - Soluções Válidas (fitness > 0): {sum(1 for f in fitnesses if f > 0)}\n")
-    f.write(f"  - Encontraram Saída (fitness >= 10000): {sum(1 for f in fitnesses if f >= 10000)}\n")
-    f.write("\n")
-
+    lines.append("\n")
+    lines.append("ESTATÍSTICAS DA POPULAÇÃO:\n")
+    lines.append(f"  - Melhor Fitness: {max(fitnesses):.2f}\n")
+    lines.append(f"  - Pior Fitness: {min(fitnesses):.2f}\n")
+    lines.append(f"  - Fitness Médio: {sum(fitnesses)/len(fitnesses):.2f}\n")
+    lines.append(f"  - Total de Indivíduos: {len(population_data)}\n")
+    lines.append(f"  - Soluções Válidas (fitness > 0): {sum(1 for fit in fitnesses if fit > 0)}\n")
+    lines.append(f"  - Encontraram Saída (fitness >= 10000): {sum(1 for fit in fitnesses if fit >= 10000)}\n")
+    lines.append("\n")
+    
+    f.write("".join(lines))
@@ -1,5 +1,63 @@
 from output_formatter import *
-from visualizer import create_visual_output
+from visualizer import create_visual_output, visualize_heatmap
+
+
+REPORT_CHUNK_SIZE = 1024 * 1024
+REPORT_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+class ChunkedReportWriter:
+    # Acumula os pequenos f.write() das funções de relatório em uma lista
+    # e só repassa ao arquivo blocos de ~chunk_size caracteres (um join por bloco)
+    
+    def __init__(self, f, chunk_size=REPORT_CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._parts = []
+        self._pending = 0
+        self.chars_written = 0
+    
+    def write(self, text):
+        size = len(text)
+        if size >= self._chunk_size:
+            # Seções já montadas em uma string grande vão direto, sem cópia extra
+            self.flush()
+            self._file.write(text)
+            self.chars_written += size
+            return size
+        
+        self._parts.append(text)
+        self._pending += size
+        if self._pending >= self._chunk_size:
+            self.flush()
+        return size
+    
+    def flush(self):
+        if self._parts:
+            self._file.write("".join(self._parts))
+            self.chars_written += self._pending
+            self._parts = []
+            self._pending = 0
+    
+    def close(self):
+        self.flush()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def open_report(path, compress=False, chunk_size=REPORT_CHUNK_SIZE):
+    # Abre o relatório com buffer grande (ou gzip) por trás do escritor em blocos
+    if compress:
+        import gzip
+        raw = gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+    else:
+        raw = open(path, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE)
+    return ChunkedReportWriter(raw, chunk_size)
 
 
 def write_header(f, maze_file, maze, ga_results):
@@ -8,7 +66,7 @@ def write_header(f, maze_file, maze, ga_results):
     write_section(f, "RELATÓRIO COMPLETO - RESOLUÇÃO DO LABIRINTO")
     f.write(f"Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
     f.write(f"Arquivo: {maze_file}\n")
-    f.write(f"Dimensão do labirinto: {maze.n} x {maze.n}\n")
+    f.write(f"Dimensão do labirinto: {maze.rows} x {maze.cols}\n")
     f.write(f"Entrada (E): {maze.pos_E}\n")
     f.write(f"Saída (S): {ga_results['s_position']}\n\n")
 
@@ -79,32 +137,33 @@ def write_generation_evolution(f, generation_details):
     widths = [6, 12, 12, 12, 12, 12, 8, 8, 15, 6]
     
     # Escrever cabeçalho
-    for header, width in zip(headers, widths):
-        f.write(f"{header:<{width}}")
-    f.write("\n")
-    f.write("-" * 80 + "\n")
+    lines = ["".join(f"{header:<{width}}" for header, width in zip(headers, widths)) + "\n",
+             "-" * 80 + "\n"]
     
-    # Escrever dados
+    # Escrever dados (uma linha formatada por geração, tabela escrita de uma vez)
     for detail in generation_details:
-        f.write(f"{detail['generation']:<6} ")
-        f.write(f"{detail['best_fitness_generation']:<12.2f} ")
-        f.write(f"{detail['best_fitness_global']:<12.2f} ")
-        f.write(f"{detail['avg_fitness']:<12.2f} ")
-        f.write(f"{detail['min_fitness']:<12.2f} ")
-        f.write(f"{detail['max_fitness']:<12.2f} ")
-        f.write(f"{detail['diversity']*100:<7.1f}% ")
-        f.write(f"{detail['valid_paths']:<8} ")
-        f.write(f"{str(detail['best_position']):<15} ")
-        f.write(f"{detail['path_length']:<6}\n")
+        lines.append(
+            f"{detail['generation']:<6} "
+            f"{detail['best_fitness_generation']:<12.2f} "
+            f"{detail['best_fitness_global']:<12.2f} "
+            f"{detail['avg_fitness']:<12.2f} "
+            f"{detail['min_fitness']:<12.2f} "
+            f"{detail['max_fitness']:<12.2f} "
+            f"{detail['diversity']*100:<7.1f}% "
+            f"{detail['valid_paths']:<8} "
+            f"{str(detail['best_position']):<15} "
+            f"{detail['path_length']:<6}\n"
+        )
         
         # Destacar quando encontrou a solução
         if detail['best_fitness_generation'] >= 10000.0:
-            f.write("-" * 80 + "\n")
-            f.write(">>> SAÍDA ENCONTRADA NESTA GERAÇÃO! <<<\n")
-            f.write("-" * 80 + "\n")
+            lines.append("-" * 80 + "\n")
+            lines.append(">>> SAÍDA ENCONTRADA NESTA GERAÇÃO! <<<\n")
+            lines.append("-" * 80 + "\n")
             break
     
-    f.write("\n")
+    lines.append("\n")
+    f.write("".join(lines))
 
 
 def write_all_populations(f, generation_details):
@@ -128,9 +187,33 @@ def write_all_populations(f, generation_details):
                 break
 
 
+def write_explorer_section(f, results):
+    write_section(f, "FASE 1: EXPLORAÇÃO DE FRONTEIRA - DESCOBERTA DA SAÍDA")
+    
+    write_subsection(f, "ESTRATÉGIA:")
+    write_parameters(f, {
+        "Método": "Fronteira mais próxima (agente só observa as células que visita)",
+        "Observação": "Conteúdo da célula atual + paredes das 8 vizinhas",
+        "Próximo alvo": "Vizinha não visitada ou, sem nenhuma, busca em largura pelas células visitadas",
+        "Caminho": "Células na ordem da primeira visita, sem os trechos de volta",
+    })
+    
+    write_subsection(f, "RESULTADO:")
+    f.write(f"  [OK] Saída encontrada em {results['s_position']}\n")
+    f.write(f"  Passos de exploração: {results['steps']}\n")
+    f.write(f"  Células visitadas: {results['cells_visited']}\n")
+    f.write(f"  Células observadas: {results['cells_observed']}\n")
+    f.write(f"  Tamanho do caminho até a saída: {len(results['path'])} passos\n\n")
+    
+    write_subsection(f, "CAMINHO ENCONTRADO PELA EXPLORAÇÃO:")
+    write_path(f, results['path'])
+    f.write("\n\n")
+
+
 def write_ga_path(f, path):
     write_subsection(f, "CAMINHO ENCONTRADO PELO AG:")
-    f.write(format_path(path) + "\n\n")
+    write_path(f, path)
+    f.write("\n\n")
 
 
 def write_elitism_analysis(f, generation_details):
@@ -138,41 +221,105 @@ def write_elitism_analysis(f, generation_details):
     # Análise pode ser expandida aqui se necessário
 
 
-def write_astar_section(f, optimal_path):
+def write_shortening_section(f, shortening):
+    write_section(f, "PÓS-OTIMIZAÇÃO DO CAMINHO DESCOBERTO")
+    
+    write_subsection(f, "ESTRATÉGIA:")
+    write_parameters(f, {
+        "Remoção de ciclos": "Mapa da última visita de cada célula (corta o trecho ao revisitar)",
+        "Linha de visada": "Salta para a célula mais distante visível em linha reta entre as próximas 12",
+        "Atalhos": "Pilha: remove a célula intermediária quando a anterior é vizinha da seguinte",
+        "Custo": "Linear no comprimento do caminho",
+    })
+    
+    write_subsection(f, "RESULTADO:")
+    f.write(f"  Passos antes: {shortening['original_steps']}\n")
+    f.write(f"  Células removidas em ciclos: {shortening['loop_cells_removed']}\n")
+    f.write(f"  Células removidas por linha de visada: {shortening['sight_cells_removed']}\n")
+    f.write(f"  Células removidas por atalhos: {shortening['shortcut_cells_removed']}\n")
+    f.write(f"  Passos depois: {shortening['steps']}\n")
+    f.write(f"  Custo: {shortening['cost']:.1f} (limite inferior octile: {shortening['lower_bound']:.1f}, "
+            f"razão {shortening['ratio']:.3f})\n\n")
+    
+    write_subsection(f, "CAMINHO ENCURTADO:")
+    write_path(f, shortening['path'])
+    f.write("\n\n")
+
+
+def write_astar_section(f, optimal_path, skipped=False, planner='astar'):
     write_section(f, "FASE 2: ALGORITMO A* - OTIMIZACAO DO CAMINHO")
     
+    if skipped:
+        write_subsection(f, "RESULTADO:")
+        f.write(f"  [--] A* dispensado: o caminho encurtado está dentro da tolerância do limite inferior\n")
+        f.write(f"  Tamanho do caminho usado: {len(optimal_path)} passos\n\n")
+        return
+    
     write_subsection(f, "CONFIGURAÇÃO:")
-    write_astar_config(f)
+    if planner == 'theta':
+        write_parameters(f, {
+            "Algoritmo": "Theta* (caminhos em qualquer ângulo)",
+            "Heurística": "Euclidiana",
+            "Visibilidade": "Linha de Bresenham sobre o plano de paredes",
+            "Caminho": "Células das linhas entre os pontos de virada",
+        })
+    elif planner == 'bucket':
+        write_parameters(f, {
+            "Algoritmo": "A* com fila de baldes circular (Dial)",
+            "Heurística": "Octile 10/14 x menor custo de terreno",
+            "Custo de um passo": "10 ortogonal / 14 diagonal x custo de terreno da célula de destino",
+            "Prioridades": "Inteiras (sem comparações de ponto flutuante)",
+        })
+    elif planner == 'bounded':
+        write_parameters(f, {
+            "Algoritmo": "A* com memória limitada (A* de fronteira com divisão e conquista se o limite não comportar a busca)",
+            "Heurística": "Octile 10/14 x menor custo de terreno",
+            "Custo de um passo": "10 ortogonal / 14 diagonal x custo de terreno da célula de destino",
+            "Memória por célula": "g (4 ou 8 bytes) + 1 byte de direção e flags, sem objetos por nó",
+        })
+    else:
+        write_astar_config(f)
     
     write_subsection(f, "RESULTADO:")
     f.write(f"  [OK] Caminho otimo encontrado\n")
     f.write(f"  Tamanho do caminho: {len(optimal_path)} passos\n\n")
     
     write_subsection(f, "CAMINHO OTIMO ENCONTRADO PELO A*:")
-    f.write(format_path(optimal_path) + "\n\n")
+    write_path(f, optimal_path)
+    f.write("\n\n")
 
 
-def write_visual_comparison(f, maze, ga_path, astar_path):
-    """Escreve a visualização dos caminhos no relatório."""
-    visual_output = create_visual_output(maze, ga_path, astar_path)
+def write_visual_comparison(f, maze, ga_path, astar_path, visual_output=None):
+    """Escreve a visualização dos caminhos no relatório (reaproveita a já renderizada, se houver)."""
+    if visual_output is None:
+        visual_output = create_visual_output(maze, ga_path, astar_path)
     f.write(visual_output)
     f.write("\n")
 
 
-def write_comparison(f, ga_steps, astar_steps):
+def write_heatmap(f, maze, heatmap):
+    """Escreve o mapa de calor das visitas do AG (se foi rastreado)."""
+    if heatmap is None:
+        return
+    
+    f.write(visualize_heatmap(maze, heatmap))
+    f.write("\n\n")
+
+
+def write_comparison(f, ga_steps, astar_steps, label="GA", discovery_name="O Algoritmo Genetico"):
     write_section(f, "COMPARAÇÃO E ANÁLISE FINAL")
     
     difference = ga_steps - astar_steps
     improvement = ((ga_steps - astar_steps) / ga_steps) * 100 if ga_steps > 0 else 0
     
     write_subsection(f, "METRICAS:")
-    f.write(f"  Passos do GA: {ga_steps}\n")
+    f.write(f"  Passos do {label}: {ga_steps}\n")
     f.write(f"  Passos do A*: {astar_steps}\n")
     f.write(f"  Diferenca: {difference} passos\n")
     f.write(f"  Melhoria: {improvement:.2f}% (A* e mais eficiente)\n\n")
     
     write_subsection(f, "CONCLUSAO:")
-    f.write(f"  O Algoritmo Genetico descobriu a saida com sucesso, mas o caminho\n")
+    f.write(f"  {discovery_name} descobriu a saida com sucesso, mas o caminho\n")
     f.write(f"  nao era otimo. O A* otimizou o trajeto, reduzindo em {improvement:.1f}% o numero\n")
     f.write(f"  de passos necessarios.\n\n")
 
@@ -1,16 +1,24 @@
 def parse_maze_file(filename):
-    # Lê arquivo do labirinto e retorna (n, grid, pos_E, pos_S)
+    # Lê arquivo do labirinto e retorna (rows, cols, grid, pos_E, pos_S, costs)
     with open(filename, 'r') as f:
         lines = f.readlines()
     
-    # Primeira linha: dimensão do labirinto
-    n = int(lines[0].strip())
+    return parse_maze_lines(lines)
+
+
+def parse_maze_lines(lines):
+    # Interpreta as linhas do arquivo do labirinto e retorna (rows, cols, grid, pos_E, pos_S, costs)
+    # Primeira linha: dimensão do labirinto ("n" para n x n ou "linhas colunas")
+    # Opcional após a grade: uma linha "custos" e rows linhas com cols inteiros (1-255) por linha
+    header = lines[0].split()
+    rows = int(header[0])
+    cols = int(header[1]) if len(header) > 1 else rows
     
     grid = []
     pos_E = None
     pos_S = None
     
-    for linha in range(n):
+    for linha in range(rows):
         line = lines[linha + 1].strip()
         row = []
         
@@ -18,10 +26,10 @@ def parse_maze_file(filename):
             cell = line[coluna]
             
             if cell == 'E':
-                pos_E = (linha, coluna)
+                pos_E = (linha, len(row))
                 row.append('E')
             elif cell == 'S':
-                pos_S = (linha, coluna)
+                pos_S = (linha, len(row))
                 row.append('S')
             elif cell == '0':
                 row.append('0')
@@ -30,6 +38,25 @@ def parse_maze_file(filename):
             else:
                 continue
         
+        if len(row) != cols:
+            raise ValueError(f"Linha {linha + 1} do labirinto tem {len(row)} células (esperado {cols})")
+        
         grid.append(row)
     
-    return n, grid, pos_E, pos_S
\ No newline at end of file
+    costs = parse_cost_lines(lines[rows + 1:], rows, cols)
+    
+    return rows, cols, grid, pos_E, pos_S, costs
+
+
+def parse_cost_lines(lines, rows, cols):
+    # Seção opcional de custos de terreno; None se o arquivo não tiver a seção
+    remaining = [line for line in lines if line.strip()]
+    if not remaining:
+        return None
+    if remaining[0].strip().lower() != 'custos':
+        raise ValueError(f"Conteúdo inesperado após a grade: {remaining[0].strip()[:40]!r}")
+    
+    costs = [[int(value) for value in line.split()] for line in remaining[1:rows + 1]]
+    if len(costs) != rows:
+        raise ValueError(f"Seção de custos com {len(costs)} linhas (esperado {rows})")
+    return costs
@@ -0,0 +1,103 @@
+from compact_path import CompactPath
+from a_star import heuristic_octile
+from theta_star import line_cells, line_of_sight
+
+
+# Códigos de direção diagonais (NE, SE, SW, NW) em Maze.DIRECTIONS
+DIAGONAL_CODES = (1, 3, 5, 7)
+
+# Alcance (em células do caminho) dos atalhos por linha de visada: limita cada ponto a
+# SIGHT_WINDOW testes de O(SIGHT_WINDOW) células, mantendo o encurtamento O(comprimento)
+SIGHT_WINDOW = 12
+
+
+def path_cost(path):
+    # Custo de um CompactPath com os mesmos pesos do A* (1.0 ortogonal, 1.4 diagonal)
+    diagonals = sum(path.moves.count(code) for code in DIAGONAL_CODES)
+    return (len(path.moves) - diagonals) * 1.0 + diagonals * 1.4
+
+
+def remove_loops(positions):
+    # Remove ciclos: ao revisitar uma célula, descarta tudo desde a visita anterior.
+    # O mapa guarda o índice da última ocorrência de cada célula no caminho resultante.
+    result = []
+    last_seen = {}
+
+    for position in positions:
+        index = last_seen.get(position)
+        if index is None:
+            last_seen[position] = len(result)
+            result.append(position)
+            continue
+
+        for removed in result[index + 1:]:
+            del last_seen[removed]
+        del result[index + 1:]
+
+    return result
+
+
+def shortcut(positions):
+    # Atalhos em pilha: se a penúltima célula é vizinha (8-conexa) da nova, a última
+    # é desnecessária. Um passo direto (<= 1.4) sempre custa menos que dois (>= 2.0).
+    # Ambas as células são livres, então o movimento direto é válido no labirinto.
+    result = []
+
+    for linha, coluna in positions:
+        while len(result) >= 2:
+            linha_anterior, coluna_anterior = result[-2]
+            if abs(linha - linha_anterior) > 1 or abs(coluna - coluna_anterior) > 1:
+                break
+            result.pop()
+        result.append((linha, coluna))
+
+    return result
+
+
+def sight_shortcut(maze, positions):
+    # Atalhos por linha de visada: de cada ponto, salta para a célula mais distante (até
+    # SIGHT_WINDOW posições à frente) visível em linha reta, seguindo a linha de Bresenham.
+    # A linha tem max(dl, dc) passos, min(dl, dc) deles diagonais: custa exatamente a distância
+    # octile entre as pontas, então nunca é mais cara que o trecho que substitui.
+    result = [positions[0]] if positions else []
+    current = 0
+    last = len(positions) - 1
+
+    while current < last:
+        target = min(last, current + SIGHT_WINDOW)
+        while target > current + 1 and not line_of_sight(maze, positions[current], positions[target]):
+            target -= 1
+        if target == current + 1:
+            result.append(positions[target])
+        else:
+            result.extend(line_cells(positions[current], positions[target])[1:])
+        current = target
+
+    return result
+
+
+def optimize_path(path, maze, tolerance=None):
+    # Encurta o caminho descoberto em O(comprimento) e compara com o limite inferior octile.
+    # Com tolerance (ex: 0.05), 'within_tolerance' indica se o custo está a no máximo
+    # (1 + tolerance) vezes o limite inferior, caso em que o A* pode ser dispensado.
+    # As linhas de visada podem cruzar o caminho mais adiante: os ciclos são removidos de novo.
+    positions = list(path)
+    without_loops = remove_loops(positions)
+    in_sight = remove_loops(sight_shortcut(maze, without_loops))
+    shortened = CompactPath.from_positions(shortcut(in_sight))
+
+    cost = path_cost(shortened)
+    lower_bound = heuristic_octile(shortened.start, shortened.end)
+
+    return {
+        'path': shortened,
+        'original_steps': len(positions),
+        'steps': len(shortened),
+        'loop_cells_removed': len(positions) - len(without_loops),
+        'sight_cells_removed': len(without_loops) - len(in_sight),
+        'shortcut_cells_removed': len(in_sight) - len(shortened),
+        'cost': cost,
+        'lower_bound': lower_bound,
+        'ratio': cost / lower_bound if lower_bound > 0 else 1.0,
+        'within_tolerance': tolerance is not None and cost <= lower_bound * (1 + tolerance) + 1e-9,
+    }
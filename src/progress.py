@@ -0,0 +1,281 @@
+import json
+import time
+from itertools import islice
+
+
+# Eventos de progresso do AG. O GeneticAlgorithm chama, em cada observador (parâmetro PROGRESSO),
+# on_start / on_resume / on_generation / on_checkpoint / on_finish; on_generation recebe o dict
+# de estatísticas da geração (montado só quando há observadores) e os resultados de fitness crus.
+#
+# Estatísticas por geração:
+#   generation, population, best_index, best_fitness, best_fitness_global, avg_fitness,
+#   diversity, valid_paths, best_position, path_length, found,
+#   evaluations_total, evaluation_s (avaliação desta geração), elapsed_s (desde o início da execução),
+#   evaluations_per_s e generations_per_s (médias desde o início da execução)
+
+
+class ProgressSink:
+    # Observador sem efeito: as subclasses sobrescrevem só os eventos que usam
+    
+    def on_start(self, ga):
+        pass
+    
+    def on_resume(self, ga, checkpoint_file):
+        pass
+    
+    def on_generation(self, ga, stats, fitness_results):
+        pass
+    
+    def on_checkpoint(self, ga, generation, checkpoint_file):
+        pass
+    
+    def on_finish(self, ga, result):
+        pass
+    
+    def close(self):
+        pass
+
+
+class ConsoleSink(ProgressSink):
+    # Blocos de texto no console (o antigo VERBOSE do AG), com modo lento e pausa interativa.
+    # Criado pelo próprio AG quando VERBOSE está ativo; lê as opções de exibição de ga.params.
+    
+    def on_start(self, ga):
+        params = ga.params
+        print(f"\n{'='*60}")
+        print(f"INICIANDO ALGORITMO GENETICO")
+        print(f"{'='*60}")
+        print(f"Parametros:")
+        print(f"   - Tamanho da Populacao: {params['TAMANHO_POPULACAO']}")
+        print(f"   - Tamanho do Cromossomo: {params['TAMANHO_CROMOSSOMO']} movimentos")
+        if params['CODIFICACAO'] == 'relativa':
+            print(f"   - Codificacao: relativa (gene = indice entre os movimentos livres)")
+        if params['INICIALIZACAO'] != 'aleatoria':
+            print(f"   - Inicializacao: caminhadas '{params['INICIALIZACAO']}' a partir de E")
+        print(f"   - Taxa de Mutacao: {params['TAXA_MUTACAO']*100}%")
+        print(f"   - Taxa de Crossover: {params['TAXA_CROSSOVER']*100}%")
+        print(f"   - Geracoes Maximas: {params['NUM_GERACOES']}")
+        print(f"   - Tamanho do Torneio: {params['TORNEIO_SIZE']}")
+        print(f"Objetivo: Encontrar a saida 'S' do labirinto {ga.maze.rows}x{ga.maze.cols}")
+        print(f"   Partindo de E = {ga.maze.pos_E}")
+        print(f"{'='*60}\n")
+    
+    def on_resume(self, ga, checkpoint_file):
+        print(f"Retomando da geracao {ga.start_generation} ({checkpoint_file})\n")
+    
+    def on_generation(self, ga, stats, fitness_results):
+        # A geração que encontra a saída é anunciada por on_finish
+        params = ga.params
+        generation = stats['generation']
+        if stats['found'] or not (generation % params['VERBOSE_INTERVAL'] == 0 or generation == 0):
+            return
+        best_path = fitness_results[stats['best_index']][2]
+        
+        print(f"\n{'-'*60}")
+        print(f"GERACAO {generation}")
+        print(f"{'-'*60}")
+        print(f"  Melhor Fitness da Geracao: {stats['best_fitness']:.2f}")
+        print(f"  Melhor Fitness Global: {stats['best_fitness_global']:.2f}")
+        print(f"  Posicao Final: {stats['best_position']}")
+        
+        # Visualização de elitismo
+        if params.get('SHOW_ELITISM', False):
+            if generation > 0:
+                status = "[ELITE PRESERVADO]" if ga.best_ever_fitness == ga.best_fitness_history[-2] else "[NOVO MELHOR]"
+                print(f"  Elitismo: {status}")
+        
+        # Mostrar população completa ou top N
+        show_pop = params.get('SHOW_POPULATION', 0)
+        if show_pop > 0:
+            print(f"\n  Top {show_pop} Individuos desta Geracao:")
+            print(f"  {'ID':<5} {'Fitness':<15} {'Posicao Final':<20} {'Passos':<8} {'Celulas Unicas':<15}")
+            print(f"  {'-'*70}")
+            
+            # Ordenar por fitness (melhor primeiro)
+            sorted_pop = sorted(enumerate(fitness_results), key=lambda x: x[1][0], reverse=True)
+            
+            for rank, (idx, (fit, pos, path, unique_cells)) in enumerate(sorted_pop[:show_pop], 1):
+                status = "[*] " if rank == 1 else "    "
+                print(f"  {status}{idx:<3} {fit:<15.2f} {str(pos):<20} {len(path):<8} {unique_cells:<15}")
+            
+            if show_pop < stats['population']:
+                print(f"  ... e mais {stats['population'] - show_pop} indivíduos")
+        
+        if params.get('VERBOSE_DETAIL', False):
+            # Estatísticas da população
+            print(f"  Fitness Medio: {stats['avg_fitness']:.2f}")
+            print(f"  Caminhos Validos: {stats['valid_paths']}/{stats['population']}")
+            print(f"  Tamanho do Caminho: {stats['path_length']} passos")
+            
+            # Análise de convergência
+            if params.get('ANALISE_CONVERGENCIA', False):
+                diversity = stats['diversity']
+                print(f"  Diversidade Genetica: {diversity:.2%}")
+                
+                history = ga.best_fitness_history
+                if len(history) >= 10:
+                    stagnation = len(history) - max((i for i, f in enumerate(history) if f != ga.best_ever_fitness), default=0) - 1
+                    print(f"  Geracoes Estagnadas: {stagnation}")
+                    
+                    if diversity < 0.1:
+                        print(f"  ALERTA: Baixa diversidade - risco de convergência prematura!")
+                    
+                    if ga.detect_convergence(history):
+                        print(f"  ALERTA: Convergência detectada!")
+            
+            # Mostrar início do caminho
+            if len(best_path) > 1:
+                path_preview = " > ".join([f"{p}" for p in islice(best_path, 5)])
+                if len(best_path) > 5:
+                    path_preview += " > ..."
+                print(f"  Caminho: {path_preview}")
+        
+        print(f"{'-'*60}")
+        
+        # Modo lento: adicionar delay entre gerações
+        if params.get('MODO_LENTO', False):
+            time.sleep(params.get('DELAY_GERACAO', 0.5))
+        
+        # Pausa interativa: esperar Enter do usuário
+        pausar_a_cada = params.get('PAUSAR_A_CADA', 0)
+        if pausar_a_cada > 0 and generation > 0 and generation % pausar_a_cada == 0:
+            input(f"\n[PAUSA] Pressione Enter para continuar (próximas {pausar_a_cada} gerações)...")
+    
+    def on_checkpoint(self, ga, generation, checkpoint_file):
+        print(f"  [checkpoint] geracao {generation} gravada em {checkpoint_file}")
+    
+    def on_finish(self, ga, result):
+        if result['success']:
+            print(f"\n{'='*60}")
+            print(f"SAIDA ENCONTRADA!")
+            print(f"{'='*60}")
+            print(f"   Geracao: {result['generation']}")
+            print(f"   Posicao da Saida: {result['s_position']}")
+            print(f"   Tamanho do Caminho: {len(result['path'])} passos")
+            print(f"{'='*60}\n")
+        else:
+            print(f"ERRO: Algoritmo genético não encontrou a saída após {ga.params['NUM_GERACOES']} gerações.")
+            print(f"Melhor fitness alcançado: {result['fitness']:.2f}")
+
+
+class JsonlSink(ProgressSink):
+    # Um objeto JSON por linha ("event": start | resume | generation | checkpoint | finish).
+    # Arquivo com buffer de linha: `tail -f` acompanha a execução sem esperar o fim.
+    
+    def __init__(self, path, append=False):
+        self.path = path
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8', buffering=1)
+    
+    def _write(self, event, **fields):
+        record = {'event': event, 'time': time.time()}
+        record.update(fields)
+        self._file.write(json.dumps(record) + '\n')
+    
+    def on_start(self, ga):
+        params = ga.params
+        self._write('start', rows=ga.maze.rows, cols=ga.maze.cols,
+                    population=params['TAMANHO_POPULACAO'], chromosome_length=params['TAMANHO_CROMOSSOMO'],
+                    generations=params['NUM_GERACOES'], mutation_rate=params['TAXA_MUTACAO'],
+                    crossover_rate=params['TAXA_CROSSOVER'], encoding=params['CODIFICACAO'],
+                    init=params['INICIALIZACAO'])
+    
+    def on_resume(self, ga, checkpoint_file):
+        self._write('resume', generation=ga.start_generation, checkpoint=checkpoint_file)
+    
+    def on_generation(self, ga, stats, fitness_results):
+        self._write('generation', **stats)
+    
+    def on_checkpoint(self, ga, generation, checkpoint_file):
+        self._write('checkpoint', generation=generation, checkpoint=checkpoint_file)
+    
+    def on_finish(self, ga, result):
+        self._write('finish', success=result['success'], generation=result['generation'],
+                    s_position=result['s_position'], fitness=result['fitness'])
+    
+    def close(self):
+        self._file.close()
+
+
+# Métricas expostas por PrometheusSink: (nome, tipo, chave das estatísticas, descrição)
+PROMETHEUS_METRICS = (
+    ('labyrinth_ga_generation', 'gauge', 'generation', 'Geracao atual do AG'),
+    ('labyrinth_ga_best_fitness', 'gauge', 'best_fitness', 'Melhor fitness da geracao atual'),
+    ('labyrinth_ga_best_fitness_global', 'gauge', 'best_fitness_global', 'Melhor fitness desde o inicio'),
+    ('labyrinth_ga_avg_fitness', 'gauge', 'avg_fitness', 'Fitness medio da geracao atual'),
+    ('labyrinth_ga_diversity', 'gauge', 'diversity', 'Diversidade genetica da geracao atual (0-1)'),
+    ('labyrinth_ga_valid_paths', 'gauge', 'valid_paths', 'Individuos com fitness positivo'),
+    ('labyrinth_ga_evaluations_total', 'counter', 'evaluations_total', 'Avaliacoes de fitness desde o inicio'),
+    ('labyrinth_ga_evaluations_per_second', 'gauge', 'evaluations_per_s', 'Avaliacoes por segundo (media da execucao)'),
+    ('labyrinth_ga_generations_per_second', 'gauge', 'generations_per_s', 'Geracoes por segundo (media da execucao)'),
+    ('labyrinth_ga_elapsed_seconds', 'gauge', 'elapsed_s', 'Segundos desde o inicio da execucao'),
+)
+
+
+class PrometheusSink(ProgressSink):
+    # Endpoint HTTP local no formato texto do Prometheus (GET /metrics), servido por uma thread.
+    # O AG só troca o dict de estatísticas; o texto é montado quando alguém consulta.
+    
+    def __init__(self, port=0, host='127.0.0.1'):
+        # port=0 escolhe uma porta livre (veja self.port)
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        sink = self
+        self._stats = None
+        self._running = 0
+        self._found = 0
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = sink.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+    
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/metrics"
+    
+    def render(self):
+        lines = []
+        stats = self._stats
+        if stats is not None:
+            for name, kind, key, description in PROMETHEUS_METRICS:
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name} {stats[key]}")
+        lines.append("# HELP labyrinth_ga_running 1 enquanto o AG executa")
+        lines.append("# TYPE labyrinth_ga_running gauge")
+        lines.append(f"labyrinth_ga_running {self._running}")
+        lines.append("# HELP labyrinth_ga_found 1 se a saida foi encontrada")
+        lines.append("# TYPE labyrinth_ga_found gauge")
+        lines.append(f"labyrinth_ga_found {self._found}")
+        return '\n'.join(lines) + '\n'
+    
+    def on_start(self, ga):
+        self._running = 1
+        self._found = 0
+    
+    def on_generation(self, ga, stats, fitness_results):
+        self._stats = stats
+    
+    def on_finish(self, ga, result):
+        self._running = 0
+        self._found = int(result['success'])
+    
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,126 @@
+import math
+import random
+
+
+# Operadores de reprodução do AG (parâmetros CROSSOVER e MUTACAO)
+CROSSOVER_OPERATORS = ('um_ponto', 'dois_pontos', 'uniforme')
+MUTATION_OPERATORS = ('por_gene', 'salto_geometrico')
+
+CROSSOVER_NAMES = {
+    'um_ponto': 'crossover de um ponto',
+    'dois_pontos': 'crossover de dois pontos',
+    'uniforme': 'crossover uniforme',
+}
+
+CROSSOVER_DESCRIPTIONS = {
+    'um_ponto': 'One-point crossover',
+    'dois_pontos': 'Two-point crossover',
+    'uniforme': 'Uniform crossover (máscara aleatória por gene)',
+}
+
+MUTATION_DESCRIPTIONS = {
+    'por_gene': 'Um sorteio por gene',
+    'salto_geometrico': 'Saltos geométricos até o próximo gene mutado (um sorteio por mutação)',
+}
+
+# Bytes aleatórios -> máscara de genes: 0xFF (gene do primeiro pai) ou 0x00 (do segundo),
+# cada um com probabilidade 1/2 (bit menos significativo do byte sorteado)
+_UNIFORM_TABLE = bytes(0xFF if value & 1 else 0x00 for value in range(256))
+
+
+def reproduce(population, fitnesses, count, length, params, rng=random):
+    # Gera `count` filhos em lote sobre a matriz da população (um cromossomo após o outro):
+    #   1. torneios por índice (rng.sample de TORNEIO_SIZE índices, sem copiar a população)
+    #   2. uma máscara de bytes para a geração inteira (0xFF = gene do pai 1, 0x00 = do pai 2):
+    #      cortes (um ou dois pontos), bytes aleatórios (uniforme) ou só 0xFF (sem crossover)
+    #   3. os filhos saem de três operações com inteiros grandes sobre os pais concatenados
+    #   4. mutação sobre o buffer de todos os filhos (por gene ou por saltos geométricos)
+    # Devolve (filhos como bytearray, contadores para o log de fases).
+    crossover = params['CROSSOVER']
+    if crossover not in CROSSOVER_OPERATORS:
+        raise ValueError(f"Operador de crossover desconhecido: '{crossover}'")
+    mutation = params['MUTACAO']
+    if mutation not in MUTATION_OPERATORS:
+        raise ValueError(f"Operador de mutação desconhecido: '{mutation}'")
+    
+    pairs = (count + 1) // 2
+    tournament_size = params['TORNEIO_SIZE']
+    crossover_rate = params['TAXA_CROSSOVER']
+    indices = range(len(population))
+    key = fitnesses.__getitem__
+    sample, rand, randint = rng.sample, rng.random, rng.randint
+    
+    first_parents = []
+    second_parents = []
+    masks = []
+    keep = b'\xff' * length
+    for _ in range(pairs):
+        first_parents.append(bytes(population[max(sample(indices, tournament_size), key=key)]))
+        second_parents.append(bytes(population[max(sample(indices, tournament_size), key=key)]))
+        if length < 2 or rand() > crossover_rate:
+            # Sem crossover: filhos são cópias dos pais
+            masks.append(keep)
+        elif crossover == 'uniforme':
+            masks.append(rng.randbytes(length).translate(_UNIFORM_TABLE))
+        elif crossover == 'dois_pontos' and length > 2:
+            start, end = sorted(sample(range(1, length), 2))
+            masks.append(b'\xff' * start + b'\x00' * (end - start) + b'\xff' * (length - end))
+        else:
+            point = randint(1, length - 1)
+            masks.append(b'\xff' * point + b'\x00' * (length - point))
+    
+    # x = (p1 ^ p2) & m; filho1 = p2 ^ x (p1 onde m = 0xFF), filho2 = p1 ^ x (o complemento)
+    nbytes = pairs * length
+    first = int.from_bytes(b''.join(first_parents), 'little')
+    second = int.from_bytes(b''.join(second_parents), 'little')
+    exchange = (first ^ second) & int.from_bytes(b''.join(masks), 'little')
+    first_children = (second ^ exchange).to_bytes(nbytes, 'little')
+    second_children = (first ^ exchange).to_bytes(nbytes, 'little')
+    
+    # Todos os filho1 e depois os filho2 (o último sobra quando count é ímpar)
+    genes = bytearray(first_children)
+    genes += second_children[:(count - pairs) * length]
+    
+    mutate = _mutate_geometric if mutation == 'salto_geometrico' else _mutate_per_gene
+    genes_mutated = mutate(genes, params['TAXA_MUTACAO'], rng)
+    
+    offspring = [genes[start:start + length] for start in range(0, count * length, length)]
+    return offspring, {
+        'selections': 2 * pairs,
+        'crossovers': pairs,
+        'mutations': count,
+        'genes_mutated': genes_mutated,
+    }
+
+
+def _mutate_per_gene(genes, rate, rng):
+    # Um sorteio por gene do buffer inteiro (a mesma regra do GeneticAlgorithm.mutate)
+    rand, randint = rng.random, rng.randint
+    changed = 0
+    for position in range(len(genes)):
+        if rand() < rate:
+            gene = randint(0, 7)
+            changed += genes[position] != gene
+            genes[position] = gene
+    return changed
+
+
+def _mutate_geometric(genes, rate, rng):
+    # Cada gene é mutado com probabilidade rate, mas sem um sorteio por gene: a distância até o
+    # próximo gene mutado segue a distribuição geométrica, floor(log(U) / log(1 - rate)), então o
+    # custo é proporcional ao número de mutações (~rate x genes) e não ao tamanho do buffer
+    if rate <= 0:
+        return 0
+    if rate >= 1:
+        return _mutate_per_gene(genes, rate, rng)
+    rand, randint = rng.random, rng.randint
+    log_keep = math.log(1.0 - rate)
+    size = len(genes)
+    changed = 0
+    position = int(math.log(1.0 - rand()) / log_keep)
+    while position < size:
+        gene = randint(0, 7)
+        changed += genes[position] != gene
+        genes[position] = gene
+        position += 1 + int(math.log(1.0 - rand()) / log_keep)
+    return changed
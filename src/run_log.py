@@ -0,0 +1,181 @@
+import sys
+import struct
+from array import array
+from compact_path import CompactPath
+
+
+# Formato binário do log de execução do AG (.rlog), todo em little-endian:
+#
+#   cabeçalho   FILE_HEADER: magic 'LABRLOG1', versão, linhas, colunas, E (linha, coluna),
+#               S descoberta (linha, coluna; -1 se não encontrada), nº de gerações
+#   geração*    GEN_HEADER: geração, tamanho da população, comprimento do cromossomo,
+#               melhor da geração, melhor global, média, mínimo, máximo, diversidade, caminhos válidos
+#               seguido das colunas da população (uma por campo, em ordem):
+#                 fitness          float64 x P
+#                 posição final    int32 x 2P (linha, coluna intercalados)
+#                 células únicas   uint32 x P
+#                 passos           uint32 x P   (movimentos de cada caminho, sem a célula inicial)
+#                 cromossomos      uint8 x P*L  (genes 0-7, um indivíduo após o outro)
+#                 caminhos         uint8 x soma(passos) (códigos de direção, todos partem de E)
+#   índice      uint64 x G: deslocamento de cada bloco de geração no arquivo
+#   rodapé      FILE_FOOTER: deslocamento do índice, nº de gerações, magic 'LABRLEND'
+#
+# O índice no fim do arquivo permite ler uma única geração sem percorrer as anteriores.
+
+MAGIC = b'LABRLOG1'
+END_MAGIC = b'LABRLEND'
+VERSION = 1
+
+FILE_HEADER = struct.Struct('<8sIIIiiiiI')
+GEN_HEADER = struct.Struct('<IIIddddddI')
+FILE_FOOTER = struct.Struct('<QI8s')
+
+
+def _to_le_bytes(values):
+    # Serializa um array em little-endian independentemente da plataforma
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le_bytes(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def write_run_log(path, maze, ga_results):
+    # Grava generation_details do AG no formato colunar descrito acima
+    generation_details = ga_results.get('generation_details', [])
+    s_position = ga_results.get('s_position') or (-1, -1)
+    
+    with open(path, 'wb') as f:
+        f.write(FILE_HEADER.pack(MAGIC, VERSION, maze.rows, maze.cols, maze.pos_E[0], maze.pos_E[1],
+                                 s_position[0], s_position[1], len(generation_details)))
+        offsets = array('Q')
+        
+        for detail in generation_details:
+            offsets.append(f.tell())
+            population = detail.get('population', [])
+            chromosome_length = len(population[0]['chromosome']) if population else 0
+            
+            f.write(GEN_HEADER.pack(
+                detail['generation'], len(population), chromosome_length,
+                detail.get('best_fitness_generation', 0.0), detail.get('best_fitness_global', 0.0),
+                detail.get('avg_fitness', 0.0), detail.get('min_fitness', 0.0),
+                detail.get('max_fitness', 0.0), detail.get('diversity', 0.0),
+                detail.get('valid_paths', 0),
+            ))
+            
+            positions = array('i')
+            for individual in population:
+                positions.extend(individual['position'])
+            
+            f.write(_to_le_bytes(array('d', [ind['fitness'] for ind in population])))
+            f.write(_to_le_bytes(positions))
+            f.write(_to_le_bytes(array('I', [ind['unique_cells'] for ind in population])))
+            f.write(_to_le_bytes(array('I', [len(ind['path'].moves) for ind in population])))
+            f.write(b''.join(bytes(ind['chromosome']) for ind in population))
+            f.write(b''.join(ind['path'].moves for ind in population))
+        
+        index_offset = f.tell()
+        f.write(_to_le_bytes(offsets))
+        f.write(FILE_FOOTER.pack(index_offset, len(offsets), END_MAGIC))
+    
+    return path
+
+
+class RunLogReader:
+    # Leitura aleatória de um log .rlog: só o cabeçalho e o índice são lidos na abertura
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._read_index()
+        except Exception:
+            # Cabeçalho ou índice inválido: o arquivo não fica aberto com o erro
+            self._file.close()
+            raise
+    
+    def _read_index(self):
+        path = self.path
+        header = self._file.read(FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{path}' não é um log de execução (.rlog)")
+        _, version, rows, cols, e_linha, e_coluna, s_linha, s_coluna, generations = FILE_HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"Versão de log não suportada: {version}")
+        
+        self.rows = rows
+        self.cols = cols
+        self.pos_E = (e_linha, e_coluna)
+        self.s_position = (s_linha, s_coluna) if s_linha >= 0 else None
+        
+        self._file.seek(-FILE_FOOTER.size, 2)
+        index_offset, count, end_magic = FILE_FOOTER.unpack(self._file.read(FILE_FOOTER.size))
+        if end_magic != END_MAGIC or count != generations:
+            raise ValueError(f"Log '{path}' truncado ou corrompido")
+        
+        self._file.seek(index_offset)
+        self._offsets = _from_le_bytes('Q', self._file.read(8 * count))
+    
+    def __len__(self):
+        return len(self._offsets)
+    
+    def _read_header(self, index):
+        self._file.seek(self._offsets[index])
+        values = GEN_HEADER.unpack(self._file.read(GEN_HEADER.size))
+        keys = ('generation', 'population_size', 'chromosome_length', 'best_fitness_generation',
+                'best_fitness_global', 'avg_fitness', 'min_fitness', 'max_fitness',
+                'diversity', 'valid_paths')
+        return dict(zip(keys, values))
+    
+    def generation_stats(self):
+        # Estatísticas de todas as gerações, lendo apenas os cabeçalhos dos blocos
+        return [self._read_header(i) for i in range(len(self))]
+    
+    def read_generation(self, index):
+        # Lê uma única geração: estatísticas + colunas da população
+        stats = self._read_header(index)
+        size = stats['population_size']
+        length = stats['chromosome_length']
+        read = self._file.read
+        
+        fitness = _from_le_bytes('d', read(8 * size))
+        flat_positions = _from_le_bytes('i', read(8 * size))
+        unique_cells = _from_le_bytes('I', read(4 * size))
+        steps = _from_le_bytes('I', read(4 * size))
+        chromosomes = read(size * length)
+        moves = read(sum(steps))
+        
+        paths = []
+        offset = 0
+        for count in steps:
+            paths.append(CompactPath(self.pos_E, moves[offset:offset + count]))
+            offset += count
+        
+        stats.update({
+            'fitness': fitness,
+            'positions': [(flat_positions[2 * i], flat_positions[2 * i + 1]) for i in range(size)],
+            'unique_cells': unique_cells,
+            'chromosomes': [chromosomes[i * length:(i + 1) * length] for i in range(size)],
+            'paths': paths,
+        })
+        return stats
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_run_log(path):
+    return RunLogReader(path)
@@ -1,10 +1,9 @@
 import os
-from datetime import datetime
-from parser import parse_maze_file
-from maze import Maze
-from genetic import run_genetic
-from a_star import a_star
-from output_writer import *
+from maze_cache import load_maze
+
+
+# Os módulos pesados (AG, A*, relatório) são importados dentro das fases que os usam,
+# para manter a inicialização do CLI rápida.
 
 
 def _determine_verbose_interval(mode, custom_interval):
@@ -13,9 +12,11 @@ def _determine_verbose_interval(mode, custom_interval):
     return 1 if mode in ['slow', 'ultra'] else 10
 
 
-def _build_ga_params(mode, verbose_interval, pause_every, delay, analyze, show_elitism, show_population):
+def _build_ga_params(mode, verbose_interval, pause_every, delay, analyze, show_elitism, show_population, track_heatmap=False,
+                     encoding='absoluta', checkpoint=None, checkpoint_every=10, resume=False, init='aleatoria',
+                     console_progress=True, crossover='um_ponto', mutation='por_gene'):
     return {
-        'VERBOSE': True,
+        'VERBOSE': console_progress,
         'VERBOSE_INTERVAL': verbose_interval,
         'VERBOSE_DETAIL': mode in ['slow', 'ultra'] or analyze,
         'MODO_LENTO': delay > 0,
@@ -27,6 +28,14 @@ def _build_ga_params(mode, verbose_interval, pause_every, delay, analyze, show_e
         'TRACK_HISTORY': True,
         'TRACK_FULL_POPULATION': True,  # Sempre rastrear população completa para output
         'TRACK_PHASES': True,
+        'TRACK_HEATMAP': track_heatmap,
+        'CODIFICACAO': encoding,
+        'INICIALIZACAO': init,
+        'CROSSOVER': crossover,
+        'MUTACAO': mutation,
+        'CHECKPOINT': checkpoint,
+        'CHECKPOINT_A_CADA': checkpoint_every,
+        'RETOMAR': resume,
         'NUM_GERACOES': 10,  # Otimizado para matrizes 10x10
         'TAMANHO_POPULACAO': 100,
         'TAXA_MUTACAO': 0.01,
@@ -45,112 +54,280 @@ def _print_simulation_header(maze_file, mode):
 
 def _load_maze(maze_file):
     print("Carregando labirinto...")
-    n, grid, pos_E, pos_S = parse_maze_file(maze_file)
-    maze = Maze(n, grid, pos_E, pos_S)
-    print(f"Labirinto {n}x{n} carregado com sucesso!")
-    print(f"   Entrada (E): {pos_E}")
-    print(f"   Saida (S): {pos_S} (posicao real - nao conhecida pelo AG)")
+    maze = load_maze(maze_file)
+    print(f"Labirinto {maze.rows}x{maze.cols} carregado com sucesso!")
+    print(f"   Entrada (E): {maze.pos_E}")
+    print(f"   Saida (S): {maze.pos_S} (posicao real - nao conhecida pelo AG)")
     return maze
 
 
-def _run_genetic_phase(maze, ga_params):
+def _run_genetic_phase(maze, ga_params, progress_jsonl=None, metrics_port=None):
     print("\n" + "="*60)
     print("FASE 1: DESCOBERTA DA SAIDA COM ALGORITMO GENETICO")
     print("="*60)
-    return run_genetic(maze, ga_params)
+    from genetic import run_genetic
+    
+    # Observadores extras de progresso: arquivo JSONL e endpoint de métricas no formato do Prometheus
+    sinks = []
+    try:
+        if progress_jsonl is not None:
+            from progress import JsonlSink
+            sinks.append(JsonlSink(progress_jsonl, append=ga_params['RETOMAR']))
+            print(f"Progresso do AG em {progress_jsonl}")
+        if metrics_port is not None:
+            from progress import PrometheusSink
+            sinks.append(PrometheusSink(metrics_port))
+            print(f"Metricas do AG em {sinks[-1].url}")
+        return run_genetic(maze, dict(ga_params, PROGRESSO=sinks))
+    finally:
+        for sink in sinks:
+            sink.close()
+
+
+def _run_frontier_phase(maze):
+    print("\n" + "="*60)
+    print("FASE 1: DESCOBERTA DA SAIDA COM EXPLORACAO DE FRONTEIRA")
+    print("="*60)
+    from explorer import run_frontier
+    return run_frontier(maze)
+
+
+def _discovery_labels(results):
+    # (rótulo curto, título da visualização, nome na conclusão) conforme o motor de descoberta
+    if results.get('engine') == 'frontier':
+        return "explorador", "CAMINHO DA EXPLORAÇÃO DE FRONTEIRA", "A Exploracao de Fronteira"
+    return "GA", "CAMINHO DO ALGORITMO GENÉTICO", "O Algoritmo Genetico"
 
 
-def _run_astar_phase(maze, s_position):
+def _run_astar_phase(maze, s_position, planner='astar', memory_limit=None):
     print("\n" + "="*60)
     print("FASE 2: OTIMIZACAO DO CAMINHO COM A*")
     print("="*60)
+    if planner == 'theta':
+        # Theta* devolve pontos de virada; o caminho célula a célula segue as linhas entre eles
+        print(f"Executando Theta* (qualquer angulo) de {maze.pos_E} ate {s_position}...")
+        from theta_star import theta_star, expand_waypoints, path_length
+        waypoints = theta_star(maze, maze.pos_E, s_position)
+        if waypoints is None:
+            return None
+        print(f"Theta* encontrou {len(waypoints)} pontos de virada (comprimento {path_length(waypoints):.2f}).")
+        return expand_waypoints(waypoints)
+    if planner == 'bounded':
+        # Memória limitada: g e flags em planos achatados; A* de fronteira se nem isso couber no limite
+        limit = int(memory_limit * 1024 * 1024) if memory_limit is not None else None
+        print(f"Executando A* com memoria limitada de {maze.pos_E} ate {s_position}...")
+        from bounded_search import bounded_a_star
+        stats = {}
+        path = bounded_a_star(maze, maze.pos_E, s_position, limit, stats)
+        print(f"Busca em modo {stats['mode']}: {stats['expansions']} expansoes, "
+              f"~{stats['peak_bytes'] / (1024 * 1024):.1f} MB estimados.")
+        return path
+    if planner == 'bucket' or maze.costs is not None:
+        # Custos de terreno só são considerados pela busca com custos inteiros
+        print(f"Executando A* com fila de baldes (custos inteiros) de {maze.pos_E} ate {s_position}...")
+        from bucket_search import bucket_a_star
+        return bucket_a_star(maze, maze.pos_E, s_position)
     print(f"Executando A* de {maze.pos_E} ate {s_position}...")
+    from a_star import a_star
     return a_star(maze, maze.pos_E, s_position)
 
 
-def _print_summary(ga_results, optimal_path, maze):
+def _run_shortening_phase(maze, ga_results, astar_tolerance):
+    from path_optimizer import optimize_path
+    shortening = optimize_path(ga_results['path'], maze, astar_tolerance)
+    print(f"\nCaminho descoberto encurtado: {shortening['original_steps']} -> {shortening['steps']} passos "
+          f"(custo {shortening['cost']:.1f}, limite inferior {shortening['lower_bound']:.1f})")
+    return shortening
+
+
+def _print_summary(ga_results, optimal_path, maze, visual_output, shortening=None):
     improvement = ((len(ga_results['path']) - len(optimal_path)) / len(ga_results['path'])) * 100
     
     print(f"\n{'='*60}")
     print("RESUMO FINAL")
     print(f"{'='*60}")
-    print(f"   Saida encontrada na geracao: {ga_results['generation']}")
+    label = "explorador" if ga_results.get('engine') == 'frontier' else "AG"
+    if ga_results.get('engine') == 'frontier':
+        print(f"   Saida encontrada apos {ga_results['steps']} passos de exploracao")
+        print(f"   Celulas observadas: {ga_results['cells_observed']}")
+    else:
+        print(f"   Saida encontrada na geracao: {ga_results['generation']}")
     print(f"   Posicao da saida: {ga_results['s_position']}")
-    print(f"   Passos do caminho AG: {len(ga_results['path'])}")
-    print(f"   Passos do caminho A*: {len(optimal_path)}")
-    print(f"   Melhoria do A*: {improvement:.2f}%")
+    print(f"   Passos do caminho {label}: {len(ga_results['path'])}")
+    if shortening is not None:
+        print(f"   Passos do caminho encurtado: {shortening['steps']}")
+    if shortening is not None and shortening['within_tolerance']:
+        print(f"   Passos do caminho final (A* dispensado): {len(optimal_path)}")
+        print(f"   Melhoria do encurtamento: {improvement:.2f}%")
+    else:
+        print(f"   Passos do caminho A*: {len(optimal_path)}")
+        print(f"   Melhoria do A*: {improvement:.2f}%")
     print(f"{'='*60}\n")
     
-    # Imprimir visualização dos caminhos
-    from visualizer import create_visual_output
-    visual_output = create_visual_output(maze, ga_results['path'], optimal_path)
+    # Imprimir visualização dos caminhos (a mesma do relatório, se couber no terminal)
+    from visualizer import create_visual_output, terminal_max_cols
+    if maze.cols > terminal_max_cols():
+        label, title, _ = _discovery_labels(ga_results)
+        visual_output = create_visual_output(maze, ga_results['path'], optimal_path, terminal_max_cols(), title, label)
     print(visual_output)
+    
+    if ga_results.get('heatmap') is not None:
+        from visualizer import visualize_heatmap
+        print(visualize_heatmap(maze, ga_results['heatmap'], max_cols=terminal_max_cols()))
 
 
-def run_simulation(maze_file, mode='fast', verbose_interval=None, pause_every=0, delay=0, analyze=False, show_elitism=False, show_population=0):
+def run_simulation(maze_file, mode='fast', verbose_interval=None, pause_every=0, delay=0, analyze=False, show_elitism=False, show_population=0,
+                   compress_output=False, run_log=False, image=False, heatmap=False, discovery='ga',
+                   encoding='absoluta', astar_tolerance=None, planner='astar', memory_limit=None,
+                   checkpoint=None, checkpoint_every=10, resume=False, init='aleatoria',
+                   progress_jsonl=None, metrics_port=None, console_progress=True,
+                   crossover='um_ponto', mutation='por_gene'):
     _print_simulation_header(maze_file, mode)
     
     # 1. Carregar o labirinto
     maze = _load_maze(maze_file)
+    if planner == 'theta' and maze.costs is not None:
+        # Theta* mede segmentos em linha reta e ignoraria os custos de terreno
+        print("Aviso: Theta* não considera custos de terreno; a fase 2 usará a fila de baldes (--planner bucket).")
+        planner = 'bucket'
     
     # 2. Configurar parâmetros do GA
     verbose_interval = _determine_verbose_interval(mode, verbose_interval)
     ga_params = _build_ga_params(mode, verbose_interval, pause_every, delay, 
-                                   analyze, show_elitism, show_population)
+                                   analyze, show_elitism, show_population, heatmap, encoding,
+                                   checkpoint, checkpoint_every, resume, init, console_progress,
+                                   crossover, mutation)
     
-    # 3. Executar o Algoritmo Genético
-    ga_results = _run_genetic_phase(maze, ga_params)
-    if not ga_results['success']:
-        print("\nERRO: O Algoritmo Genético não encontrou a saída!")
-        print("   Tente ajustar os parâmetros ou aumentar o número de gerações.")
-        return None
+    # 3. Descobrir a saída (Algoritmo Genético ou exploração de fronteira)
+    if discovery == 'frontier':
+        ga_results = _run_frontier_phase(maze)
+        if not ga_results['success']:
+            print("\nERRO: A exploração esgotou a área alcançável sem encontrar a saída!")
+            return None
+    else:
+        ga_results = _run_genetic_phase(maze, ga_params, progress_jsonl, metrics_port)
+        if not ga_results['success']:
+            print("\nERRO: O Algoritmo Genético não encontrou a saída!")
+            print("   Tente ajustar os parâmetros ou aumentar o número de gerações.")
+            return None
     
-    # 4. Executar o A*
-    optimal_path = _run_astar_phase(maze, ga_results['s_position'])
-    if optimal_path is None:
-        print("ERRO: A* não encontrou caminho para a saída descoberta!")
-        return None
+    # 4. Encurtar o caminho descoberto (O(comprimento)) e executar o A* se ainda for preciso
+    # (o limite inferior octile não considera custos de terreno: com eles, a busca sempre roda)
+    shortening = _run_shortening_phase(maze, ga_results, astar_tolerance if maze.costs is None else None)
+    if shortening['within_tolerance']:
+        print(f"A* dispensado: custo a {(shortening['ratio'] - 1) * 100:.1f}% do limite inferior "
+              f"(tolerancia {astar_tolerance * 100:.1f}%).")
+        optimal_path = shortening['path']
+    else:
+        try:
+            optimal_path = _run_astar_phase(maze, ga_results['s_position'], planner, memory_limit)
+        except MemoryError as error:
+            # Só a busca limitada levanta: nem a fronteira coube em --memory-limit
+            print(f"ERRO: limite de memória insuficiente para a busca da fase 2: {error}")
+            print("   Aumente --memory-limit (ou rode sem ele).")
+            return None
+        if optimal_path is None:
+            print("ERRO: A* não encontrou caminho para a saída descoberta!")
+            return None
+        
+        if planner != 'theta':
+            print(f"A* encontrou caminho ótimo com {len(optimal_path)} passos.")
     
-    print(f"A* encontrou caminho ótimo com {len(optimal_path)} passos.")
+    # 5. Renderizar os caminhos uma vez (usado no relatório e no console)
+    from visualizer import create_visual_output
+    label, title, _ = _discovery_labels(ga_results)
+    visual_output = create_visual_output(maze, ga_results['path'], optimal_path, ga_title=title, ga_label=label)
     
-    # 5. Gerar arquivo de saída
-    output_file = generate_output_file(maze_file, maze, ga_results, optimal_path)
+    # 6. Gerar arquivo de saída
+    output_file = generate_output_file(maze_file, maze, ga_results, optimal_path, compress_output, visual_output,
+                                       shortening, planner)
     print(f"\nResultados salvos em: {output_file}")
     
-    # 6. Exibir resumo final
-    _print_summary(ga_results, optimal_path, maze)
+    if run_log and discovery != 'frontier':
+        log_file = generate_run_log(output_file, maze, ga_results)
+        print(f"Log binario da execucao salvo em: {log_file}")
+    
+    if image:
+        image_file = generate_image(output_file, maze, ga_results, optimal_path)
+        print(f"Imagem dos caminhos salva em: {image_file}")
+    
+    # 7. Exibir resumo final
+    _print_summary(ga_results, optimal_path, maze, visual_output, shortening)
     
     return {
         'ga_results': ga_results,
         'optimal_path': optimal_path,
+        'shortening': shortening,
         'output_file': output_file
     }
 
 
-def generate_output_file(maze_file, maze, ga_results, optimal_path):
+def generate_output_file(maze_file, maze, ga_results, optimal_path, compress=False, visual_output=None,
+                         shortening=None, planner='astar'):
+    from datetime import datetime
+    from output_writer import (
+        open_report, write_header, write_ga_section_header, write_ga_parameters, write_phases_section,
+        write_ga_result, write_generation_evolution, write_ga_path, write_all_populations,
+        write_elitism_analysis, write_astar_section, write_visual_comparison, write_heatmap,
+        write_comparison, write_footer, write_explorer_section, write_shortening_section,
+    )
+    
     os.makedirs('outputs', exist_ok=True)
     
     base_name = os.path.splitext(os.path.basename(maze_file))[0]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = f"outputs/{base_name}_solucao_{timestamp}.txt"
+    if compress:
+        output_file += ".gz"
     
     ga_steps = len(ga_results['path'])
     astar_steps = len(optimal_path)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open_report(output_file, compress) as f:
         write_header(f, maze_file, maze, ga_results)
-        write_ga_section_header(f)
-        write_ga_parameters(f, len(ga_results['chromosome']))
-        write_phases_section(f, ga_results.get('phase_logs', []))
-        write_ga_result(f, ga_results, ga_steps)
-        write_generation_evolution(f, ga_results.get('generation_details', []))
-        write_ga_path(f, ga_results['path'])
-        write_all_populations(f, ga_results.get('generation_details', []))
-        write_elitism_analysis(f, ga_results.get('generation_details', []))
-        write_astar_section(f, optimal_path)
-        write_visual_comparison(f, maze, ga_results['path'], optimal_path)
-        write_comparison(f, ga_steps, astar_steps)
+        if ga_results.get('engine') == 'frontier':
+            write_explorer_section(f, ga_results)
+        else:
+            write_ga_section_header(f)
+            write_ga_parameters(f, len(ga_results['chromosome']))
+            write_phases_section(f, ga_results.get('phase_logs', []))
+            write_ga_result(f, ga_results, ga_steps)
+            write_generation_evolution(f, ga_results.get('generation_details', []))
+            write_ga_path(f, ga_results['path'])
+            write_all_populations(f, ga_results.get('generation_details', []))
+            write_elitism_analysis(f, ga_results.get('generation_details', []))
+        if shortening is not None:
+            write_shortening_section(f, shortening)
+        if planner == 'astar' and maze.costs is not None:
+            planner = 'bucket'
+        write_astar_section(f, optimal_path, skipped=shortening is not None and shortening['within_tolerance'],
+                            planner=planner)
+        write_visual_comparison(f, maze, ga_results['path'], optimal_path, visual_output)
+        write_heatmap(f, maze, ga_results.get('heatmap'))
+        label, _, discovery_name = _discovery_labels(ga_results)
+        write_comparison(f, ga_steps, astar_steps, label, discovery_name)
         write_footer(f)
     
     return output_file
 
+
+def _companion_file(output_file, extension):
+    # Mesmo nome base do relatório de texto (.txt ou .txt.gz) com outra extensão; só a extensão
+    # final é trocada, então '.txt' no meio do nome (diretório ou labirinto) é preservado
+    base = output_file[:-3] if output_file.endswith('.gz') else output_file
+    return os.path.splitext(base)[0] + extension
+
+
+def generate_run_log(output_file, maze, ga_results):
+    from run_log import write_run_log
+    
+    log_file = _companion_file(output_file, '.rlog')
+    return write_run_log(log_file, maze, ga_results)
+
+
+def generate_image(output_file, maze, ga_results, optimal_path):
+    from image_export import export_maze_image
+    
+    image_file = _companion_file(output_file, '.png')
+    return export_maze_image(image_file, maze, ga_results['path'], optimal_path,
+                             heatmap=ga_results.get('heatmap'))
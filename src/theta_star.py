@@ -0,0 +1,111 @@
+import heapq
+import math
+from compact_path import CompactPath
+
+
+SQRT2 = math.sqrt(2)
+
+
+def heuristic_euclidean(pos1, pos2):
+    # Distância em linha reta (admissível para caminhos em qualquer ângulo)
+    return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
+
+
+def line_cells(pos1, pos2):
+    # Células atravessadas pela linha de Bresenham entre os centros de pos1 e pos2 (8-conexas)
+    linha, coluna = pos1
+    linha_final, coluna_final = pos2
+    delta_coluna = abs(coluna_final - coluna)
+    delta_linha = -abs(linha_final - linha)
+    passo_coluna = 1 if coluna_final > coluna else -1
+    passo_linha = 1 if linha_final > linha else -1
+    erro = delta_coluna + delta_linha
+    
+    cells = [(linha, coluna)]
+    while (linha, coluna) != (linha_final, coluna_final):
+        erro2 = 2 * erro
+        if erro2 >= delta_linha:
+            erro += delta_linha
+            coluna += passo_coluna
+        if erro2 <= delta_coluna:
+            erro += delta_coluna
+            linha += passo_linha
+        cells.append((linha, coluna))
+    return cells
+
+
+def line_of_sight(maze, pos1, pos2):
+    # Visibilidade direta: todas as células da linha de Bresenham são livres no plano de células
+    # (a linha entre duas células do labirinto nunca sai do retângulo, então não há checagem de limites)
+    cells = maze.cells
+    stride = maze.stride
+    for linha, coluna in line_cells(pos1, pos2):
+        if not cells[(linha + 1) * stride + coluna + 1]:
+            return False
+    return True
+
+
+def expand_waypoints(waypoints):
+    # Converte os pontos de virada do Theta* em um caminho célula a célula (CompactPath),
+    # para reaproveitar relatório, visualização e imagem do A*
+    positions = [waypoints[0]]
+    for pos1, pos2 in zip(waypoints, waypoints[1:]):
+        positions.extend(line_cells(pos1, pos2)[1:])
+    return CompactPath.from_positions(positions)
+
+
+def path_length(waypoints):
+    # Comprimento euclidiano de um caminho em qualquer ângulo
+    return sum(heuristic_euclidean(pos1, pos2) for pos1, pos2 in zip(waypoints, waypoints[1:]))
+
+
+def theta_star(maze, start_pos, goal_pos, stats=None):
+    # Theta*: A* em que o pai de um vizinho pode ser o pai do nó atual quando há
+    # visibilidade direta entre eles, gerando caminhos em qualquer ângulo.
+    # Retorna a lista de pontos de virada (ou None); stats recebe 'expansions'.
+    maze.require_free(start_pos, "Início")
+    maze.require_free(goal_pos, "Objetivo")
+    g = {start_pos: 0.0}
+    parent = {start_pos: start_pos}
+    open_heap = [(heuristic_euclidean(start_pos, goal_pos), 0.0, start_pos)]
+    closed_set = set()
+    
+    while open_heap:
+        _, current_g, current = heapq.heappop(open_heap)
+        if current in closed_set or current_g > g[current]:
+            continue
+        
+        if current == goal_pos:
+            if stats is not None:
+                stats['expansions'] = len(closed_set)
+            waypoints = [current]
+            while current != start_pos:
+                current = parent[current]
+                waypoints.append(current)
+            waypoints.reverse()
+            return waypoints
+        
+        closed_set.add(current)
+        current_parent = parent[current]
+        
+        for nova_linha, nova_coluna, move_cost in maze.neighbors(*current):
+            neighbor = (nova_linha, nova_coluna)
+            if neighbor in closed_set:
+                continue
+            
+            # Caminho 2: ligar o vizinho direto ao pai do nó atual, se houver visibilidade
+            if current_parent != current and line_of_sight(maze, current_parent, neighbor):
+                new_parent = current_parent
+                tentative_g = g[current_parent] + heuristic_euclidean(current_parent, neighbor)
+            else:
+                new_parent = current
+                tentative_g = current_g + (1.0 if move_cost == 1.0 else SQRT2)
+            
+            if tentative_g < g.get(neighbor, math.inf):
+                g[neighbor] = tentative_g
+                parent[neighbor] = new_parent
+                heapq.heappush(open_heap, (tentative_g + heuristic_euclidean(neighbor, goal_pos), tentative_g, neighbor))
+    
+    if stats is not None:
+        stats['expansions'] = len(closed_set)
+    return None
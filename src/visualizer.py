@@ -1,75 +1,165 @@
-def visualize_maze_with_path(maze, path, title="LABIRINTO"):
-
-    visual_grid = []
-    for linha in maze.grid:
-        visual_grid.append(list(linha))
-    
-    # Converter path em set para busca rápida
-    path_set = set(path) if path else set()
-    
-    # Marcar o caminho na grade
-    for i, pos in enumerate(path):
-        linha, coluna = pos
-        cell = maze.grid[linha][coluna]
-        
-        # Não sobrescrever E e S
-        if cell == 'E':
-            visual_grid[linha][coluna] = 'E'
-        elif cell == 'S':
-            visual_grid[linha][coluna] = 'S'
-        else:
-            # Marcar o caminho com '·' (ponto médio)
-            visual_grid[linha][coluna] = '·'
+import math
+
+
+PATH_MARK = '*'
+
+# Tabela de tradução célula -> 2 caracteres de saída (aplicada a linhas inteiras de uma vez)
+CELL_TRANSLATION = str.maketrans({
+    '1': "█ ",   # Parede
+    '0': "  ",   # Espaço livre
+    'E': "E ",   # Entrada
+    'S': "S ",   # Saída
+    PATH_MARK: "· ",  # Caminho
+})
+
+# Códigos do plano de células do Maze (parede, livre, E, S) -> símbolos da grade (Maze.CELL_SYMBOLS)
+CODE_SYMBOLS = bytes.maketrans(bytes(range(4)), b'10ES')
+
+
+def _grid_buffer(maze):
+    # Grade inteira como um buffer de bytes ASCII (linha * cols + coluna, sem a borda do plano do Maze),
+    # traduzida direto das linhas do plano de células: não decodifica maze.grid
+    return bytearray(_cell_rows(maze).translate(CODE_SYMBOLS))
+
+
+def _cell_rows(maze):
+    # Códigos das células linha a linha, sem a borda (fatias do plano, uma por linha)
+    cells, stride, cols = maze.cells, maze.stride, maze.cols
+    return b''.join(cells[start:start + cols] for start in range(stride + 1, (maze.rows + 1) * stride, stride))
+
+
+def _overlay_path(buffer, cols, path):
+    # Marca as células livres do caminho em uma única passada (E e S não são sobrescritos)
+    free = ord('0')
+    mark = ord(PATH_MARK)
+    for linha, coluna in path:
+        index = linha * cols + coluna
+        if buffer[index] == free:
+            buffer[index] = mark
+
+
+def _downsample_rows(rows, factor):
+    # Reduz a grade em blocos factor x factor, mantendo o símbolo mais relevante de cada bloco
+    result = []
+    for start in range(0, len(rows), factor):
+        block_rows = rows[start:start + factor]
+        width = len(block_rows[0])
+        out = []
+        for coluna in range(0, width, factor):
+            block = "".join(row[coluna:coluna + factor] for row in block_rows)
+            if 'E' in block:
+                out.append('E')
+            elif 'S' in block:
+                out.append('S')
+            elif PATH_MARK in block:
+                out.append(PATH_MARK)
+            elif '0' in block:
+                out.append('0')
+            else:
+                out.append('1')
+        result.append("".join(out))
+    return result
+
+
+def visualize_maze_with_path(maze, path, title="LABIRINTO", crop=None, max_cols=None):
+    # crop = (linha, coluna, altura, largura) recorta a região exibida;
+    # max_cols reduz a grade em blocos quando ela não cabe em max_cols colunas
+    n_rows, n_cols = maze.rows, maze.cols
+    buffer = _grid_buffer(maze)
+    if path:
+        _overlay_path(buffer, n_cols, path)
+    
+    text = buffer.decode('ascii')
+    row0, col0, height, width = crop if crop else (0, 0, n_rows, n_cols)
+    width = min(width, n_cols - col0)
+    rows = [text[linha * n_cols + col0:linha * n_cols + col0 + width] for linha in range(row0, min(row0 + height, n_rows))]
+    
+    factor = 1
+    if max_cols and rows and len(rows[0]) > max_cols:
+        factor = math.ceil(len(rows[0]) / max_cols)
+        rows = _downsample_rows(rows, factor)
+    
+    cols = len(rows[0]) if rows else 0
     
     # Construir string de visualização
     result = []
-    result.append("=" * (maze.n * 2 + 2))
+    result.append("=" * (cols * 2 + 2))
     result.append(f" {title}")
-    result.append("=" * (maze.n * 2 + 2))
+    if crop or factor > 1:
+        result.append(f" (linhas {row0}-{row0 + len(rows) * factor - 1}, colunas {col0}-{col0 + cols * factor - 1}"
+                      f"{f', 1 caractere = {factor}x{factor} células' if factor > 1 else ''})")
+    result.append("=" * (cols * 2 + 2))
     
-    # Cabeçalho com números de coluna
-    header = "  "
-    for col in range(maze.n):
-        header += f"{col % 10} "
+    # Cabeçalho com números de coluna (em visão reduzida, numera os blocos)
+    header = "  " + "".join(f"{(col0 + col if factor == 1 else col) % 10} " for col in range(cols))
     result.append(header)
-    result.append("  " + "-" * (maze.n * 2))
+    result.append("  " + "-" * (cols * 2))
     
     # Linhas do labirinto
-    for i, linha in enumerate(visual_grid):
-        row_str = f"{i % 10}|"
-        for cell in linha:
-            if cell == '1':
-                row_str += "█ "  # Parede
-            elif cell == '0':
-                row_str += "  "  # Espaço livre
-            elif cell == 'E':
-                row_str += "E "  # Entrada
-            elif cell == 'S':
-                row_str += "S "  # Saída
-            elif cell == '·':
-                row_str += "· "  # Caminho
-            else:
-                row_str += "? "
-        row_str += f"|{i % 10}"
-        result.append(row_str)
+    for i, row in enumerate(rows):
+        label = (row0 + i if factor == 1 else i) % 10
+        result.append(f"{label}|{row.translate(CELL_TRANSLATION)}|{label}")
     
     # Rodapé
-    result.append("  " + "-" * (maze.n * 2))
+    result.append("  " + "-" * (cols * 2))
     result.append(header)
-    result.append("=" * (maze.n * 2 + 2))
+    result.append("=" * (cols * 2 + 2))
+    
+    return "\n".join(result)
+
+
+HEAT_SHADES = " .:-=+*#%@"
+
+
+def visualize_heatmap(maze, heatmap, title="MAPA DE CALOR - VISITAS DO AG", max_cols=None):
+    # Visitas por célula em escala logarítmica (' ' nunca visitada ... '@' mais visitada)
+    # heatmap usa o índice do plano com borda do Maze; o buffer de texto não tem borda
+    n_rows, n_cols = maze.rows, maze.cols
+    buffer = _grid_buffer(maze)
+    peak = max(heatmap) if heatmap else 0
+    scale = (len(HEAT_SHADES) - 1) / math.log1p(peak) if peak > 0 else 0
+    
+    # Símbolos de calor usam o mesmo buffer: paredes, E e S ficam como estão
+    free = ord('0')
+    for linha in range(n_rows):
+        base = maze.index(linha, 0)
+        for coluna, count in enumerate(heatmap[base:base + n_cols]):
+            index = linha * n_cols + coluna
+            if buffer[index] == free:
+                buffer[index] = ord(HEAT_SHADES[int(math.log1p(count) * scale)]) if count else ord(' ')
+    
+    text = buffer.decode('ascii')
+    rows = [text[linha * n_cols:(linha + 1) * n_cols] for linha in range(n_rows)]
+    factor = 1
+    if max_cols and n_cols > max_cols:
+        factor = math.ceil(n_cols / max_cols)
+        rows = [row[::factor] for row in rows[::factor]]
+    
+    translation = str.maketrans({'1': "█ ", 'E': "E ", 'S': "S ", **{shade: shade + " " for shade in HEAT_SHADES}})
+    cols = len(rows[0]) if rows else 0
+    
+    result = []
+    result.append("=" * (cols * 2 + 2))
+    result.append(f" {title}")
+    result.append(f" (máximo de {peak} visitas; escala '{HEAT_SHADES}')"
+                  + (f", amostrado 1 a cada {factor}" if factor > 1 else ""))
+    result.append("=" * (cols * 2 + 2))
+    for i, row in enumerate(rows):
+        result.append(f"{i % 10}|{row.translate(translation)}|{i % 10}")
+    result.append("=" * (cols * 2 + 2))
     
     return "\n".join(result)
 
 
-def visualize_comparison(maze, ga_path, astar_path):
+def visualize_comparison(maze, ga_path, astar_path, max_cols=None, ga_title="CAMINHO DO ALGORITMO GENÉTICO", ga_label="GA"):
 
     result = []
     
     # Visualização do caminho GA
-    ga_visual = visualize_maze_with_path(maze, ga_path, "CAMINHO DO ALGORITMO GENÉTICO")
+    ga_visual = visualize_maze_with_path(maze, ga_path, ga_title, max_cols=max_cols)
     
     # Visualização do caminho A*
-    astar_visual = visualize_maze_with_path(maze, astar_path, "CAMINHO ÓTIMO (A*)")
+    astar_visual = visualize_maze_with_path(maze, astar_path, "CAMINHO ÓTIMO (A*)", max_cols=max_cols)
     
     result.append("\n" + "=" * 80)
     result.append("VISUALIZAÇÃO DOS CAMINHOS ENCONTRADOS")
@@ -86,9 +176,12 @@ def visualize_comparison(maze, ga_path, astar_path):
     # Adicionar visualização do GA
     result.append(ga_visual)
     result.append("")
-    result.append(f"Estatísticas do GA:")
+    result.append(f"Estatísticas do {ga_label}:")
     result.append(f"  - Passos: {len(ga_path)}")
-    result.append(f"  - Células únicas visitadas: {len(set(ga_path))}")
+    # Decodificar cada caminho compacto uma única vez
+    ga_set = set(ga_path)
+    astar_set = set(astar_path)
+    result.append(f"  - Células únicas visitadas: {len(ga_set)}")
     
     result.append("\n")
     
@@ -97,7 +190,7 @@ def visualize_comparison(maze, ga_path, astar_path):
     result.append("")
     result.append(f"Estatísticas do A*:")
     result.append(f"  - Passos: {len(astar_path)}")
-    result.append(f"  - Células únicas visitadas: {len(set(astar_path))}")
+    result.append(f"  - Células únicas visitadas: {len(astar_set)}")
     
     # Comparação
     result.append("\n" + "=" * 80)
@@ -111,14 +204,12 @@ def visualize_comparison(maze, ga_path, astar_path):
     result.append(f"Eficiência do A*: {improvement:.2f}% mais eficiente")
     
     # Células em comum e diferentes
-    ga_set = set(ga_path)
-    astar_set = set(astar_path)
     common = ga_set & astar_set
     ga_only = ga_set - astar_set
     astar_only = astar_set - ga_set
     
     result.append(f"\nCélulas em comum: {len(common)}")
-    result.append(f"Células apenas no GA: {len(ga_only)}")
+    result.append(f"Células apenas no {ga_label}: {len(ga_only)}")
     result.append(f"Células apenas no A*: {len(astar_only)}")
     
     result.append("=" * 80)
@@ -127,6 +218,12 @@ def visualize_comparison(maze, ga_path, astar_path):
     return "\n".join(result)
 
 
-def create_visual_output(maze, ga_path, astar_path):
+def create_visual_output(maze, ga_path, astar_path, max_cols=None, ga_title="CAMINHO DO ALGORITMO GENÉTICO", ga_label="GA"):
    
-    return visualize_comparison(maze, ga_path, astar_path)
+    return visualize_comparison(maze, ga_path, astar_path, max_cols, ga_title, ga_label)
+
+
+def terminal_max_cols():
+    # Quantas células cabem na largura do terminal (2 caracteres por célula + rótulos)
+    import shutil
+    return max(10, (shutil.get_terminal_size().columns - 6) // 2)